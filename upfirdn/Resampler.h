@@ -39,39 +39,143 @@ using namespace std;
 #include <complex>
 #include <vector>
 
-template<class S1, class S2, class C>
+#define RESAMPLER_MAXDIM 32
+
+template<class T>
+struct ArrayView{
+/*
+  A view of an N-dimensional array with arbitrary strides (such as a numpy
+  array), counted in elements.  The last dimension holds the samples;
+  the leading dimensions index the channels, in C order.
+*/
+    T          *data;
+    int        ndim;
+    ptrdiff_t  shape[RESAMPLER_MAXDIM];
+    ptrdiff_t  strides[RESAMPLER_MAXDIM];
+
+    ArrayView() : data(0), ndim(0) {}
+    ArrayView(T *data_, ptrdiff_t channels, ptrdiff_t count)
+    /* a contiguous, row-major (channels x count) array */
+      : data(data_), ndim(2) {
+        shape[0] = channels;
+        shape[1] = count;
+        strides[0] = count;
+        strides[1] = 1;
+    }
+
+    ptrdiff_t  channels() const {
+        ptrdiff_t n = 1;
+        for (int k=0; k<ndim-1; ++k) {
+            n *= shape[k];
+        }
+        return n;
+    }
+    ptrdiff_t  count() const { return shape[ndim-1]; }
+    ptrdiff_t  stride() const { return strides[ndim-1]; }
+
+    T         *channel(ptrdiff_t c) const {
+        /* first sample of channel c */
+        T *p = data;
+        for (int k=ndim-2; k>=0; --k) {
+            p += (c % shape[k]) * strides[k];
+            c /= shape[k];
+        }
+        return p;
+    }
+};
+
+template<class T> struct RealType { typedef T type; };
+template<class T> struct RealType<complex<T> > { typedef T type; };
+
+template<class C>
+class PolyphaseFilter{
+/*
+  The coefficients of an FIR filter, split into upRate phases and stored
+  in the transposed, flipped arrangement that Resampler::apply reads.
+  A PolyphaseFilter is not modified once constructed, so one can be shared
+  by any number of Resamplers, e.g. all the channels of a ResamplerBank
+  that use the same filter.
+*/
+public:
+    PolyphaseFilter(int upRate, const C *coefs, int coefCount);
+    PolyphaseFilter(int upRate, const C *coefs, int coefCount, 
+                    bool transposed);
+    ~PolyphaseFilter();
+
+    int        upRate() const { return _upRate; }
+    int        coefsPerPhase() const { return _coefsPerPhase; }
+    const C   *phase(int t) const { 
+        /* the flipped coefficients of phase t */
+        return _transposedCoefs + t*_coefsPerPhase; 
+    }
+
+private:
+    PolyphaseFilter(const PolyphaseFilter &);
+    PolyphaseFilter &operator=(const PolyphaseFilter &);
+
+    void       init(const C *coefs, int coefCount, bool transposed);
+
+    int        _upRate;
+    C          *_transposedCoefs;
+    int        _paddedCoefCount;  // ceil(len(coefs)/upRate)*upRate
+    int        _coefsPerPhase;    // _paddedCoefCount / upRate
+};
+
+template<class S1, class S2, class C, class A = S2>
 class Resampler{
+/*
+  S1, S2 and C are the types of the input samples, output samples and
+  coefficients.  The products are summed in type A, which is S2 unless
+  the output is an integer type (see storeOutput below).
+*/
 public:
     typedef    S1 inputType;
     typedef    S2 outputType;
     typedef    C coefType;
+    typedef    A accumulatorType;
 
     Resampler(int upRate, int downRate, C *coefs, int coefCount);
+#ifndef SWIG
+    Resampler(int downRate, const PolyphaseFilter<C> *filter, S1 *state);
+#endif
     virtual ~Resampler();
 
-    int        apply(S1* in, int inCount, S2* out, int outCount);
-    int        neededOutCount(int inCount);
+    ptrdiff_t  apply(S1* in, ptrdiff_t inCount, S2* out, ptrdiff_t outCount);
+#ifndef SWIG
+    ptrdiff_t  apply(const S1* in, ptrdiff_t inCount, ptrdiff_t inStride,
+                     S2* out, ptrdiff_t outCount, ptrdiff_t outStride);
+#endif
+    ptrdiff_t  flush(S2* out, ptrdiff_t outCount);
+#ifndef SWIG
+    ptrdiff_t  flush(S2* out, ptrdiff_t outCount, ptrdiff_t outStride);
+#endif
+    ptrdiff_t  neededOutCount(ptrdiff_t inCount);
     int        coefsPerPhase() { return _coefsPerPhase; }
+    void       setPhase(int t, ptrdiff_t xOffset);
     
 private:
+    void       initState(S1 *state);
+
     int        _upRate;
     int        _downRate;
 
-    coefType   *_transposedCoefs;
+    const PolyphaseFilter<C> *_filter;
+    bool       _ownsFilter;       // false if _filter is shared
     inputType  *_state;
     inputType  *_stateEnd;
+    bool       _ownsState;        // false if _state is part of a bank's
     
-    int        _paddedCoefCount;  // ceil(len(coefs)/upRate)*upRate
-    int        _coefsPerPhase;    // _paddedCoefCount / upRate
+    int        _coefsPerPhase;    // _filter->coefsPerPhase()
     
     int        _t;                // "time" (modulo upRate)
-    int        _xOffset;
+    ptrdiff_t  _xOffset;
     
 };
 
 
 #include <iostream>
 #include <cmath>
+#include <limits>
 
 /*
 using std::cout;
@@ -83,10 +187,168 @@ using std::copy;
 
 using std::invalid_argument;
 
-template<class S1, class S2, class C>
-Resampler<S1, S2, C>::Resampler(int upRate, int downRate, C *coefs,
-                                int coefCount):
-  _upRate(upRate), _downRate(downRate), _t(0), _xOffset(0)
+/*
+  Where the compiler supports function multiversioning (GCC 6 and later on
+  x86-64 linux), the inner product below is built for AVX-512, AVX2 and the
+  baseline SSE2 instruction sets, and the best one for the CPU is chosen
+  at load time.  Elsewhere the portable build is used.
+*/
+#if defined(__GNUC__) && !defined(__clang__) && (__GNUC__ >= 6) && \
+    defined(__x86_64__) && defined(__linux__)
+#define RESAMPLER_TARGET_CLONES \
+    __attribute__((target_clones("arch=skylake-avx512", "arch=haswell", \
+                                 "default")))
+#else
+#define RESAMPLER_TARGET_CLONES
+#endif
+
+// number of independent partial sums kept by dotProduct
+#define RESAMPLER_LANES 16
+
+template<class S, class C>
+inline C multiply(const S &x, const C &h) { return x * h; }
+
+template<class T, class C>
+inline complex<T> multiply(const complex<T> &x, const C &h) { return x * h; }
+
+template<class S, class T>
+inline complex<T> multiply(const S &x, const complex<T> &h)
+{
+    return complex<T>(x * h.real(), x * h.imag());
+}
+
+template<class T>
+inline complex<T> multiply(const complex<T> &x, const complex<T> &h)
+/* no inf/nan recovery (as in C99 Annex G), so that the loop vectorizes */
+{
+    return complex<T>(x.real() * h.real() - x.imag() * h.imag(),
+                      x.real() * h.imag() + x.imag() * h.real());
+}
+
+template<class S, class C, class A>
+RESAMPLER_TARGET_CLONES
+A dotProduct(const S *x, const C *h, int n)
+/*
+  Inner product of n input samples with n coefficients.  The products are
+  summed into RESAMPLER_LANES independent partial sums, which the compiler
+  turns into SIMD registers; so the result may differ from a sequential 
+  sum by rounding only.
+*/
+{
+    A acc[RESAMPLER_LANES];
+    for (int k=0; k<RESAMPLER_LANES; ++k) {
+        acc[k] = 0.;
+    }
+    int i = 0;
+    for (; i + RESAMPLER_LANES <= n; i += RESAMPLER_LANES) {
+        for (int k=0; k<RESAMPLER_LANES; ++k) {
+            acc[k] += multiply(x[i+k], h[i+k]);
+        }
+    }
+    for (; i < n; ++i) {
+        acc[0] += multiply(x[i], h[i]);
+    }
+    for (int k=1; k<RESAMPLER_LANES; ++k) {
+        acc[0] += acc[k];
+    }
+    return acc[0];
+}
+
+template<class S, class C, class A>
+inline A dotProduct(const S *x, ptrdiff_t stride, const C *h, int n)
+/* as above, for input samples "stride" elements apart */
+{
+    if (stride == 1)
+        return dotProduct<S, C, A>(x, h, n);
+    A acc = 0.;
+    for (int i=0; i<n; ++i) {
+        acc += multiply(x[i*stride], h[i]);
+    }
+    return acc;
+}
+
+template<class S, class A>
+inline void storeOutput(S &out, const A &acc) { out = acc; }
+
+template<class T, class A>
+inline T saturate(const A &acc)
+/* round to the nearest integer, clipped to the range of integer type T */
+{
+    if (acc <= (A) numeric_limits<T>::min())
+        return numeric_limits<T>::min();
+    if (acc >= (A) numeric_limits<T>::max())
+        return numeric_limits<T>::max();
+    return (T) floor(acc + (A) 0.5);
+}
+
+template<class A>
+inline void storeOutput(short &out, const A &acc) 
+{ 
+    out = saturate<short>(acc); 
+}
+
+template<class A>
+inline void storeOutput(int &out, const A &acc) 
+{ 
+    out = saturate<int>(acc); 
+}
+
+template<class T>
+inline void stridedCopy(const T *in, ptrdiff_t count, ptrdiff_t stride, 
+                        T *out)
+{
+    for (ptrdiff_t i=0; i<count; ++i) {
+        out[i] = in[i*stride];
+    }
+}
+
+template<class T>
+void retainInputs(const T *in, ptrdiff_t inCount, ptrdiff_t inStride,
+                  T *state, T *stateEnd)
+/* keep the last stateEnd - state input samples in the state buffer */
+{
+    // find number of samples retained in buffer:
+    ptrdiff_t retain = (stateEnd - state) - inCount;
+    if (retain > 0) {
+        // for inCount smaller than state buffer, copy end of buffer
+        // to beginning:
+        copy(stateEnd - retain, stateEnd, state);
+        // Then, copy the entire (short) input to end of buffer
+        stridedCopy(in, inCount, inStride, stateEnd - inCount);
+    } else {
+        // just copy last input samples into state buffer
+        stridedCopy(in + (inCount - (stateEnd - state))*inStride,
+                    stateEnd - state, inStride, state);
+    }
+}
+
+template<class S, class C, class A>
+inline A historyDotProduct(const S *stateEnd, const S *in, ptrdiff_t inStride,
+                           ptrdiff_t xFirst, const C *h, int n)
+/*
+  Inner product of n coefficients with the input samples from index xFirst
+  on, where the samples at negative indices are the last ones before "in",
+  held in a state buffer ending at stateEnd.
+*/
+{
+    A acc = 0.;
+    if (xFirst < 0) {
+        int m = (int) min((ptrdiff_t) n, -xFirst);
+        acc = dotProduct<S, C, A>(stateEnd + xFirst, h, m);
+        h += m;
+        n -= m;
+        xFirst = 0;
+    }
+    if (n > 0) {
+        acc += dotProduct<S, C, A>(in + xFirst*inStride, inStride, h, n);
+    }
+    return acc;
+}
+
+template<class C>
+PolyphaseFilter<C>::PolyphaseFilter(int upRate, const C *coefs, 
+                                    int coefCount):
+  _upRate(upRate)
 /*
   The coefficients are copied into local storage in a transposed, flipped
   arrangement.  For example, suppose upRate is 3, and the input number
@@ -97,77 +359,168 @@ Resampler<S1, S2, C>::Resampler(int upRate, int downRate, C *coefs,
            0, h[8], h[5], h[2],   // flipped phase 2 coefs (zero-padded)
 */
 {
+    init(coefs, coefCount, false);
+}
+
+template<class C>
+PolyphaseFilter<C>::PolyphaseFilter(int upRate, const C *coefs, 
+                                    int coefCount, bool transposed):
+  _upRate(upRate)
+/*
+  As above; if transposed is true, the coefficients are already in the
+  transposed, flipped arrangement (e.g. kept from another PolyphaseFilter 
+  with the same upRate), and coefCount is a multiple of upRate, so they
+  are copied as they are.
+*/
+{
+    init(coefs, coefCount, transposed);
+}
+
+template<class C>
+void PolyphaseFilter<C>::init(const C *coefs, int coefCount, 
+                              bool transposed)
+{
+    if (transposed && coefCount % _upRate)
+        throw invalid_argument("Transposed coefficients must be a multiple "
+                               "of upRate");
     _paddedCoefCount = coefCount;
     while (_paddedCoefCount % _upRate) {
         _paddedCoefCount++;
     }
     _coefsPerPhase = _paddedCoefCount / _upRate;
     
-    _transposedCoefs = new coefType[_paddedCoefCount];
+    _transposedCoefs = new C[_paddedCoefCount];
+    if (transposed) {
+        copy(coefs, coefs + coefCount, _transposedCoefs);
+        return;
+    }
     fill(_transposedCoefs, _transposedCoefs + _paddedCoefCount, 0.);
 
-    _state = new inputType[_coefsPerPhase - 1];
-    _stateEnd = _state + _coefsPerPhase - 1;
-    fill(_state, _stateEnd, 0.);
-
-
-    /* This both transposes, and "flips" each phase, while
-     * copying the defined coefficients into local storage.
-     * There is probably a faster way to do this
+    /* This both transposes, and "flips" each phase, while copying the
+     * coefficients into local storage, in a single pass over them:
+     * coefficient k is number k / upRate of phase k % upRate.
      */
-    for (int i=0; i<_upRate; ++i) {
-        for (int j=0; j<_coefsPerPhase; ++j) {
-            if (j*_upRate + i  < coefCount)
-                _transposedCoefs[(_coefsPerPhase-1-j) + i*_coefsPerPhase] =
-                                                coefs[j*_upRate + i];
+    C *phaseEnd = _transposedCoefs + _coefsPerPhase - 1;
+    for (int k=0, i=0, j=0; k<coefCount; ++k) {
+        phaseEnd[i*_coefsPerPhase - j] = coefs[k];
+        if (++i == _upRate) {
+            i = 0;
+            ++j;
         }
     }
 }
 
-template<class S1, class S2, class C>
-Resampler<S1, S2, C>::~Resampler() {
+template<class C>
+PolyphaseFilter<C>::~PolyphaseFilter() {
     delete [] _transposedCoefs;
-    delete [] _state;
 }
 
-template<class S1, class S2, class C>
-int Resampler<S1, S2, C>::neededOutCount(int inCount)
+template<class S1, class S2, class C, class A>
+Resampler<S1, S2, C, A>::Resampler(int upRate, int downRate, C *coefs,
+                                   int coefCount):
+  _upRate(upRate), _downRate(downRate), 
+  _filter(new PolyphaseFilter<C>(upRate, coefs, coefCount)), 
+  _ownsFilter(true), _t(0), _xOffset(0)
+{
+    initState(0);
+}
+
+template<class S1, class S2, class C, class A>
+Resampler<S1, S2, C, A>::Resampler(int downRate, 
+                                   const PolyphaseFilter<C> *filter,
+                                   S1 *state):
+  _upRate(filter->upRate()), _downRate(downRate), _filter(filter), 
+  _ownsFilter(false), _t(0), _xOffset(0)
+/*
+  A Resampler using a filter, and a state buffer of coefsPerPhase - 1
+  samples, owned by the caller, which must outlive it.
+*/
+{
+    initState(state);
+}
+
+template<class S1, class S2, class C, class A>
+void Resampler<S1, S2, C, A>::initState(S1 *state) {
+    _coefsPerPhase = _filter->coefsPerPhase();
+    _ownsState = !state;
+    _state = _ownsState ? new inputType[_coefsPerPhase - 1] : state;
+    _stateEnd = _state + _coefsPerPhase - 1;
+    fill(_state, _stateEnd, 0.);
+}
+
+template<class S1, class S2, class C, class A>
+Resampler<S1, S2, C, A>::~Resampler() {
+    if (_ownsFilter)
+        delete _filter;
+    if (_ownsState)
+        delete [] _state;
+}
+
+template<class S1, class S2, class C, class A>
+void Resampler<S1, S2, C, A>::setPhase(int t, ptrdiff_t xOffset)
+/*
+  Set the "time" of the next output: it is computed with phase t of the
+  filter, from the inputs up to index xOffset of the next call to apply.
+  So output k of a signal is output 0 of its inputs from any index s, 
+  with t = k*downRate % upRate and xOffset = k*downRate / upRate - s, and
+  the inputs before s in the state buffer.
+*/
+{
+    if (t < 0 || t >= _upRate || xOffset < 0)
+        throw invalid_argument("Phase out of range");
+    _t = t;
+    _xOffset = xOffset;
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t Resampler<S1, S2, C, A>::neededOutCount(ptrdiff_t inCount)
 /* compute how many outputs will be generated for inCount inputs  */
 {
-    unsigned long np = inCount * (unsigned long) _upRate;
-    int need = np / _downRate;
-    if ((_t + _upRate * _xOffset) < (np % _downRate))
-        need++;
-    return need;
+    // output k is at upsampled time _t + k*_downRate after input
+    // _xOffset, and is computed if that is before input inCount
+    ptrdiff_t np = (inCount - _xOffset) * (ptrdiff_t) _upRate - _t;
+    if (np <= 0)
+        return 0;
+    return (np + _downRate - 1) / _downRate;
 }
 
-template<class S1, class S2, class C>
-int Resampler<S1, S2, C>::apply(S1* in, int inCount, 
-                                S2* out, int outCount) {
+template<class S1, class S2, class C, class A>
+ptrdiff_t Resampler<S1, S2, C, A>::apply(S1* in, ptrdiff_t inCount, 
+                                         S2* out, ptrdiff_t outCount) {
+    return apply(in, inCount, 1, out, outCount, 1);
+}
+
+#ifndef SWIG
+template<class S1, class S2, class C, class A>
+ptrdiff_t Resampler<S1, S2, C, A>::apply(const S1* in, ptrdiff_t inCount, 
+                                         ptrdiff_t inStride, S2* out, 
+                                         ptrdiff_t outCount, 
+                                         ptrdiff_t outStride)
+/*
+  As above, for input and output samples that are inStride and outStride
+  elements apart (e.g. a column of a row-major matrix), so that
+  non-contiguous layouts are filtered in place.
+*/
+{
     if (outCount < neededOutCount(inCount)) 
         throw invalid_argument("Not enough output samples");
 
-    // x points to the latest processed input sample
-    inputType *x = in + _xOffset;
-    outputType *y = out;
-    inputType *end = in + inCount;
-    while (x < end) {
-        outputType acc = 0.;
-        coefType *h = _transposedCoefs + _t*_coefsPerPhase;
-        inputType *xPtr = x - _coefsPerPhase + 1;
-        int offset = in - xPtr;
-        if (offset > 0) {
+    // x is the index of the latest processed input sample
+    ptrdiff_t x = _xOffset;
+    ptrdiff_t y = 0;
+    while (x < inCount) {
+        accumulatorType acc = 0.;
+        const coefType *h = _filter->phase(_t);
+        ptrdiff_t xFirst = x - _coefsPerPhase + 1;
+        if (xFirst < 0) {
             // need to draw from the _state buffer
-            inputType *statePtr = _stateEnd - offset;
-            while (statePtr < _stateEnd) {
-                acc += *statePtr++ * *h++;
-            }
-            xPtr += offset;
-        }
-        while (xPtr <= x) {
-            acc += *xPtr++ * *h++;
+            acc = dotProduct<S1, C, A>(_stateEnd + xFirst, h, -xFirst);
+            h -= xFirst;
+            xFirst = 0;
         }
-        *y++ = acc;
+        acc += dotProduct<S1, C, A>(in + xFirst*inStride, inStride, h, 
+                                    x - xFirst + 1);
+        storeOutput(out[y++ * outStride], acc);
         _t += _downRate;
 
         int advanceAmount = _t / _upRate;
@@ -176,66 +529,1384 @@ int Resampler<S1, S2, C>::apply(S1* in, int inCount,
         // which phase of the filter to use
         _t %= _upRate;
     }
-    _xOffset = x - end;
+    _xOffset = x - inCount;
 
-    // manage _state buffer
-    // find number of samples retained in buffer:
-    int retain = (_coefsPerPhase - 1) - inCount;
-    if (retain > 0) {
-        // for inCount smaller than state buffer, copy end of buffer
-        // to beginning:
-        copy(_stateEnd - retain, _stateEnd, _state);
-        // Then, copy the entire (short) input to end of buffer
-        copy(in, end, _stateEnd - inCount);
-    } else {
-        // just copy last input samples into state buffer
-        copy(end - (_coefsPerPhase - 1), end, _state);
-    }
+    retainInputs(in, inCount, inStride, _state, _stateEnd);
     // number of samples computed
-    return y - out;
+    return y;
 }
+#endif
 
-template<class S1, class S2, class C>
-void upfirdn(int upRate, int downRate, 
-             S1 *input, int inLength, C *filter, int filterLength, 
-             vector<S2> &results)
+template<class S1, class S2, class C, class A>
+ptrdiff_t Resampler<S1, S2, C, A>::flush(S2* out, ptrdiff_t outCount) {
+    return flush(out, outCount, 1);
+}
+
+#ifndef SWIG
+template<class S1, class S2, class C, class A>
+ptrdiff_t Resampler<S1, S2, C, A>::flush(S2* out, ptrdiff_t outCount,
+                                         ptrdiff_t outStride)
 /*
-This template function provides a one-shot resampling.  Extra samples
-are padded to the end of the input in order to capture all of the non-zero 
-output samples.
-The output is in the "results" vector which is modified by the function.
+  End the stream: compute the outputs that coefsPerPhase - 1 zero input 
+  samples would give, i.e. neededOutCount(coefsPerPhase() - 1) of them, 
+  which are the rest of the response to the inputs so far.  They are
+  computed from the _state buffer alone, skipping the products with the
+  zeros, so nothing need be allocated or copied.  Further calls to apply
+  continue as if the zeros were part of the input.
+*/
+{
+    ptrdiff_t inCount = _coefsPerPhase - 1;
+    if (outCount < neededOutCount(inCount)) 
+        throw invalid_argument("Not enough output samples");
 
-Note, I considered returning a vector instead of taking one on input, but
-then the C++ compiler has trouble with implicit template instantiation
-(e.g. have to say upfirdn<float, float, float> every time - this
-way we can let the compiler infer the template types).
+    ptrdiff_t x = _xOffset;
+    ptrdiff_t y = 0;
+    while (x < inCount) {
+        // only the inputs before the zeros, in the state buffer, count
+        ptrdiff_t xFirst = x - _coefsPerPhase + 1;
+        accumulatorType acc = dotProduct<S1, C, A>(_stateEnd + xFirst, 
+                                                   _filter->phase(_t), 
+                                                   -xFirst);
+        storeOutput(out[y++ * outStride], acc);
+        _t += _downRate;
+        x += _t / _upRate;
+        _t %= _upRate;
+    }
+    _xOffset = x - inCount;
+    // the last coefsPerPhase - 1 inputs are now the zeros
+    fill(_state, _stateEnd, 0.);
+    return y;
+}
+#endif
 
-Thanks to Lewis Anderson (lkanders@ucsd.edu) at UCSD for
-the original version of this function.
+template<class S1, class S2, class C, class A = S2>
+class ResamplerBank{
+public:
+    typedef    Resampler<S1, S2, C, A> resamplerType;
+
+    ResamplerBank(int upRate, int downRate, C *coefs, int bankSize,
+                  int coefCount);
+    ResamplerBank(int upRate, int downRate, C *coefs, int filterCount,
+                  int coefCount, int *filterIndex, int bankSize);
+    ResamplerBank(int upRate, int downRate, C *coefs, int filterCount,
+                  int coefCount, int *filterIndex, int bankSize, 
+                  bool transposed);
+    virtual ~ResamplerBank();
+
+    ptrdiff_t  apply(ArrayView<const S1> in, ArrayView<S2> out,
+                     ptrdiff_t firstChannel);
+    ptrdiff_t  flush(ArrayView<S2> out, ptrdiff_t firstChannel);
+    ptrdiff_t  neededOutCount(ptrdiff_t inCount);
+    void       setPhase(int t, ptrdiff_t xOffset);
+    int        coefsPerPhase() { return _resamplers[0]->coefsPerPhase(); }
+    int        bankSize() { return _resamplers.size(); }
+    int        filterCount() { return _filters.size(); }
+
+private:
+    void       init(int upRate, int downRate, C *coefs, int filterCount,
+                    int coefCount, const int *filterIndex, int bankSize,
+                    bool transposed);
+
+    vector<PolyphaseFilter<C> *> _filters;
+    vector<resamplerType *> _resamplers;
+    S1         *_state;           // the channels' state buffers, end to end
+
+};
+
+template<class S1, class S2, class C, class A>
+ResamplerBank<S1, S2, C, A>::ResamplerBank(int upRate, int downRate, 
+                                           C *coefs, int bankSize, 
+                                           int coefCount)
+/*
+  A bank of independent Resamplers sharing the same up and down rates,
+  so that a whole block of channels can be filtered in one call.
+  The coefficients are a row-major (bankSize x coefCount) array, one row
+  of coefficients per channel.
 */
 {
-    // Create the Resampler
-    Resampler<S1, S2, C> theResampler(upRate, downRate, filter, filterLength);
+    init(upRate, downRate, coefs, bankSize, coefCount, 0, bankSize, false);
+}
 
-    // pad input by length of one polyphase of filter to flush all values out
-    int padding = theResampler.coefsPerPhase() - 1;
-    S1 *inputPadded = new S1[inLength + padding];
-    for (int i = 0; i < inLength + padding; i++) {
-        if (i < inLength)
-            inputPadded[i] = input[i];
-        else
-            inputPadded[i] = 0;
+template<class S1, class S2, class C, class A>
+ResamplerBank<S1, S2, C, A>::ResamplerBank(int upRate, int downRate, 
+                                           C *coefs, int filterCount, 
+                                           int coefCount, int *filterIndex,
+                                           int bankSize)
+/*
+  As above, for channels that share filters: the coefficients are a 
+  row-major (filterCount x coefCount) array of distinct filters, and 
+  channel i uses row filterIndex[i].  Each filter is stored once, however
+  many channels use it; a channel only holds its own input state.
+*/
+{
+    init(upRate, downRate, coefs, filterCount, coefCount, filterIndex, 
+         bankSize, false);
+}
+
+template<class S1, class S2, class C, class A>
+ResamplerBank<S1, S2, C, A>::ResamplerBank(int upRate, int downRate, 
+                                           C *coefs, int filterCount, 
+                                           int coefCount, int *filterIndex,
+                                           int bankSize, bool transposed)
+/*
+  As above; if transposed is true, each row of coefficients is already in
+  the transposed, flipped arrangement of PolyphaseFilter, as kept with a
+  cached filter design, so it is copied rather than transposed.
+*/
+{
+    init(upRate, downRate, coefs, filterCount, coefCount, filterIndex, 
+         bankSize, transposed);
+}
+
+template<class S1, class S2, class C, class A>
+void ResamplerBank<S1, S2, C, A>::init(int upRate, int downRate, C *coefs,
+                                       int filterCount, int coefCount, 
+                                       const int *filterIndex, int bankSize,
+                                       bool transposed)
+/* channel i uses filter i if filterIndex is null */
+{
+    if (bankSize < 1 || filterCount < 1)
+        throw invalid_argument("Bank must have at least one channel");
+    for (int i=0; filterIndex && i<bankSize; ++i) {
+        if (filterIndex[i] < 0 || filterIndex[i] >= filterCount)
+            throw invalid_argument("Filter index out of range");
+    }
+    _filters.reserve(filterCount);
+    for (int k=0; k<filterCount; ++k) {
+        const C *filterCoefs = coefs + (ptrdiff_t) k*coefCount;
+        _filters.push_back(new PolyphaseFilter<C>(upRate, filterCoefs,
+                                                  coefCount, transposed));
+    }
+    // all the filters have coefCount coefficients, so all the channels'
+    // state buffers have the same size
+    ptrdiff_t stateSize = _filters[0]->coefsPerPhase() - 1;
+    _state = new S1[bankSize * stateSize];
+    _resamplers.reserve(bankSize);
+    for (int i=0; i<bankSize; ++i) {
+        int k = filterIndex ? filterIndex[i] : i;
+        _resamplers.push_back(new resamplerType(downRate, _filters[k],
+                                                _state + i*stateSize));
+    }
+}
+
+template<class S1, class S2, class C, class A>
+ResamplerBank<S1, S2, C, A>::~ResamplerBank() {
+    for (int i=0; i<bankSize(); ++i) {
+        delete _resamplers[i];
+    }
+    for (int k=0; k<filterCount(); ++k) {
+        delete _filters[k];
+    }
+    delete [] _state;
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t ResamplerBank<S1, S2, C, A>::neededOutCount(ptrdiff_t inCount)
+/* every channel sees the same number of inputs, so they all agree */
+{
+    return _resamplers[0]->neededOutCount(inCount);
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t ResamplerBank<S1, S2, C, A>::apply(ArrayView<const S1> in, 
+                                             ArrayView<S2> out, 
+                                             ptrdiff_t firstChannel)
+/*
+  Filter channels firstChannel, ..., firstChannel + bankSize() - 1 of the
+  input array into the same channels of the output array, one channel per
+  Resampler of the bank.  The arrays may have any strides, so several
+  banks can share one pair of arrays, and a broadcast input (with zero
+  strides) is never copied.
+  Returns the number of output samples computed for each channel.
+*/
+{
+    if (firstChannel < 0 || in.channels() != out.channels() ||
+        in.channels() < firstChannel + bankSize())
+        throw invalid_argument("Number of channels does not match bank size");
+    ptrdiff_t inCount = in.count();
+    ptrdiff_t outCount = out.count();
+    if (outCount < neededOutCount(inCount)) 
+        throw invalid_argument("Not enough output samples");
+
+    ptrdiff_t count = 0;
+    for (int i=0; i<bankSize(); ++i) {
+        count = _resamplers[i]->apply(in.channel(firstChannel + i), inCount,
+                                      in.stride(), 
+                                      out.channel(firstChannel + i), 
+                                      outCount, out.stride());
     }
+    return count;
+}
+
+template<class S1, class S2, class C, class A = S2>
+class ArbitraryResampler{
+/*
+  Resampling by an arbitrary real ratio of output to input rate, which
+  may be changed between calls to apply without losing the state (e.g. to
+  track a drifting clock).  The filter is a lowpass prototype designed at
+  upRate times the input rate, and split into upRate phases as for
+  Resampler; each output is interpolated linearly between the outputs of
+  the two phases either side of its time.
+*/
+public:
+    typedef    S1 inputType;
+    typedef    S2 outputType;
+    typedef    C coefType;
+    typedef    A accumulatorType;
+
+    ArbitraryResampler(int upRate, double ratio, C *coefs, int coefCount);
+#ifndef SWIG
+    ArbitraryResampler(double ratio, const PolyphaseFilter<C> *filter, 
+                       S1 *state);
+#endif
+    virtual ~ArbitraryResampler();
+
+    ptrdiff_t  apply(S1* in, ptrdiff_t inCount, S2* out, ptrdiff_t outCount);
+#ifndef SWIG
+    ptrdiff_t  apply(const S1* in, ptrdiff_t inCount, ptrdiff_t inStride,
+                     S2* out, ptrdiff_t outCount, ptrdiff_t outStride);
+#endif
+    ptrdiff_t  flush(S2* out, ptrdiff_t outCount);
+#ifndef SWIG
+    ptrdiff_t  flush(S2* out, ptrdiff_t outCount, ptrdiff_t outStride);
+#endif
+    ptrdiff_t  neededOutCount(ptrdiff_t inCount);
+    ptrdiff_t  neededOutCount(ptrdiff_t inCount, bool flush);
+    int        coefsPerPhase() { return _coefsPerPhase; }
+    double     ratio() { return 1. / _step; }
+    void       setRatio(double ratio);
+
+private:
+    ArbitraryResampler(const ArbitraryResampler &);
+    ArbitraryResampler &operator=(const ArbitraryResampler &);
+
+    void       initState(S1 *state);
+    ptrdiff_t  outCount(double time, ptrdiff_t xOffset, ptrdiff_t inCount);
+
+    const PolyphaseFilter<C> *_filter;
+    bool       _ownsFilter;       // false if _filter is shared
+    inputType  *_state;
+    inputType  *_stateEnd;
+    bool       _ownsState;        // false if _state is part of a bank's
+
+    int        _upRate;
+    int        _coefsPerPhase;
+    double     _step;             // input samples per output sample
+    double     _time;             // fraction of an input sample, in [0, 1)
+    ptrdiff_t  _xOffset;
+};
+
+template<class S1, class S2, class C, class A>
+ArbitraryResampler<S1, S2, C, A>::ArbitraryResampler(int upRate, 
+                                                     double ratio, 
+                                                     C *coefs, 
+                                                     int coefCount):
+  _filter(new PolyphaseFilter<C>(upRate, coefs, coefCount)), 
+  _ownsFilter(true), _time(0.), _xOffset(0)
+{
+    setRatio(ratio);
+    initState(0);
+}
+
+template<class S1, class S2, class C, class A>
+ArbitraryResampler<S1, S2, C, A>::ArbitraryResampler(double ratio,
+                                        const PolyphaseFilter<C> *filter,
+                                        S1 *state):
+  _filter(filter), _ownsFilter(false), _time(0.), _xOffset(0)
+/*
+  An ArbitraryResampler using a filter, and a state buffer of 
+  coefsPerPhase - 1 samples, owned by the caller, which must outlive it.
+*/
+{
+    setRatio(ratio);
+    initState(state);
+}
+
+template<class S1, class S2, class C, class A>
+void ArbitraryResampler<S1, S2, C, A>::initState(S1 *state) {
+    _upRate = _filter->upRate();
+    _coefsPerPhase = _filter->coefsPerPhase();
+    _ownsState = !state;
+    _state = _ownsState ? new inputType[_coefsPerPhase - 1] : state;
+    _stateEnd = _state + _coefsPerPhase - 1;
+    fill(_state, _stateEnd, 0.);
+}
+
+template<class S1, class S2, class C, class A>
+ArbitraryResampler<S1, S2, C, A>::~ArbitraryResampler() {
+    if (_ownsFilter)
+        delete _filter;
+    if (_ownsState)
+        delete [] _state;
+}
+
+template<class S1, class S2, class C, class A>
+void ArbitraryResampler<S1, S2, C, A>::setRatio(double ratio)
+/* the ratio applies from the next output sample on */
+{
+    if (!(ratio > 0.))
+        throw invalid_argument("Ratio must be positive");
+    _step = 1. / ratio;
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t ArbitraryResampler<S1, S2, C, A>::outCount(double time, 
+                                                     ptrdiff_t xOffset,
+                                                     ptrdiff_t inCount)
+/* the number of outputs of inCount inputs, from the given state */
+{
+    // output y uses the inputs up to xOffset + floor(time + y * _step);
+    // an estimate, corrected so that it agrees exactly with apply
+    ptrdiff_t need = (ptrdiff_t) ceil((inCount - xOffset - time) / _step);
+    need = max(need, (ptrdiff_t) 0);
+    while (need > 0 && 
+           xOffset + (ptrdiff_t) floor(time + (need - 1) * _step) >= inCount)
+        need--;
+    while (xOffset + (ptrdiff_t) floor(time + need * _step) < inCount)
+        need++;
+    return need;
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t ArbitraryResampler<S1, S2, C, A>::neededOutCount(ptrdiff_t inCount)
+/* compute how many outputs will be generated for inCount inputs  */
+{
+    return outCount(_time, _xOffset, inCount);
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t ArbitraryResampler<S1, S2, C, A>::neededOutCount(ptrdiff_t inCount,
+                                                           bool flush)
+/*
+  As above, and if flush is true, add the outputs of a call to flush after
+  apply.  The times of the outputs are taken from the state apply leaves,
+  as flush will, rather than continued from this one, which may round
+  differently.
+*/
+{
+    ptrdiff_t count = outCount(_time, _xOffset, inCount);
+    if (!flush)
+        return count;
+    double time = _time + count * _step;
+    double whole = floor(time);
+    return count + outCount(time - whole, _xOffset + (ptrdiff_t) whole - 
+                            inCount, _coefsPerPhase - 1);
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t ArbitraryResampler<S1, S2, C, A>::apply(S1* in, ptrdiff_t inCount,
+                                                  S2* out, 
+                                                  ptrdiff_t outCount) {
+    return apply(in, inCount, 1, out, outCount, 1);
+}
+
+#ifndef SWIG
+template<class S1, class S2, class C, class A>
+ptrdiff_t ArbitraryResampler<S1, S2, C, A>::apply(const S1* in, 
+                                                  ptrdiff_t inCount, 
+                                                  ptrdiff_t inStride, 
+                                                  S2* out, 
+                                                  ptrdiff_t outCount, 
+                                                  ptrdiff_t outStride)
+/* as for Resampler::apply */
+{
+    typedef typename RealType<A>::type R;
+    if (outCount < neededOutCount(inCount)) 
+        throw invalid_argument("Not enough output samples");
+
+    // the loop ends on the input index itself, so that a rounding 
+    // difference from neededOutCount can never read past the input
+    ptrdiff_t y = 0;
+    double time, whole;
+    for (;; ++y) {
+        // output y is at time x + (t + alpha) / upRate input samples
+        time = _time + y * _step;
+        whole = floor(time);
+        ptrdiff_t x = _xOffset + (ptrdiff_t) whole;
+        if (x >= inCount)
+            break;
+        if (y >= outCount)
+            throw invalid_argument("Not enough output samples");
+        double phase = (time - whole) * _upRate;
+        int t = min((int) phase, _upRate - 1);
+        R alpha = (R) (phase - t);
+        ptrdiff_t xFirst = x - _coefsPerPhase + 1;
+        A acc = historyDotProduct<S1, C, A>(_stateEnd, in, inStride, xFirst,
+                                            _filter->phase(t), 
+                                            _coefsPerPhase);
+        if (alpha != (R) 0) {
+            // phase upRate at input x is phase 0 at input x + 1, without
+            // the coefficient of input x + 1
+            A next = t + 1 < _upRate ? 
+                historyDotProduct<S1, C, A>(_stateEnd, in, inStride, xFirst,
+                                            _filter->phase(t + 1), 
+                                            _coefsPerPhase) :
+                historyDotProduct<S1, C, A>(_stateEnd, in, inStride, 
+                                            xFirst + 1, _filter->phase(0),
+                                            _coefsPerPhase - 1);
+            acc += (next - acc) * alpha;
+        }
+        storeOutput(out[y * outStride], acc);
+    }
+    _time = time - whole;
+    _xOffset += (ptrdiff_t) whole - inCount;
+
+    retainInputs(in, inCount, inStride, _state, _stateEnd);
+    // number of samples computed
+    return y;
+}
+#endif
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t ArbitraryResampler<S1, S2, C, A>::flush(S2* out, 
+                                                  ptrdiff_t outCount) {
+    return flush(out, outCount, 1);
+}
+
+#ifndef SWIG
+template<class S1, class S2, class C, class A>
+ptrdiff_t ArbitraryResampler<S1, S2, C, A>::flush(S2* out, 
+                                                  ptrdiff_t outCount,
+                                                  ptrdiff_t outStride)
+/* as for Resampler::flush */
+{
+    typedef typename RealType<A>::type R;
+    ptrdiff_t inCount = _coefsPerPhase - 1;
+    if (outCount < neededOutCount(inCount)) 
+        throw invalid_argument("Not enough output samples");
+
+    ptrdiff_t y = 0;
+    double time, whole;
+    for (;; ++y) {
+        time = _time + y * _step;
+        whole = floor(time);
+        ptrdiff_t x = _xOffset + (ptrdiff_t) whole;
+        if (x >= inCount)
+            break;
+        if (y >= outCount)
+            throw invalid_argument("Not enough output samples");
+        double phase = (time - whole) * _upRate;
+        int t = min((int) phase, _upRate - 1);
+        R alpha = (R) (phase - t);
+        // only the inputs before the zeros, in the state buffer, count
+        ptrdiff_t xFirst = x - _coefsPerPhase + 1;
+        A acc = dotProduct<S1, C, A>(_stateEnd + xFirst, _filter->phase(t), 
+                                     -xFirst);
+        if (alpha != (R) 0) {
+            A next = t + 1 < _upRate ? 
+                dotProduct<S1, C, A>(_stateEnd + xFirst, 
+                                     _filter->phase(t + 1), -xFirst) :
+                dotProduct<S1, C, A>(_stateEnd + xFirst + 1, 
+                                     _filter->phase(0), -xFirst - 1);
+            acc += (next - acc) * alpha;
+        }
+        storeOutput(out[y * outStride], acc);
+    }
+    _time = time - whole;
+    _xOffset += (ptrdiff_t) whole - inCount;
+    // the last coefsPerPhase - 1 inputs are now the zeros
+    fill(_state, _stateEnd, 0.);
+    return y;
+}
+#endif
+
+template<class S1, class S2, class C, class A = S2>
+class ArbitraryResamplerBank{
+public:
+    typedef    ArbitraryResampler<S1, S2, C, A> resamplerType;
+
+    ArbitraryResamplerBank(int upRate, double ratio, C *coefs, 
+                           int coefCount, int bankSize);
+    virtual ~ArbitraryResamplerBank();
+
+    ptrdiff_t  apply(ArrayView<const S1> in, ArrayView<S2> out,
+                     ptrdiff_t firstChannel);
+    ptrdiff_t  flush(ArrayView<S2> out, ptrdiff_t firstChannel);
+    ptrdiff_t  neededOutCount(ptrdiff_t inCount) {
+        return _resamplers[0]->neededOutCount(inCount);
+    }
+    ptrdiff_t  neededOutCount(ptrdiff_t inCount, bool flush) {
+        return _resamplers[0]->neededOutCount(inCount, flush);
+    }
+    int        coefsPerPhase() { return _filter->coefsPerPhase(); }
+    int        bankSize() { return _resamplers.size(); }
+    double     ratio() { return _resamplers[0]->ratio(); }
+    void       setRatio(double ratio);
+
+private:
+    ArbitraryResamplerBank(const ArbitraryResamplerBank &);
+    ArbitraryResamplerBank &operator=(const ArbitraryResamplerBank &);
+
+    PolyphaseFilter<C> *_filter;
+    vector<resamplerType *> _resamplers;
+    S1         *_state;           // the channels' state buffers, end to end
+};
+
+template<class S1, class S2, class C, class A>
+ArbitraryResamplerBank<S1, S2, C, A>::ArbitraryResamplerBank(int upRate, 
+                                                             double ratio,
+                                                             C *coefs, 
+                                                             int coefCount,
+                                                             int bankSize)
+/*
+  A bank of ArbitraryResamplers with the same ratio, all sharing one
+  filter, so that a whole block of channels can be filtered in one call.
+*/
+{
+    if (bankSize < 1)
+        throw invalid_argument("Bank must have at least one channel");
+    if (!(ratio > 0.))
+        throw invalid_argument("Ratio must be positive");
+    _filter = new PolyphaseFilter<C>(upRate, coefs, coefCount);
+    ptrdiff_t stateSize = _filter->coefsPerPhase() - 1;
+    _state = new S1[bankSize * stateSize];
+    _resamplers.reserve(bankSize);
+    for (int i=0; i<bankSize; ++i) {
+        _resamplers.push_back(new resamplerType(ratio, _filter,
+                                                _state + i*stateSize));
+    }
+}
+
+template<class S1, class S2, class C, class A>
+ArbitraryResamplerBank<S1, S2, C, A>::~ArbitraryResamplerBank() {
+    for (int i=0; i<bankSize(); ++i) {
+        delete _resamplers[i];
+    }
+    delete _filter;
+    delete [] _state;
+}
+
+template<class S1, class S2, class C, class A>
+void ArbitraryResamplerBank<S1, S2, C, A>::setRatio(double ratio) {
+    if (!(ratio > 0.))
+        throw invalid_argument("Ratio must be positive");
+    for (int i=0; i<bankSize(); ++i) {
+        _resamplers[i]->setRatio(ratio);
+    }
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t ArbitraryResamplerBank<S1, S2, C, A>::apply(ArrayView<const S1> in,
+                                                      ArrayView<S2> out, 
+                                                      ptrdiff_t firstChannel)
+/* as for ResamplerBank::apply */
+{
+    if (firstChannel < 0 || in.channels() != out.channels() ||
+        in.channels() < firstChannel + bankSize())
+        throw invalid_argument("Number of channels does not match bank size");
+    ptrdiff_t inCount = in.count();
+    ptrdiff_t outCount = out.count();
+    if (outCount < neededOutCount(inCount)) 
+        throw invalid_argument("Not enough output samples");
+
+    ptrdiff_t count = 0;
+    for (int i=0; i<bankSize(); ++i) {
+        count = _resamplers[i]->apply(in.channel(firstChannel + i), inCount,
+                                      in.stride(), 
+                                      out.channel(firstChannel + i), 
+                                      outCount, out.stride());
+    }
+    return count;
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t ArbitraryResamplerBank<S1, S2, C, A>::flush(ArrayView<S2> out, 
+                                                      ptrdiff_t firstChannel)
+/* as for ResamplerBank::flush */
+{
+    if (firstChannel < 0 || out.channels() < firstChannel + bankSize())
+        throw invalid_argument("Number of channels does not match bank size");
+    ptrdiff_t outCount = out.count();
+    if (outCount < neededOutCount(coefsPerPhase() - 1)) 
+        throw invalid_argument("Not enough output samples");
+
+    ptrdiff_t count = 0;
+    for (int i=0; i<bankSize(); ++i) {
+        count = _resamplers[i]->flush(out.channel(firstChannel + i), 
+                                      outCount, out.stride());
+    }
+    return count;
+}
+
+template<class S1, class S2, class C, class A>
+void ResamplerBank<S1, S2, C, A>::setPhase(int t, ptrdiff_t xOffset)
+/* as Resampler::setPhase, for all the channels */
+{
+    for (int i=0; i<bankSize(); ++i) {
+        _resamplers[i]->setPhase(t, xOffset);
+    }
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t ResamplerBank<S1, S2, C, A>::flush(ArrayView<S2> out, 
+                                             ptrdiff_t firstChannel)
+/*
+  End the stream of channels firstChannel, ..., firstChannel + bankSize()
+  - 1, as Resampler::flush, into the same channels of the output array.
+  Returns the number of output samples computed for each channel.
+*/
+{
+    if (firstChannel < 0 || out.channels() < firstChannel + bankSize())
+        throw invalid_argument("Number of channels does not match bank size");
+    ptrdiff_t outCount = out.count();
+    if (outCount < neededOutCount(coefsPerPhase() - 1)) 
+        throw invalid_argument("Not enough output samples");
+
+    ptrdiff_t count = 0;
+    for (int i=0; i<bankSize(); ++i) {
+        count = _resamplers[i]->flush(out.channel(firstChannel + i), 
+                                      outCount, out.stride());
+    }
+    return count;
+}
+
+template<int Block, class S, class C, class A>
+inline void filterBlockProduct(const S *x, const C *h, int n, 
+                               int filterCount, A *acc)
+/*
+  Inner products of x with Block consecutive filters of a tap by tap array
+  of filterCount filters, from the one at h: their sums are independent,
+  so stay in registers across the taps, and the loop over them vectorizes.
+*/
+{
+    A sum[Block];
+    for (int k=0; k<Block; ++k) {
+        sum[k] = 0.;
+    }
+    for (int j=0; j<n; ++j, h += filterCount) {
+        const S xj = x[j];
+        for (int k=0; k<Block; ++k) {
+            sum[k] += multiply(xj, h[k]);
+        }
+    }
+    for (int k=0; k<Block; ++k) {
+        acc[k] = sum[k];
+    }
+}
+
+template<class S, class C, class A>
+RESAMPLER_TARGET_CLONES
+void multiFilterProduct(const S *x, const C *h, int n, int filterCount, 
+                        A *acc)
+/*
+  Inner products of n input samples with the n coefficients of each of
+  filterCount filters, stored tap by tap: h[j*filterCount + f] is tap j of
+  filter f.  The filters are taken in blocks of 32, then 8, which keep the
+  floating point pipeline full, and the rest one at a time.
+*/
+{
+    int f = 0;
+    for (; f + 32 <= filterCount; f += 32) {
+        filterBlockProduct<32>(x, h + f, n, filterCount, acc + f);
+    }
+    for (; f + 8 <= filterCount; f += 8) {
+        filterBlockProduct<8>(x, h + f, n, filterCount, acc + f);
+    }
+    for (; f < filterCount; ++f) {
+        filterBlockProduct<1>(x, h + f, n, filterCount, acc + f);
+    }
+}
+
+template<class S1, class S2, class C, class A = S2>
+class FusedResamplerBank{
+/*
+  The channels of a ResamplerBank whose inputs are all the same signal
+  (e.g. one signal broadcast against many filters), with a single input
+  state shared by all the filters.  Each output time, the input window is
+  read once and multiplied by the taps of all the filters together, rather
+  than once per channel.  It has the interface of ResamplerBank, with 
+  channel i using row i of the coefficients.
+*/
+public:
+    FusedResamplerBank(int upRate, int downRate, C *coefs, int filterCount,
+                       int coefCount);
+    virtual ~FusedResamplerBank();
+
+    ptrdiff_t  apply(ArrayView<const S1> in, ArrayView<S2> out,
+                     ptrdiff_t firstChannel);
+    ptrdiff_t  flush(ArrayView<S2> out, ptrdiff_t firstChannel);
+    ptrdiff_t  neededOutCount(ptrdiff_t inCount);
+    void       setPhase(int t, ptrdiff_t xOffset);
+    int        coefsPerPhase() { return _coefsPerPhase; }
+    int        bankSize() { return _filterCount; }
+    int        filterCount() { return _filterCount; }
+
+private:
+    FusedResamplerBank(const FusedResamplerBank &);
+    FusedResamplerBank &operator=(const FusedResamplerBank &);
+
+    ptrdiff_t  filter(const S1 *in, ptrdiff_t inCount, ptrdiff_t inStride,
+                      ArrayView<S2> out, ptrdiff_t firstChannel);
+
+    int        _upRate;
+    int        _downRate;
+    int        _filterCount;
+    int        _coefsPerPhase;
+    C          *_coefs;           // [phase][flipped tap][filter]
+    S1         *_state;           // the last coefsPerPhase - 1 inputs
+    S1         *_stateEnd;
+    S1         *_window;          // an input window, when not contiguous
+    A          *_acc;             // the filters' sums, for one output
+    int        _t;                // "time" (modulo upRate)
+    ptrdiff_t  _xOffset;
+};
+
+template<class S1, class S2, class C, class A>
+FusedResamplerBank<S1, S2, C, A>::FusedResamplerBank(int upRate, 
+                                                     int downRate, 
+                                                     C *coefs, 
+                                                     int filterCount,
+                                                     int coefCount):
+  _upRate(upRate), _downRate(downRate), _filterCount(filterCount),
+  _t(0), _xOffset(0)
+/*
+  The coefficients are a row-major (filterCount x coefCount) array, one
+  row per channel.  Each is split into phases as by PolyphaseFilter, and
+  the phases interleaved, tap by tap, for multiFilterProduct.
+*/
+{
+    if (filterCount < 1)
+        throw invalid_argument("Bank must have at least one channel");
+    _coefsPerPhase = (coefCount + upRate - 1) / upRate;
+    ptrdiff_t phaseSize = (ptrdiff_t) _coefsPerPhase * filterCount;
+    _coefs = new C[upRate * phaseSize];
+    for (int f=0; f<filterCount; ++f) {
+        PolyphaseFilter<C> filter(upRate, coefs + (ptrdiff_t) f*coefCount,
+                                  coefCount);
+        for (int t=0; t<upRate; ++t) {
+            for (int j=0; j<_coefsPerPhase; ++j) {
+                _coefs[t*phaseSize + (ptrdiff_t) j*filterCount + f] = 
+                    filter.phase(t)[j];
+            }
+        }
+    }
+    _state = new S1[_coefsPerPhase - 1];
+    _stateEnd = _state + _coefsPerPhase - 1;
+    fill(_state, _stateEnd, 0.);
+    _window = new S1[_coefsPerPhase];
+    _acc = new A[filterCount];
+}
+
+template<class S1, class S2, class C, class A>
+FusedResamplerBank<S1, S2, C, A>::~FusedResamplerBank() {
+    delete [] _coefs;
+    delete [] _state;
+    delete [] _window;
+    delete [] _acc;
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t FusedResamplerBank<S1, S2, C, A>::neededOutCount(ptrdiff_t inCount)
+/* as Resampler::neededOutCount */
+{
+    ptrdiff_t np = (inCount - _xOffset) * (ptrdiff_t) _upRate - _t;
+    if (np <= 0)
+        return 0;
+    return (np + _downRate - 1) / _downRate;
+}
+
+template<class S1, class S2, class C, class A>
+void FusedResamplerBank<S1, S2, C, A>::setPhase(int t, ptrdiff_t xOffset)
+/* as Resampler::setPhase */
+{
+    if (t < 0 || t >= _upRate || xOffset < 0)
+        throw invalid_argument("Phase out of range");
+    _t = t;
+    _xOffset = xOffset;
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t FusedResamplerBank<S1, S2, C, A>::apply(ArrayView<const S1> in, 
+                                                  ArrayView<S2> out, 
+                                                  ptrdiff_t firstChannel)
+/*
+  As ResamplerBank::apply; the input channels firstChannel, ..., 
+  firstChannel + bankSize() - 1 must all be the same signal, so only the
+  first of them is read.
+*/
+{
+    if (firstChannel < 0 || in.channels() != out.channels() ||
+        in.channels() < firstChannel + bankSize())
+        throw invalid_argument("Number of channels does not match bank size");
+    return filter(in.channel(firstChannel), in.count(), in.stride(), out,
+                  firstChannel);
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t FusedResamplerBank<S1, S2, C, A>::flush(ArrayView<S2> out, 
+                                                  ptrdiff_t firstChannel)
+/* as ResamplerBank::flush */
+{
+    if (firstChannel < 0 || out.channels() < firstChannel + bankSize())
+        throw invalid_argument("Number of channels does not match bank size");
+    ptrdiff_t inCount = _coefsPerPhase - 1;
+    if (out.count() < neededOutCount(inCount)) 
+        throw invalid_argument("Not enough output samples");
+    vector<S2 *> outChannels(_filterCount);
+    for (int f=0; f<_filterCount; ++f) {
+        outChannels[f] = out.channel(firstChannel + f);
+    }
+    ptrdiff_t outStride = out.stride();
+    ptrdiff_t phaseSize = (ptrdiff_t) _coefsPerPhase * _filterCount;
+
+    ptrdiff_t x = _xOffset;
+    ptrdiff_t y = 0;
+    while (x < inCount) {
+        // only the inputs before the zeros, in the state buffer, count: 
+        // they are the window's first taps, which are contiguous
+        ptrdiff_t xFirst = x - _coefsPerPhase + 1;
+        multiFilterProduct<S1, C, A>(_stateEnd + xFirst, 
+                                     _coefs + _t * phaseSize, 
+                                     (int) -xFirst, _filterCount, _acc);
+        for (int f=0; f<_filterCount; ++f) {
+            storeOutput(outChannels[f][y * outStride], _acc[f]);
+        }
+        ++y;
+        _t += _downRate;
+        x += _t / _upRate;
+        _t %= _upRate;
+    }
+    _xOffset = x - inCount;
+    // the last coefsPerPhase - 1 inputs are now the zeros
+    fill(_state, _stateEnd, 0.);
+    return y;
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t FusedResamplerBank<S1, S2, C, A>::filter(const S1 *in, 
+                                                   ptrdiff_t inCount,
+                                                   ptrdiff_t inStride,
+                                                   ArrayView<S2> out,
+                                                   ptrdiff_t firstChannel)
+{
+    if (out.count() < neededOutCount(inCount)) 
+        throw invalid_argument("Not enough output samples");
+    vector<S2 *> outChannels(_filterCount);
+    for (int f=0; f<_filterCount; ++f) {
+        outChannels[f] = out.channel(firstChannel + f);
+    }
+    ptrdiff_t outStride = out.stride();
+    ptrdiff_t phaseSize = (ptrdiff_t) _coefsPerPhase * _filterCount;
+
+    // x is the index of the latest processed input sample
+    ptrdiff_t x = _xOffset;
+    ptrdiff_t y = 0;
+    while (x < inCount) {
+        ptrdiff_t xFirst = x - _coefsPerPhase + 1;
+        const S1 *window;
+        if (xFirst >= 0 && inStride == 1) {
+            window = in + xFirst;
+        } else {
+            // gather the window from the state buffer and the input
+            ptrdiff_t k = 0;
+            for (; k < -xFirst; ++k) {
+                _window[k] = _stateEnd[xFirst + k];
+            }
+            stridedCopy(in + (xFirst + k) * inStride, _coefsPerPhase - k,
+                        inStride, _window + k);
+            window = _window;
+        }
+        multiFilterProduct<S1, C, A>(window, _coefs + _t * phaseSize, 
+                                     _coefsPerPhase, _filterCount, _acc);
+        for (int f=0; f<_filterCount; ++f) {
+            storeOutput(outChannels[f][y * outStride], _acc[f]);
+        }
+        ++y;
+        _t += _downRate;
+        x += _t / _upRate;
+        _t %= _upRate;
+    }
+    _xOffset = x - inCount;
+
+    retainInputs(in, inCount, inStride, _state, _stateEnd);
+    return y;
+}
+
+template<class S1, class S2, class C, class A = S2>
+class Channelizer{
+/*
+  The polyphase branches of a maximally decimated, uniform analysis filter
+  bank of channelCount channels.  Channel k is the input modulated down
+  by k/channelCount cycles per sample, lowpass filtered by the prototype
+  filter h, and decimated by channelCount.  Writing M for channelCount,
+  and h in the polyphase components of a PolyphaseFilter with upRate M,
+  branch r at output n is
+      v[r][n] = sum_l h[l*M + r] * x[n*M - r - l*M],
+  and channel k is sum_r v[r][n] * exp(2j*pi*k*r/M), i.e. M times the 
+  inverse DFT of the branches, which the caller computes with an FFT.
+  So all the channels cost one prototype filter, plus one FFT per output.
+*/
+public:
+    Channelizer(int channelCount, C *coefs, int coefCount);
+    virtual ~Channelizer();
+
+    ptrdiff_t  apply(ArrayView<const S1> in, ArrayView<S2> out);
+    ptrdiff_t  neededOutCount(ptrdiff_t inCount);
+    int        channelCount() { return _filter.upRate(); }
+    int        coefsPerPhase() { return _filter.coefsPerPhase(); }
+
+private:
+    Channelizer(const Channelizer &);
+    Channelizer &operator=(const Channelizer &);
+
+    PolyphaseFilter<C> _filter;
+    S1         *_state;           // the last M*coefsPerPhase - 1 inputs
+    S1         *_stateEnd;
+    ptrdiff_t  _xOffset;          // input index of the next output
+};
+
+template<class S1, class S2, class C, class A>
+Channelizer<S1, S2, C, A>::Channelizer(int channelCount, C *coefs, 
+                                       int coefCount):
+  _filter(channelCount, coefs, coefCount), _xOffset(0)
+{
+    ptrdiff_t stateSize = (ptrdiff_t) channelCount * coefsPerPhase() - 1;
+    _state = new S1[stateSize];
+    _stateEnd = _state + stateSize;
+    fill(_state, _stateEnd, 0.);
+}
+
+template<class S1, class S2, class C, class A>
+Channelizer<S1, S2, C, A>::~Channelizer() {
+    delete [] _state;
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t Channelizer<S1, S2, C, A>::neededOutCount(ptrdiff_t inCount)
+/* compute how many outputs will be generated for inCount inputs  */
+{
+    ptrdiff_t n = inCount - _xOffset;
+    if (n <= 0)
+        return 0;
+    return (n + channelCount() - 1) / channelCount();
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t Channelizer<S1, S2, C, A>::apply(ArrayView<const S1> in, 
+                                           ArrayView<S2> out)
+/*
+  Filter the input signal (a single channel) into the branches, the 
+  channelCount channels of the output array.  The arrays may have any 
+  strides.  Returns the number of output samples computed for each 
+  branch.
+*/
+{
+    int M = channelCount();
+    int n = coefsPerPhase();
+    if (in.channels() != 1 || out.channels() != M)
+        throw invalid_argument("Output must have one channel per branch");
+    ptrdiff_t inCount = in.count();
+    ptrdiff_t inStride = in.stride();
+    if (out.count() < neededOutCount(inCount)) 
+        throw invalid_argument("Not enough output samples");
+    const S1 *x = in.channel(0);
+
+    ptrdiff_t y = 0;
+    for (ptrdiff_t t = _xOffset; t < inCount; t += M, ++y) {
+        for (int r=0; r<M; ++r) {
+            // branch r reads every M-th input, ending at t - r
+            const C *h = _filter.phase(r);
+            ptrdiff_t xFirst = t - r - (ptrdiff_t) (n - 1) * M;
+            int j = 0;
+            A acc = 0.;
+            if (xFirst < 0) {
+                // the inputs before this call are in the state buffer
+                j = (int) min((ptrdiff_t) n, (-xFirst + M - 1) / M);
+                acc = dotProduct<S1, C, A>(_stateEnd + xFirst, M, h, j);
+            }
+            if (j < n) {
+                acc += dotProduct<S1, C, A>(x + (xFirst + j*M) * inStride,
+                                            M * inStride, h + j, n - j);
+            }
+            storeOutput(out.channel(r)[y * out.stride()], acc);
+        }
+    }
+    _xOffset += y * M - inCount;
+
+    retainInputs(x, inCount, inStride, _state, _stateEnd);
+    return y;
+}
+
+template<class C, class T>
+void modulateCoefs(const C *coefs, int coefCount, int upRate, 
+                   double frequency, complex<T> *modulated)
+/*
+  modulated[k] = coefs[k] * exp(2j*pi*frequency*k/upRate), computed in 
+  double precision: the filter of a DownConverter mixing by frequency 
+  cycles per input sample.
+*/
+{
+    const double w = 2. * M_PI * frequency / upRate;
+    for (int k=0; k<coefCount; ++k) {
+        complex<double> c = complex<double>(coefs[k]) * polar(1., w * k);
+        modulated[k] = complex<T>((T) c.real(), (T) c.imag());
+    }
+}
+
+template<class S1, class S2, class C, class A = S2>
+class DownConverter{
+/*
+  A digital down-converter: the input is mixed with exp(-2j*pi*f*n), for 
+  a frequency f in cycles per input sample, then filtered and resampled 
+  as by Resampler, with a complex output type S2.  Writing i for the time
+  of an output at upRate times the input rate, and v for the upsampled 
+  input, the output is
+      sum_k h[k] * v[i-k] * exp(-2j*pi*f*(i-k)/upRate)
+      = exp(-2j*pi*f*i/upRate) * sum_k h'[k] * v[i-k],
+  with h'[k] = h[k] * exp(2j*pi*f*k/upRate).  So the mixing is folded into
+  the filter, and each output is rotated once; no mixed intermediate is
+  formed, and the input samples that no output needs are never touched.
+  The phase of the mixer carries over between calls to apply.
+*/
+public:
+    typedef    S1 inputType;
+    typedef    S2 outputType;
+    typedef    C coefType;
+    typedef    A accumulatorType;
+
+    DownConverter(int upRate, int downRate, double frequency, C *coefs, 
+                  int coefCount);
+#ifndef SWIG
+    DownConverter(int downRate, double frequency, 
+                  const PolyphaseFilter<S2> *filter, S1 *state);
+#endif
+    virtual ~DownConverter();
+
+    ptrdiff_t  apply(S1* in, ptrdiff_t inCount, S2* out, ptrdiff_t outCount);
+#ifndef SWIG
+    ptrdiff_t  apply(const S1* in, ptrdiff_t inCount, ptrdiff_t inStride,
+                     S2* out, ptrdiff_t outCount, ptrdiff_t outStride);
+#endif
+    ptrdiff_t  flush(S2* out, ptrdiff_t outCount);
+#ifndef SWIG
+    ptrdiff_t  flush(S2* out, ptrdiff_t outCount, ptrdiff_t outStride);
+#endif
+    ptrdiff_t  neededOutCount(ptrdiff_t inCount);
+    int        coefsPerPhase() { return _coefsPerPhase; }
+    double     frequency() { return _frequency; }
+
+private:
+    DownConverter(const DownConverter &);
+    DownConverter &operator=(const DownConverter &);
+
+    void       init(int downRate, double frequency, S1 *state);
+    void       advance(ptrdiff_t outCount);
+
+    const PolyphaseFilter<S2> *_filter;   // the modulated filter h'
+    bool       _ownsFilter;       // false if _filter is shared
+    inputType  *_state;
+    inputType  *_stateEnd;
+    bool       _ownsState;        // false if _state is part of a bank's
+
+    int        _upRate;
+    int        _downRate;
+    int        _coefsPerPhase;
+    double     _frequency;
+    double     _step;             // mixer cycles per output, in [0, 1)
+    double     _cycles;           // mixer phase of the next output, in [0, 1)
+    int        _t;                // "time" (modulo upRate)
+    ptrdiff_t  _xOffset;
+};
+
+template<class S1, class S2, class C, class A>
+DownConverter<S1, S2, C, A>::DownConverter(int upRate, int downRate, 
+                                           double frequency, C *coefs, 
+                                           int coefCount):
+  _ownsFilter(true)
+{
+    vector<S2> modulated(coefCount);
+    modulateCoefs(coefs, coefCount, upRate, frequency, &modulated[0]);
+    _filter = new PolyphaseFilter<S2>(upRate, &modulated[0], coefCount);
+    init(downRate, frequency, 0);
+}
+
+template<class S1, class S2, class C, class A>
+DownConverter<S1, S2, C, A>::DownConverter(int downRate, double frequency,
+                                           const PolyphaseFilter<S2> *filter,
+                                           S1 *state):
+  _filter(filter), _ownsFilter(false)
+/*
+  A DownConverter using a filter already modulated by modulateCoefs, and a
+  state buffer of coefsPerPhase - 1 samples, owned by the caller, which
+  must outlive it.
+*/
+{
+    init(downRate, frequency, state);
+}
+
+template<class S1, class S2, class C, class A>
+void DownConverter<S1, S2, C, A>::init(int downRate, double frequency, 
+                                       S1 *state) {
+    _upRate = _filter->upRate();
+    _downRate = downRate;
+    _coefsPerPhase = _filter->coefsPerPhase();
+    _frequency = frequency;
+    _step = frequency * downRate / _upRate;
+    _step -= floor(_step);
+    _cycles = 0.;
+    _t = 0;
+    _xOffset = 0;
+    _ownsState = !state;
+    _state = _ownsState ? new inputType[_coefsPerPhase - 1] : state;
+    _stateEnd = _state + _coefsPerPhase - 1;
+    fill(_state, _stateEnd, 0.);
+}
+
+template<class S1, class S2, class C, class A>
+DownConverter<S1, S2, C, A>::~DownConverter() {
+    if (_ownsFilter)
+        delete _filter;
+    if (_ownsState)
+        delete [] _state;
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t DownConverter<S1, S2, C, A>::neededOutCount(ptrdiff_t inCount)
+/* as Resampler::neededOutCount */
+{
+    ptrdiff_t np = (inCount - _xOffset) * (ptrdiff_t) _upRate - _t;
+    if (np <= 0)
+        return 0;
+    return (np + _downRate - 1) / _downRate;
+}
+
+template<class S1, class S2, class C, class A>
+void DownConverter<S1, S2, C, A>::advance(ptrdiff_t outCount)
+/*
+  Move the mixer on by outCount outputs.  Within a call the outputs are
+  rotated by repeated multiplication, and the phase is recomputed here
+  from its exact step, so the rounding errors do not build up over a 
+  stream.
+*/
+{
+    _cycles += fmod(outCount * _step, 1.);
+    _cycles -= floor(_cycles);
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t DownConverter<S1, S2, C, A>::apply(S1* in, ptrdiff_t inCount, 
+                                             S2* out, ptrdiff_t outCount) {
+    return apply(in, inCount, 1, out, outCount, 1);
+}
+
+#ifndef SWIG
+template<class S1, class S2, class C, class A>
+ptrdiff_t DownConverter<S1, S2, C, A>::apply(const S1* in, ptrdiff_t inCount,
+                                             ptrdiff_t inStride, S2* out, 
+                                             ptrdiff_t outCount, 
+                                             ptrdiff_t outStride)
+/* as for Resampler::apply */
+{
+    typedef typename RealType<A>::type R;
+    if (outCount < neededOutCount(inCount)) 
+        throw invalid_argument("Not enough output samples");
+
+    complex<double> rotation = polar(1., -2. * M_PI * _cycles);
+    const complex<double> step = polar(1., -2. * M_PI * _step);
+    ptrdiff_t x = _xOffset;
+    ptrdiff_t y = 0;
+    while (x < inCount) {
+        ptrdiff_t xFirst = x - _coefsPerPhase + 1;
+        A acc = historyDotProduct<S1, S2, A>(_stateEnd, in, inStride, xFirst,
+                                             _filter->phase(_t), 
+                                             _coefsPerPhase);
+        acc = multiply(acc, A((R) rotation.real(), (R) rotation.imag()));
+        storeOutput(out[y++ * outStride], acc);
+        rotation *= step;
+        _t += _downRate;
+        x += _t / _upRate;
+        _t %= _upRate;
+    }
+    _xOffset = x - inCount;
+    advance(y);
+
+    retainInputs(in, inCount, inStride, _state, _stateEnd);
+    return y;
+}
+#endif
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t DownConverter<S1, S2, C, A>::flush(S2* out, ptrdiff_t outCount) {
+    return flush(out, outCount, 1);
+}
+
+#ifndef SWIG
+template<class S1, class S2, class C, class A>
+ptrdiff_t DownConverter<S1, S2, C, A>::flush(S2* out, ptrdiff_t outCount,
+                                             ptrdiff_t outStride)
+/* as for Resampler::flush */
+{
+    typedef typename RealType<A>::type R;
+    ptrdiff_t inCount = _coefsPerPhase - 1;
+    if (outCount < neededOutCount(inCount)) 
+        throw invalid_argument("Not enough output samples");
+
+    complex<double> rotation = polar(1., -2. * M_PI * _cycles);
+    const complex<double> step = polar(1., -2. * M_PI * _step);
+    ptrdiff_t x = _xOffset;
+    ptrdiff_t y = 0;
+    while (x < inCount) {
+        // only the inputs before the zeros, in the state buffer, count
+        ptrdiff_t xFirst = x - _coefsPerPhase + 1;
+        A acc = dotProduct<S1, S2, A>(_stateEnd + xFirst, _filter->phase(_t),
+                                      -xFirst);
+        acc = multiply(acc, A((R) rotation.real(), (R) rotation.imag()));
+        storeOutput(out[y++ * outStride], acc);
+        rotation *= step;
+        _t += _downRate;
+        x += _t / _upRate;
+        _t %= _upRate;
+    }
+    _xOffset = x - inCount;
+    advance(y);
+    fill(_state, _stateEnd, 0.);
+    return y;
+}
+#endif
+
+template<class S1, class S2, class C, class A = S2>
+class DownConverterBank{
+public:
+    typedef    DownConverter<S1, S2, C, A> converterType;
+
+    DownConverterBank(int upRate, int downRate, double frequency, C *coefs,
+                      int coefCount, int bankSize);
+    virtual ~DownConverterBank();
+
+    ptrdiff_t  apply(ArrayView<const S1> in, ArrayView<S2> out,
+                     ptrdiff_t firstChannel);
+    ptrdiff_t  flush(ArrayView<S2> out, ptrdiff_t firstChannel);
+    ptrdiff_t  neededOutCount(ptrdiff_t inCount) {
+        return _converters[0]->neededOutCount(inCount);
+    }
+    int        coefsPerPhase() { return _filter->coefsPerPhase(); }
+    int        bankSize() { return _converters.size(); }
+    double     frequency() { return _converters[0]->frequency(); }
+
+private:
+    DownConverterBank(const DownConverterBank &);
+    DownConverterBank &operator=(const DownConverterBank &);
+
+    PolyphaseFilter<S2> *_filter;
+    vector<converterType *> _converters;
+    S1         *_state;           // the channels' state buffers, end to end
+};
+
+template<class S1, class S2, class C, class A>
+DownConverterBank<S1, S2, C, A>::DownConverterBank(int upRate, int downRate,
+                                                   double frequency, 
+                                                   C *coefs, int coefCount,
+                                                   int bankSize)
+/*
+  A bank of DownConverters with the same frequency, all sharing one 
+  modulated filter, so that a whole block of channels can be converted in
+  one call.
+*/
+{
+    if (bankSize < 1)
+        throw invalid_argument("Bank must have at least one channel");
+    vector<S2> modulated(coefCount);
+    modulateCoefs(coefs, coefCount, upRate, frequency, &modulated[0]);
+    _filter = new PolyphaseFilter<S2>(upRate, &modulated[0], coefCount);
+    ptrdiff_t stateSize = _filter->coefsPerPhase() - 1;
+    _state = new S1[bankSize * stateSize];
+    _converters.reserve(bankSize);
+    for (int i=0; i<bankSize; ++i) {
+        _converters.push_back(new converterType(downRate, frequency, _filter,
+                                                _state + i*stateSize));
+    }
+}
+
+template<class S1, class S2, class C, class A>
+DownConverterBank<S1, S2, C, A>::~DownConverterBank() {
+    for (int i=0; i<bankSize(); ++i) {
+        delete _converters[i];
+    }
+    delete _filter;
+    delete [] _state;
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t DownConverterBank<S1, S2, C, A>::apply(ArrayView<const S1> in,
+                                                 ArrayView<S2> out, 
+                                                 ptrdiff_t firstChannel)
+/* as for ResamplerBank::apply */
+{
+    if (firstChannel < 0 || in.channels() != out.channels() ||
+        in.channels() < firstChannel + bankSize())
+        throw invalid_argument("Number of channels does not match bank size");
+    ptrdiff_t inCount = in.count();
+    ptrdiff_t outCount = out.count();
+    if (outCount < neededOutCount(inCount)) 
+        throw invalid_argument("Not enough output samples");
+
+    ptrdiff_t count = 0;
+    for (int i=0; i<bankSize(); ++i) {
+        count = _converters[i]->apply(in.channel(firstChannel + i), inCount,
+                                      in.stride(), 
+                                      out.channel(firstChannel + i), 
+                                      outCount, out.stride());
+    }
+    return count;
+}
+
+template<class S1, class S2, class C, class A>
+ptrdiff_t DownConverterBank<S1, S2, C, A>::flush(ArrayView<S2> out, 
+                                                 ptrdiff_t firstChannel)
+/* as for ResamplerBank::flush */
+{
+    if (firstChannel < 0 || out.channels() < firstChannel + bankSize())
+        throw invalid_argument("Number of channels does not match bank size");
+    ptrdiff_t outCount = out.count();
+    if (outCount < neededOutCount(coefsPerPhase() - 1)) 
+        throw invalid_argument("Not enough output samples");
+
+    ptrdiff_t count = 0;
+    for (int i=0; i<bankSize(); ++i) {
+        count = _converters[i]->flush(out.channel(firstChannel + i), 
+                                      outCount, out.stride());
+    }
+    return count;
+}
+
+template<class S1, class S2, class C>
+void upfirdn(int upRate, int downRate, 
+             S1 *input, ptrdiff_t inLength, C *filter, int filterLength, 
+             vector<S2> &results)
+/*
+This template function provides a one-shot resampling.  Extra samples
+are padded to the end of the input in order to capture all of the non-zero 
+output samples.
+The output is in the "results" vector which is modified by the function.
+
+Note, I considered returning a vector instead of taking one on input, but
+then the C++ compiler has trouble with implicit template instantiation
+(e.g. have to say upfirdn<float, float, float> every time - this
+way we can let the compiler infer the template types).
+
+Thanks to Lewis Anderson (lkanders@ucsd.edu) at UCSD for
+the original version of this function.
+*/
+{
+    // Create the Resampler
+    Resampler<S1, S2, C> theResampler(upRate, downRate, filter, filterLength);
+
+    // the input is followed by the length of one polyphase of filter (of
+    // zeros) to flush all values out
+    int padding = theResampler.coefsPerPhase() - 1;
 
     // calc size of output
-    int resultsCount = theResampler.neededOutCount(inLength + padding); 
+    ptrdiff_t resultsCount = theResampler.neededOutCount(inLength + padding); 
 
     results.resize(resultsCount);
+    if (resultsCount == 0)
+        return;
 
-    // run filtering
-    int numSamplesComputed = theResampler.apply(inputPadded, 
-            inLength + padding, &results[0], resultsCount);
-    delete[] inputPadded;
+    // run filtering, and flush the zeros without allocating them
+    ptrdiff_t numSamplesComputed = theResampler.apply(input, inLength, 
+            &results[0], resultsCount);
+    theResampler.flush(&results[0] + numSamplesComputed, 
+                       resultsCount - numSamplesComputed);
 }
 
 template<class S1, class S2, class C>
@@ -40,12 +40,100 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 // Get the NumPy typemaps
 %include "numpy.i"
+%numpy_typemaps(complex<float>, NPY_CFLOAT, int)
 %numpy_typemaps(complex<double>, NPY_CDOUBLE, int)
 
+// Signal lengths are ptrdiff_t, so blocks of over 2**31 samples can be
+// filtered in one call on 64-bit platforms.
+%numpy_typemaps(short, NPY_SHORT, ptrdiff_t)
+%numpy_typemaps(int, NPY_INT, ptrdiff_t)
+%numpy_typemaps(float, NPY_FLOAT, ptrdiff_t)
+%numpy_typemaps(double, NPY_DOUBLE, ptrdiff_t)
+%numpy_typemaps(complex<float>, NPY_CFLOAT, ptrdiff_t)
+%numpy_typemaps(complex<double>, NPY_CDOUBLE, ptrdiff_t)
+
 %init %{
   import_array();
 %}
 
+// Typemaps from numpy arrays of any layout to the ArrayView type of
+// Resampler.h, which carries their strides so nothing need be copied.
+// ArrayView<const T> is for input, converted to type T if needed;
+// ArrayView<T> is for output, which must be a writeable array of type T.
+%fragment("ArrayView_Fill", "header", fragment="NumPy_Macros")
+%{
+template<class T>
+static int fill_array_view(PyArrayObject* array, ArrayView<T> &view)
+{
+  int nd = array_numdims(array);
+  if (nd < 1 || nd > RESAMPLER_MAXDIM)
+  {
+    PyErr_Format(PyExc_ValueError, 
+                 "Array must have between 1 and %d dimensions", 
+                 RESAMPLER_MAXDIM);
+    return 0;
+  }
+  npy_intp itemsize = PyArray_ITEMSIZE(array);
+  view.data = (T*) array_data(array);
+  view.ndim = nd;
+  for (int k = 0; k < nd; ++k)
+  {
+    if (array_stride(array, k) % itemsize)
+    {
+      PyErr_SetString(PyExc_ValueError, 
+                      "Array strides must be multiples of its item size");
+      return 0;
+    }
+    view.shape[k] = array_size(array, k);
+    view.strides[k] = array_stride(array, k) / itemsize;
+  }
+  return 1;
+}
+%}
+
+%define %array_view_typemaps(DATA_TYPE, DATA_TYPECODE)
+
+%typemap(in, fragment="ArrayView_Fill")
+  (ArrayView<const DATA_TYPE >)
+  (PyArrayObject* view_array=NULL, int is_new_view=0,
+   ArrayView<const DATA_TYPE > filled_view)
+{
+  view_array = obj_to_array_allow_conversion($input, DATA_TYPECODE, 
+                                             &is_new_view);
+  if (!view_array || !fill_array_view(view_array, filled_view)) SWIG_fail;
+  $1 = filled_view;
+}
+%typemap(freearg)
+  (ArrayView<const DATA_TYPE >)
+{
+  if (is_new_view$argnum && view_array$argnum)
+    { Py_DECREF(view_array$argnum); }
+}
+
+%typemap(in, fragment="ArrayView_Fill")
+  (ArrayView<DATA_TYPE >)
+  (PyArrayObject* view_array=NULL, ArrayView<DATA_TYPE > filled_view)
+{
+  view_array = obj_to_array_no_conversion($input, DATA_TYPECODE);
+  if (!view_array || !require_native(view_array)) SWIG_fail;
+  if (!PyArray_ISWRITEABLE(view_array))
+  {
+    PyErr_SetString(PyExc_ValueError, "Output array must be writeable");
+    SWIG_fail;
+  }
+  if (!fill_array_view(view_array, filled_view)) SWIG_fail;
+  $1 = filled_view;
+}
+
+%enddef
+
+%array_view_typemaps(float, NPY_FLOAT)
+%array_view_typemaps(double, NPY_DOUBLE)
+%array_view_typemaps(complex<float>, NPY_CFLOAT)
+%array_view_typemaps(complex<double>, NPY_CDOUBLE)
+%array_view_typemaps(short, NPY_SHORT)
+%array_view_typemaps(int, NPY_INT)
+
 // Get the STL typemaps
 %include "stl.i"
 
@@ -63,16 +151,76 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
   }
 }
 
+// Release the GIL while filtering, so that other python threads (and
+// other channels of a ResamplerBank) can run concurrently.  The guard
+// is destroyed before the exception handler needs the GIL again.
+%{
+class ReleaseGIL {
+public:
+    ReleaseGIL() { _save = PyEval_SaveThread(); }
+    ~ReleaseGIL() { PyEval_RestoreThread(_save); }
+private:
+    PyThreadState *_save;
+};
+%}
+
+%exception apply
+{
+  try
+  {
+    ReleaseGIL nogil;
+    $action
+  }
+  catch (const std::invalid_argument& e)
+  {
+    SWIG_exception(SWIG_ValueError, e.what());
+  }
+}
+%exception flush
+{
+  try
+  {
+    ReleaseGIL nogil;
+    $action
+  }
+  catch (const std::invalid_argument& e)
+  {
+    SWIG_exception(SWIG_ValueError, e.what());
+  }
+}
+
 %feature("autodoc");
 
 %apply (double* IN_ARRAY1, int DIM1) {(double* coefs, int coefCount)};
+%apply (float* IN_ARRAY1, int DIM1) {(float* coefs, int coefCount)};
 %apply (complex<double>* IN_ARRAY1, int DIM1) {(complex<double>* coefs, int coefCount)};
+%apply (complex<float>* IN_ARRAY1, int DIM1) {(complex<float>* coefs, int coefCount)};
+
+%apply (double* IN_ARRAY1, ptrdiff_t DIM1) {(double* in, ptrdiff_t inCount)};
+%apply (float* IN_ARRAY1, ptrdiff_t DIM1) {(float* in, ptrdiff_t inCount)};
+%apply (complex<double>* IN_ARRAY1, ptrdiff_t DIM1) {(complex<double>* in, ptrdiff_t inCount)};
+%apply (complex<float>* IN_ARRAY1, ptrdiff_t DIM1) {(complex<float>* in, ptrdiff_t inCount)};
+%apply (short* IN_ARRAY1, ptrdiff_t DIM1) {(short* in, ptrdiff_t inCount)};
+%apply (int* IN_ARRAY1, ptrdiff_t DIM1) {(int* in, ptrdiff_t inCount)};
+
+%apply (double* INPLACE_ARRAY1, ptrdiff_t DIM1) {(double* out, ptrdiff_t outCount)};
+%apply (float* INPLACE_ARRAY1, ptrdiff_t DIM1) {(float* out, ptrdiff_t outCount)};
+%apply (complex<double>* INPLACE_ARRAY1, ptrdiff_t DIM1) {(complex<double>* out, ptrdiff_t outCount)};
+%apply (complex<float>* INPLACE_ARRAY1, ptrdiff_t DIM1) {(complex<float>* out, ptrdiff_t outCount)};
+%apply (short* INPLACE_ARRAY1, ptrdiff_t DIM1) {(short* out, ptrdiff_t outCount)};
+%apply (int* INPLACE_ARRAY1, ptrdiff_t DIM1) {(int* out, ptrdiff_t outCount)};
+
+%apply (double* IN_ARRAY2, int DIM1, int DIM2) {(double* coefs, int bankSize, int coefCount)};
+%apply (float* IN_ARRAY2, int DIM1, int DIM2) {(float* coefs, int bankSize, int coefCount)};
+%apply (complex<double>* IN_ARRAY2, int DIM1, int DIM2) {(complex<double>* coefs, int bankSize, int coefCount)};
+%apply (complex<float>* IN_ARRAY2, int DIM1, int DIM2) {(complex<float>* coefs, int bankSize, int coefCount)};
 
-%apply (double* IN_ARRAY1, int DIM1) {(double* in, int inCount)};
-%apply (complex<double>* IN_ARRAY1, int DIM1) {(complex<double>* in, int inCount)};
+%apply (double* IN_ARRAY2, int DIM1, int DIM2) {(double* coefs, int filterCount, int coefCount)};
+%apply (float* IN_ARRAY2, int DIM1, int DIM2) {(float* coefs, int filterCount, int coefCount)};
+%apply (complex<double>* IN_ARRAY2, int DIM1, int DIM2) {(complex<double>* coefs, int filterCount, int coefCount)};
+%apply (complex<float>* IN_ARRAY2, int DIM1, int DIM2) {(complex<float>* coefs, int filterCount, int coefCount)};
+%apply (int* IN_ARRAY1, int DIM1) {(int* filterIndex, int bankSize)};
 
-%apply (double* INPLACE_ARRAY1, int DIM1) {(double* out, int outCount)};
-%apply (complex<double>* INPLACE_ARRAY1, int DIM1) {(complex<double>* out, int outCount)};
 
 %include "Resampler.h"
 
@@ -80,3 +228,108 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 %template(ResamplerRC) Resampler<double, complex<double>, complex<double> >;
 %template(ResamplerCR) Resampler<complex<double>, complex<double>, double >;
 %template(ResamplerCC) Resampler<complex<double>, complex<double>, complex<double> >;
+
+%template(ResamplerBankRR) ResamplerBank<double, double, double>;
+%template(ResamplerBankRC) ResamplerBank<double, complex<double>, complex<double> >;
+%template(ResamplerBankCR) ResamplerBank<complex<double>, complex<double>, double >;
+%template(ResamplerBankCC) ResamplerBank<complex<double>, complex<double>, complex<double> >;
+
+%template(ResamplerRRf) Resampler<float, float, float>;
+%template(ResamplerRCf) Resampler<float, complex<float>, complex<float> >;
+%template(ResamplerCRf) Resampler<complex<float>, complex<float>, float >;
+%template(ResamplerCCf) Resampler<complex<float>, complex<float>, complex<float> >;
+
+%template(ResamplerBankRRf) ResamplerBank<float, float, float>;
+%template(ResamplerBankRCf) ResamplerBank<float, complex<float>, complex<float> >;
+%template(ResamplerBankCRf) ResamplerBank<complex<float>, complex<float>, float >;
+%template(ResamplerBankCCf) ResamplerBank<complex<float>, complex<float>, complex<float> >;
+
+// Integer (PCM) input signals: int16 ("H") is filtered in single precision
+// and int32 ("I") in double precision, with real ("R") or complex ("C") 
+// output, or with a rounded, saturated output of the input type.
+%template(ResamplerHR) Resampler<short, float, float>;
+%template(ResamplerHC) Resampler<short, complex<float>, complex<float> >;
+%template(ResamplerHH) Resampler<short, short, float, float>;
+%template(ResamplerIR) Resampler<int, double, double>;
+%template(ResamplerIC) Resampler<int, complex<double>, complex<double> >;
+%template(ResamplerII) Resampler<int, int, double, double>;
+
+%template(ResamplerBankHR) ResamplerBank<short, float, float>;
+%template(ResamplerBankHC) ResamplerBank<short, complex<float>, complex<float> >;
+%template(ResamplerBankHH) ResamplerBank<short, short, float, float>;
+%template(ResamplerBankIR) ResamplerBank<int, double, double>;
+%template(ResamplerBankIC) ResamplerBank<int, complex<double>, complex<double> >;
+%template(ResamplerBankII) ResamplerBank<int, int, double, double>;
+
+// Banks of channels that share one input signal
+%template(FusedResamplerBankRR) FusedResamplerBank<double, double, double>;
+%template(FusedResamplerBankRC) FusedResamplerBank<double, complex<double>, complex<double> >;
+%template(FusedResamplerBankCR) FusedResamplerBank<complex<double>, complex<double>, double >;
+%template(FusedResamplerBankCC) FusedResamplerBank<complex<double>, complex<double>, complex<double> >;
+%template(FusedResamplerBankRRf) FusedResamplerBank<float, float, float>;
+%template(FusedResamplerBankRCf) FusedResamplerBank<float, complex<float>, complex<float> >;
+%template(FusedResamplerBankCRf) FusedResamplerBank<complex<float>, complex<float>, float >;
+%template(FusedResamplerBankCCf) FusedResamplerBank<complex<float>, complex<float>, complex<float> >;
+%template(FusedResamplerBankHR) FusedResamplerBank<short, float, float>;
+%template(FusedResamplerBankHC) FusedResamplerBank<short, complex<float>, complex<float> >;
+%template(FusedResamplerBankHH) FusedResamplerBank<short, short, float, float>;
+%template(FusedResamplerBankIR) FusedResamplerBank<int, double, double>;
+%template(FusedResamplerBankIC) FusedResamplerBank<int, complex<double>, complex<double> >;
+%template(FusedResamplerBankII) FusedResamplerBank<int, int, double, double>;
+
+// Branches of the polyphase FFT channelizer
+%template(ChannelizerRR) Channelizer<double, double, double>;
+%template(ChannelizerRC) Channelizer<double, complex<double>, complex<double> >;
+%template(ChannelizerCR) Channelizer<complex<double>, complex<double>, double >;
+%template(ChannelizerCC) Channelizer<complex<double>, complex<double>, complex<double> >;
+%template(ChannelizerRRf) Channelizer<float, float, float>;
+%template(ChannelizerRCf) Channelizer<float, complex<float>, complex<float> >;
+%template(ChannelizerCRf) Channelizer<complex<float>, complex<float>, float >;
+%template(ChannelizerCCf) Channelizer<complex<float>, complex<float>, complex<float> >;
+
+// Resampling by an arbitrary (real, and adjustable) ratio
+%template(ArbitraryResamplerRR) ArbitraryResampler<double, double, double>;
+%template(ArbitraryResamplerRC) ArbitraryResampler<double, complex<double>, complex<double> >;
+%template(ArbitraryResamplerCR) ArbitraryResampler<complex<double>, complex<double>, double >;
+%template(ArbitraryResamplerCC) ArbitraryResampler<complex<double>, complex<double>, complex<double> >;
+%template(ArbitraryResamplerRRf) ArbitraryResampler<float, float, float>;
+%template(ArbitraryResamplerRCf) ArbitraryResampler<float, complex<float>, complex<float> >;
+%template(ArbitraryResamplerCRf) ArbitraryResampler<complex<float>, complex<float>, float >;
+%template(ArbitraryResamplerCCf) ArbitraryResampler<complex<float>, complex<float>, complex<float> >;
+
+%template(ArbitraryResamplerBankRR) ArbitraryResamplerBank<double, double, double>;
+%template(ArbitraryResamplerBankRC) ArbitraryResamplerBank<double, complex<double>, complex<double> >;
+%template(ArbitraryResamplerBankCR) ArbitraryResamplerBank<complex<double>, complex<double>, double >;
+%template(ArbitraryResamplerBankCC) ArbitraryResamplerBank<complex<double>, complex<double>, complex<double> >;
+%template(ArbitraryResamplerBankRRf) ArbitraryResamplerBank<float, float, float>;
+%template(ArbitraryResamplerBankRCf) ArbitraryResamplerBank<float, complex<float>, complex<float> >;
+%template(ArbitraryResamplerBankCRf) ArbitraryResamplerBank<complex<float>, complex<float>, float >;
+%template(ArbitraryResamplerBankCCf) ArbitraryResamplerBank<complex<float>, complex<float>, complex<float> >;
+%template(ArbitraryResamplerBankHR) ArbitraryResamplerBank<short, float, float>;
+%template(ArbitraryResamplerBankHC) ArbitraryResamplerBank<short, complex<float>, complex<float> >;
+%template(ArbitraryResamplerBankIR) ArbitraryResamplerBank<int, double, double>;
+%template(ArbitraryResamplerBankIC) ArbitraryResamplerBank<int, complex<double>, complex<double> >;
+
+// Digital down-converters: mixing, filtering and resampling, with complex
+// output
+%template(DownConverterRR) DownConverter<double, complex<double>, double>;
+%template(DownConverterRC) DownConverter<double, complex<double>, complex<double> >;
+%template(DownConverterCR) DownConverter<complex<double>, complex<double>, double >;
+%template(DownConverterCC) DownConverter<complex<double>, complex<double>, complex<double> >;
+%template(DownConverterRRf) DownConverter<float, complex<float>, float>;
+%template(DownConverterRCf) DownConverter<float, complex<float>, complex<float> >;
+%template(DownConverterCRf) DownConverter<complex<float>, complex<float>, float >;
+%template(DownConverterCCf) DownConverter<complex<float>, complex<float>, complex<float> >;
+
+%template(DownConverterBankRR) DownConverterBank<double, complex<double>, double>;
+%template(DownConverterBankRC) DownConverterBank<double, complex<double>, complex<double> >;
+%template(DownConverterBankCR) DownConverterBank<complex<double>, complex<double>, double >;
+%template(DownConverterBankCC) DownConverterBank<complex<double>, complex<double>, complex<double> >;
+%template(DownConverterBankRRf) DownConverterBank<float, complex<float>, float>;
+%template(DownConverterBankRCf) DownConverterBank<float, complex<float>, complex<float> >;
+%template(DownConverterBankCRf) DownConverterBank<complex<float>, complex<float>, float >;
+%template(DownConverterBankCCf) DownConverterBank<complex<float>, complex<float>, complex<float> >;
+%template(DownConverterBankHR) DownConverterBank<short, complex<float>, float>;
+%template(DownConverterBankHC) DownConverterBank<short, complex<float>, complex<float> >;
+%template(DownConverterBankIR) DownConverterBank<int, complex<double>, double>;
+%template(DownConverterBankIC) DownConverterBank<int, complex<double>, complex<double> >;
@@ -1,217 +1,3674 @@
 # This file was automatically generated by SWIG (http://www.swig.org).
-# Version 2.0.7
+# Version 4.0.2
 #
 # Do not make changes to this file unless you know what you are doing--modify
 # the SWIG interface file instead.
 
+from sys import version_info as _swig_python_version_info
+if _swig_python_version_info < (2, 7, 0):
+    raise RuntimeError("Python 2.7 or later required")
 
-
-from sys import version_info
-if version_info >= (2,6,0):
-    def swig_import_helper():
-        from os.path import dirname
-        import imp
-        fp = None
-        try:
-            fp, pathname, description = imp.find_module('_Resampler', [dirname(__file__)])
-        except ImportError:
-            import _Resampler
-            return _Resampler
-        if fp is not None:
-            try:
-                _mod = imp.load_module('_Resampler', fp, pathname, description)
-            finally:
-                fp.close()
-            return _mod
-    _Resampler = swig_import_helper()
-    del swig_import_helper
+# Import the low-level C/C++ module
+if __package__ or "." in __name__:
+    from . import _Resampler
 else:
     import _Resampler
-del version_info
+
 try:
-    _swig_property = property
-except NameError:
-    pass # Python < 2.2 doesn't have 'property'.
-def _swig_setattr_nondynamic(self,class_type,name,value,static=1):
-    if (name == "thisown"): return self.this.own(value)
-    if (name == "this"):
-        if type(value).__name__ == 'SwigPyObject':
-            self.__dict__[name] = value
-            return
-    method = class_type.__swig_setmethods__.get(name,None)
-    if method: return method(self,value)
-    if (not static):
-        self.__dict__[name] = value
-    else:
-        raise AttributeError("You cannot add attributes to %s" % self)
-
-def _swig_setattr(self,class_type,name,value):
-    return _swig_setattr_nondynamic(self,class_type,name,value,0)
-
-def _swig_getattr(self,class_type,name):
-    if (name == "thisown"): return self.this.own()
-    method = class_type.__swig_getmethods__.get(name,None)
-    if method: return method(self)
-    raise AttributeError(name)
+    import builtins as __builtin__
+except ImportError:
+    import __builtin__
 
 def _swig_repr(self):
-    try: strthis = "proxy of " + self.this.__repr__()
-    except: strthis = ""
+    try:
+        strthis = "proxy of " + self.this.__repr__()
+    except __builtin__.Exception:
+        strthis = ""
     return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
 
-try:
-    _object = object
-    _newclass = 1
-except AttributeError:
-    class _object : pass
-    _newclass = 0
+
+def _swig_setattr_nondynamic_instance_variable(set):
+    def set_instance_attr(self, name, value):
+        if name == "thisown":
+            self.this.own(value)
+        elif name == "this":
+            set(self, name, value)
+        elif hasattr(self, name) and isinstance(getattr(type(self), name), property):
+            set(self, name, value)
+        else:
+            raise AttributeError("You cannot add instance attributes to %s" % self)
+    return set_instance_attr
+
+
+def _swig_setattr_nondynamic_class_variable(set):
+    def set_class_attr(cls, name, value):
+        if hasattr(cls, name) and not isinstance(getattr(cls, name), property):
+            set(cls, name, value)
+        else:
+            raise AttributeError("You cannot add class attributes to %s" % cls)
+    return set_class_attr
+
+
+def _swig_add_metaclass(metaclass):
+    """Class decorator for adding a metaclass to a SWIG wrapped class - a slimmed down version of six.add_metaclass"""
+    def wrapper(cls):
+        return metaclass(cls.__name__, cls.__bases__, cls.__dict__.copy())
+    return wrapper
 
 
-class SwigPyIterator(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, SwigPyIterator, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, SwigPyIterator, name)
-    def __init__(self, *args, **kwargs): raise AttributeError("No constructor defined - class is abstract")
+class _SwigNonDynamicMeta(type):
+    """Meta class to enforce nondynamic attributes (no new attributes) for a class"""
+    __setattr__ = _swig_setattr_nondynamic_class_variable(type.__setattr__)
+
+
+class SwigPyIterator(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+
+    def __init__(self, *args, **kwargs):
+        raise AttributeError("No constructor defined - class is abstract")
     __repr__ = _swig_repr
     __swig_destroy__ = _Resampler.delete_SwigPyIterator
-    __del__ = lambda self : None;
-    def value(self): return _Resampler.SwigPyIterator_value(self)
-    def incr(self, n=1): return _Resampler.SwigPyIterator_incr(self, n)
-    def decr(self, n=1): return _Resampler.SwigPyIterator_decr(self, n)
-    def distance(self, *args): return _Resampler.SwigPyIterator_distance(self, *args)
-    def equal(self, *args): return _Resampler.SwigPyIterator_equal(self, *args)
-    def copy(self): return _Resampler.SwigPyIterator_copy(self)
-    def next(self): return _Resampler.SwigPyIterator_next(self)
-    def __next__(self): return _Resampler.SwigPyIterator___next__(self)
-    def previous(self): return _Resampler.SwigPyIterator_previous(self)
-    def advance(self, *args): return _Resampler.SwigPyIterator_advance(self, *args)
-    def __eq__(self, *args): return _Resampler.SwigPyIterator___eq__(self, *args)
-    def __ne__(self, *args): return _Resampler.SwigPyIterator___ne__(self, *args)
-    def __iadd__(self, *args): return _Resampler.SwigPyIterator___iadd__(self, *args)
-    def __isub__(self, *args): return _Resampler.SwigPyIterator___isub__(self, *args)
-    def __add__(self, *args): return _Resampler.SwigPyIterator___add__(self, *args)
-    def __sub__(self, *args): return _Resampler.SwigPyIterator___sub__(self, *args)
-    def __iter__(self): return self
-SwigPyIterator_swigregister = _Resampler.SwigPyIterator_swigregister
-SwigPyIterator_swigregister(SwigPyIterator)
-
-class ResamplerRR(_object):
-    """Proxy of C++ Resampler<(double,double,double)> class"""
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, ResamplerRR, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, ResamplerRR, name)
-    __repr__ = _swig_repr
-    def __init__(self, *args): 
-        """__init__(Resampler<(double,double,double)> self, int upRate, int downRate, double * coefs) -> ResamplerRR"""
-        this = _Resampler.new_ResamplerRR(*args)
-        try: self.this.append(this)
-        except: self.this = this
+
+    def value(self):
+        return _Resampler.SwigPyIterator_value(self)
+
+    def incr(self, n=1):
+        return _Resampler.SwigPyIterator_incr(self, n)
+
+    def decr(self, n=1):
+        return _Resampler.SwigPyIterator_decr(self, n)
+
+    def distance(self, x):
+        return _Resampler.SwigPyIterator_distance(self, x)
+
+    def equal(self, x):
+        return _Resampler.SwigPyIterator_equal(self, x)
+
+    def copy(self):
+        return _Resampler.SwigPyIterator_copy(self)
+
+    def next(self):
+        return _Resampler.SwigPyIterator_next(self)
+
+    def __next__(self):
+        return _Resampler.SwigPyIterator___next__(self)
+
+    def previous(self):
+        return _Resampler.SwigPyIterator_previous(self)
+
+    def advance(self, n):
+        return _Resampler.SwigPyIterator_advance(self, n)
+
+    def __eq__(self, x):
+        return _Resampler.SwigPyIterator___eq__(self, x)
+
+    def __ne__(self, x):
+        return _Resampler.SwigPyIterator___ne__(self, x)
+
+    def __iadd__(self, n):
+        return _Resampler.SwigPyIterator___iadd__(self, n)
+
+    def __isub__(self, n):
+        return _Resampler.SwigPyIterator___isub__(self, n)
+
+    def __add__(self, n):
+        return _Resampler.SwigPyIterator___add__(self, n)
+
+    def __sub__(self, *args):
+        return _Resampler.SwigPyIterator___sub__(self, *args)
+    def __iter__(self):
+        return self
+
+# Register SwigPyIterator in _Resampler:
+_Resampler.SwigPyIterator_swigregister(SwigPyIterator)
+
+RESAMPLER_MAXDIM = _Resampler.RESAMPLER_MAXDIM
+
+RESAMPLER_LANES = _Resampler.RESAMPLER_LANES
+
+class ResamplerRR(object):
+    r"""Proxy of C++ Resampler< double,double,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(ResamplerRR self, int upRate, int downRate, double * coefs) -> ResamplerRR"""
+        _Resampler.ResamplerRR_swiginit(self, _Resampler.new_ResamplerRR(upRate, downRate, coefs))
     __swig_destroy__ = _Resampler.delete_ResamplerRR
-    __del__ = lambda self : None;
-    def apply(self, *args):
-        """apply(ResamplerRR self, double * _in, double * out) -> int"""
-        return _Resampler.ResamplerRR_apply(self, *args)
 
-    def neededOutCount(self, *args):
-        """neededOutCount(ResamplerRR self, int inCount) -> int"""
-        return _Resampler.ResamplerRR_neededOutCount(self, *args)
+    def apply(self, _in, out):
+        r"""apply(ResamplerRR self, double * _in, double * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerRR_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ResamplerRR self, double * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerRR_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerRR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerRR_neededOutCount(self, inCount)
 
     def coefsPerPhase(self):
-        """coefsPerPhase(ResamplerRR self) -> int"""
+        r"""coefsPerPhase(ResamplerRR self) -> int"""
         return _Resampler.ResamplerRR_coefsPerPhase(self)
 
-ResamplerRR_swigregister = _Resampler.ResamplerRR_swigregister
-ResamplerRR_swigregister(ResamplerRR)
-
-class ResamplerRC(_object):
-    """Proxy of C++ Resampler<(double,complex<(double)>,complex<(double)>)> class"""
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, ResamplerRC, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, ResamplerRC, name)
-    __repr__ = _swig_repr
-    def __init__(self, *args): 
-        """__init__(Resampler<(double,complex<(double)>,complex<(double)>)> self, int upRate, int downRate, complex< double > * coefs) -> ResamplerRC"""
-        this = _Resampler.new_ResamplerRC(*args)
-        try: self.this.append(this)
-        except: self.this = this
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerRR self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerRR_setPhase(self, t, xOffset)
+
+# Register ResamplerRR in _Resampler:
+_Resampler.ResamplerRR_swigregister(ResamplerRR)
+
+class ResamplerRC(object):
+    r"""Proxy of C++ Resampler< double,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(ResamplerRC self, int upRate, int downRate, complex< double > * coefs) -> ResamplerRC"""
+        _Resampler.ResamplerRC_swiginit(self, _Resampler.new_ResamplerRC(upRate, downRate, coefs))
     __swig_destroy__ = _Resampler.delete_ResamplerRC
-    __del__ = lambda self : None;
-    def apply(self, *args):
-        """apply(ResamplerRC self, double * _in, complex< double > * out) -> int"""
-        return _Resampler.ResamplerRC_apply(self, *args)
 
-    def neededOutCount(self, *args):
-        """neededOutCount(ResamplerRC self, int inCount) -> int"""
-        return _Resampler.ResamplerRC_neededOutCount(self, *args)
+    def apply(self, _in, out):
+        r"""apply(ResamplerRC self, double * _in, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerRC_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ResamplerRC self, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerRC_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerRC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerRC_neededOutCount(self, inCount)
 
     def coefsPerPhase(self):
-        """coefsPerPhase(ResamplerRC self) -> int"""
+        r"""coefsPerPhase(ResamplerRC self) -> int"""
         return _Resampler.ResamplerRC_coefsPerPhase(self)
 
-ResamplerRC_swigregister = _Resampler.ResamplerRC_swigregister
-ResamplerRC_swigregister(ResamplerRC)
-
-class ResamplerCR(_object):
-    """Proxy of C++ Resampler<(complex<(double)>,complex<(double)>,double)> class"""
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, ResamplerCR, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, ResamplerCR, name)
-    __repr__ = _swig_repr
-    def __init__(self, *args): 
-        """__init__(Resampler<(complex<(double)>,complex<(double)>,double)> self, int upRate, int downRate, double * coefs) -> ResamplerCR"""
-        this = _Resampler.new_ResamplerCR(*args)
-        try: self.this.append(this)
-        except: self.this = this
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerRC self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerRC_setPhase(self, t, xOffset)
+
+# Register ResamplerRC in _Resampler:
+_Resampler.ResamplerRC_swigregister(ResamplerRC)
+
+class ResamplerCR(object):
+    r"""Proxy of C++ Resampler< complex< double >,complex< double >,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(ResamplerCR self, int upRate, int downRate, double * coefs) -> ResamplerCR"""
+        _Resampler.ResamplerCR_swiginit(self, _Resampler.new_ResamplerCR(upRate, downRate, coefs))
     __swig_destroy__ = _Resampler.delete_ResamplerCR
-    __del__ = lambda self : None;
-    def apply(self, *args):
-        """apply(ResamplerCR self, complex< double > * _in, complex< double > * out) -> int"""
-        return _Resampler.ResamplerCR_apply(self, *args)
 
-    def neededOutCount(self, *args):
-        """neededOutCount(ResamplerCR self, int inCount) -> int"""
-        return _Resampler.ResamplerCR_neededOutCount(self, *args)
+    def apply(self, _in, out):
+        r"""apply(ResamplerCR self, complex< double > * _in, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerCR_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ResamplerCR self, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerCR_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerCR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerCR_neededOutCount(self, inCount)
 
     def coefsPerPhase(self):
-        """coefsPerPhase(ResamplerCR self) -> int"""
+        r"""coefsPerPhase(ResamplerCR self) -> int"""
         return _Resampler.ResamplerCR_coefsPerPhase(self)
 
-ResamplerCR_swigregister = _Resampler.ResamplerCR_swigregister
-ResamplerCR_swigregister(ResamplerCR)
-
-class ResamplerCC(_object):
-    """Proxy of C++ Resampler<(complex<(double)>,complex<(double)>,complex<(double)>)> class"""
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, ResamplerCC, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, ResamplerCC, name)
-    __repr__ = _swig_repr
-    def __init__(self, *args): 
-        """__init__(Resampler<(complex<(double)>,complex<(double)>,complex<(double)>)> self, int upRate, int downRate, complex< double > * coefs) -> ResamplerCC"""
-        this = _Resampler.new_ResamplerCC(*args)
-        try: self.this.append(this)
-        except: self.this = this
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerCR self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerCR_setPhase(self, t, xOffset)
+
+# Register ResamplerCR in _Resampler:
+_Resampler.ResamplerCR_swigregister(ResamplerCR)
+
+class ResamplerCC(object):
+    r"""Proxy of C++ Resampler< complex< double >,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(ResamplerCC self, int upRate, int downRate, complex< double > * coefs) -> ResamplerCC"""
+        _Resampler.ResamplerCC_swiginit(self, _Resampler.new_ResamplerCC(upRate, downRate, coefs))
     __swig_destroy__ = _Resampler.delete_ResamplerCC
-    __del__ = lambda self : None;
-    def apply(self, *args):
-        """apply(ResamplerCC self, complex< double > * _in, complex< double > * out) -> int"""
-        return _Resampler.ResamplerCC_apply(self, *args)
 
-    def neededOutCount(self, *args):
-        """neededOutCount(ResamplerCC self, int inCount) -> int"""
-        return _Resampler.ResamplerCC_neededOutCount(self, *args)
+    def apply(self, _in, out):
+        r"""apply(ResamplerCC self, complex< double > * _in, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerCC_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ResamplerCC self, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerCC_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerCC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerCC_neededOutCount(self, inCount)
 
     def coefsPerPhase(self):
-        """coefsPerPhase(ResamplerCC self) -> int"""
+        r"""coefsPerPhase(ResamplerCC self) -> int"""
         return _Resampler.ResamplerCC_coefsPerPhase(self)
 
-ResamplerCC_swigregister = _Resampler.ResamplerCC_swigregister
-ResamplerCC_swigregister(ResamplerCC)
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerCC self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerCC_setPhase(self, t, xOffset)
+
+# Register ResamplerCC in _Resampler:
+_Resampler.ResamplerCC_swigregister(ResamplerCC)
+
+class ResamplerBankRR(object):
+    r"""Proxy of C++ ResamplerBank< double,double,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, *args):
+        r"""
+        __init__(ResamplerBankRR self, int upRate, int downRate, double * coefs) -> ResamplerBankRR
+        __init__(ResamplerBankRR self, int upRate, int downRate, double * coefs, int * filterIndex) -> ResamplerBankRR
+        __init__(ResamplerBankRR self, int upRate, int downRate, double * coefs, int * filterIndex, bool transposed) -> ResamplerBankRR
+        """
+        _Resampler.ResamplerBankRR_swiginit(self, _Resampler.new_ResamplerBankRR(*args))
+    __swig_destroy__ = _Resampler.delete_ResamplerBankRR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ResamplerBankRR self, ArrayView< double const > _in, ArrayView< double > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankRR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ResamplerBankRR self, ArrayView< double > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankRR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerBankRR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankRR_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerBankRR self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerBankRR_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerBankRR self) -> int"""
+        return _Resampler.ResamplerBankRR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ResamplerBankRR self) -> int"""
+        return _Resampler.ResamplerBankRR_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(ResamplerBankRR self) -> int"""
+        return _Resampler.ResamplerBankRR_filterCount(self)
+
+# Register ResamplerBankRR in _Resampler:
+_Resampler.ResamplerBankRR_swigregister(ResamplerBankRR)
+
+class ResamplerBankRC(object):
+    r"""Proxy of C++ ResamplerBank< double,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, *args):
+        r"""
+        __init__(ResamplerBankRC self, int upRate, int downRate, complex< double > * coefs) -> ResamplerBankRC
+        __init__(ResamplerBankRC self, int upRate, int downRate, complex< double > * coefs, int * filterIndex) -> ResamplerBankRC
+        __init__(ResamplerBankRC self, int upRate, int downRate, complex< double > * coefs, int * filterIndex, bool transposed) -> ResamplerBankRC
+        """
+        _Resampler.ResamplerBankRC_swiginit(self, _Resampler.new_ResamplerBankRC(*args))
+    __swig_destroy__ = _Resampler.delete_ResamplerBankRC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ResamplerBankRC self, ArrayView< double const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankRC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ResamplerBankRC self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankRC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerBankRC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankRC_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerBankRC self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerBankRC_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerBankRC self) -> int"""
+        return _Resampler.ResamplerBankRC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ResamplerBankRC self) -> int"""
+        return _Resampler.ResamplerBankRC_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(ResamplerBankRC self) -> int"""
+        return _Resampler.ResamplerBankRC_filterCount(self)
+
+# Register ResamplerBankRC in _Resampler:
+_Resampler.ResamplerBankRC_swigregister(ResamplerBankRC)
+
+class ResamplerBankCR(object):
+    r"""Proxy of C++ ResamplerBank< complex< double >,complex< double >,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, *args):
+        r"""
+        __init__(ResamplerBankCR self, int upRate, int downRate, double * coefs) -> ResamplerBankCR
+        __init__(ResamplerBankCR self, int upRate, int downRate, double * coefs, int * filterIndex) -> ResamplerBankCR
+        __init__(ResamplerBankCR self, int upRate, int downRate, double * coefs, int * filterIndex, bool transposed) -> ResamplerBankCR
+        """
+        _Resampler.ResamplerBankCR_swiginit(self, _Resampler.new_ResamplerBankCR(*args))
+    __swig_destroy__ = _Resampler.delete_ResamplerBankCR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ResamplerBankCR self, ArrayView< complex< double > const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankCR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ResamplerBankCR self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankCR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerBankCR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankCR_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerBankCR self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerBankCR_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerBankCR self) -> int"""
+        return _Resampler.ResamplerBankCR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ResamplerBankCR self) -> int"""
+        return _Resampler.ResamplerBankCR_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(ResamplerBankCR self) -> int"""
+        return _Resampler.ResamplerBankCR_filterCount(self)
+
+# Register ResamplerBankCR in _Resampler:
+_Resampler.ResamplerBankCR_swigregister(ResamplerBankCR)
+
+class ResamplerBankCC(object):
+    r"""Proxy of C++ ResamplerBank< complex< double >,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, *args):
+        r"""
+        __init__(ResamplerBankCC self, int upRate, int downRate, complex< double > * coefs) -> ResamplerBankCC
+        __init__(ResamplerBankCC self, int upRate, int downRate, complex< double > * coefs, int * filterIndex) -> ResamplerBankCC
+        __init__(ResamplerBankCC self, int upRate, int downRate, complex< double > * coefs, int * filterIndex, bool transposed) -> ResamplerBankCC
+        """
+        _Resampler.ResamplerBankCC_swiginit(self, _Resampler.new_ResamplerBankCC(*args))
+    __swig_destroy__ = _Resampler.delete_ResamplerBankCC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ResamplerBankCC self, ArrayView< complex< double > const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankCC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ResamplerBankCC self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankCC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerBankCC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankCC_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerBankCC self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerBankCC_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerBankCC self) -> int"""
+        return _Resampler.ResamplerBankCC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ResamplerBankCC self) -> int"""
+        return _Resampler.ResamplerBankCC_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(ResamplerBankCC self) -> int"""
+        return _Resampler.ResamplerBankCC_filterCount(self)
+
+# Register ResamplerBankCC in _Resampler:
+_Resampler.ResamplerBankCC_swigregister(ResamplerBankCC)
+
+class ResamplerRRf(object):
+    r"""Proxy of C++ Resampler< float,float,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(ResamplerRRf self, int upRate, int downRate, float * coefs) -> ResamplerRRf"""
+        _Resampler.ResamplerRRf_swiginit(self, _Resampler.new_ResamplerRRf(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_ResamplerRRf
+
+    def apply(self, _in, out):
+        r"""apply(ResamplerRRf self, float * _in, float * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerRRf_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ResamplerRRf self, float * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerRRf_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerRRf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerRRf_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerRRf self) -> int"""
+        return _Resampler.ResamplerRRf_coefsPerPhase(self)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerRRf self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerRRf_setPhase(self, t, xOffset)
+
+# Register ResamplerRRf in _Resampler:
+_Resampler.ResamplerRRf_swigregister(ResamplerRRf)
+
+class ResamplerRCf(object):
+    r"""Proxy of C++ Resampler< float,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(ResamplerRCf self, int upRate, int downRate, complex< float > * coefs) -> ResamplerRCf"""
+        _Resampler.ResamplerRCf_swiginit(self, _Resampler.new_ResamplerRCf(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_ResamplerRCf
+
+    def apply(self, _in, out):
+        r"""apply(ResamplerRCf self, float * _in, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerRCf_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ResamplerRCf self, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerRCf_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerRCf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerRCf_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerRCf self) -> int"""
+        return _Resampler.ResamplerRCf_coefsPerPhase(self)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerRCf self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerRCf_setPhase(self, t, xOffset)
+
+# Register ResamplerRCf in _Resampler:
+_Resampler.ResamplerRCf_swigregister(ResamplerRCf)
+
+class ResamplerCRf(object):
+    r"""Proxy of C++ Resampler< complex< float >,complex< float >,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(ResamplerCRf self, int upRate, int downRate, float * coefs) -> ResamplerCRf"""
+        _Resampler.ResamplerCRf_swiginit(self, _Resampler.new_ResamplerCRf(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_ResamplerCRf
+
+    def apply(self, _in, out):
+        r"""apply(ResamplerCRf self, complex< float > * _in, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerCRf_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ResamplerCRf self, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerCRf_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerCRf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerCRf_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerCRf self) -> int"""
+        return _Resampler.ResamplerCRf_coefsPerPhase(self)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerCRf self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerCRf_setPhase(self, t, xOffset)
+
+# Register ResamplerCRf in _Resampler:
+_Resampler.ResamplerCRf_swigregister(ResamplerCRf)
+
+class ResamplerCCf(object):
+    r"""Proxy of C++ Resampler< complex< float >,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(ResamplerCCf self, int upRate, int downRate, complex< float > * coefs) -> ResamplerCCf"""
+        _Resampler.ResamplerCCf_swiginit(self, _Resampler.new_ResamplerCCf(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_ResamplerCCf
+
+    def apply(self, _in, out):
+        r"""apply(ResamplerCCf self, complex< float > * _in, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerCCf_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ResamplerCCf self, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerCCf_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerCCf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerCCf_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerCCf self) -> int"""
+        return _Resampler.ResamplerCCf_coefsPerPhase(self)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerCCf self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerCCf_setPhase(self, t, xOffset)
+
+# Register ResamplerCCf in _Resampler:
+_Resampler.ResamplerCCf_swigregister(ResamplerCCf)
+
+class ResamplerBankRRf(object):
+    r"""Proxy of C++ ResamplerBank< float,float,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, *args):
+        r"""
+        __init__(ResamplerBankRRf self, int upRate, int downRate, float * coefs) -> ResamplerBankRRf
+        __init__(ResamplerBankRRf self, int upRate, int downRate, float * coefs, int * filterIndex) -> ResamplerBankRRf
+        __init__(ResamplerBankRRf self, int upRate, int downRate, float * coefs, int * filterIndex, bool transposed) -> ResamplerBankRRf
+        """
+        _Resampler.ResamplerBankRRf_swiginit(self, _Resampler.new_ResamplerBankRRf(*args))
+    __swig_destroy__ = _Resampler.delete_ResamplerBankRRf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ResamplerBankRRf self, ArrayView< float const > _in, ArrayView< float > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankRRf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ResamplerBankRRf self, ArrayView< float > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankRRf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerBankRRf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankRRf_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerBankRRf self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerBankRRf_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerBankRRf self) -> int"""
+        return _Resampler.ResamplerBankRRf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ResamplerBankRRf self) -> int"""
+        return _Resampler.ResamplerBankRRf_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(ResamplerBankRRf self) -> int"""
+        return _Resampler.ResamplerBankRRf_filterCount(self)
+
+# Register ResamplerBankRRf in _Resampler:
+_Resampler.ResamplerBankRRf_swigregister(ResamplerBankRRf)
+
+class ResamplerBankRCf(object):
+    r"""Proxy of C++ ResamplerBank< float,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, *args):
+        r"""
+        __init__(ResamplerBankRCf self, int upRate, int downRate, complex< float > * coefs) -> ResamplerBankRCf
+        __init__(ResamplerBankRCf self, int upRate, int downRate, complex< float > * coefs, int * filterIndex) -> ResamplerBankRCf
+        __init__(ResamplerBankRCf self, int upRate, int downRate, complex< float > * coefs, int * filterIndex, bool transposed) -> ResamplerBankRCf
+        """
+        _Resampler.ResamplerBankRCf_swiginit(self, _Resampler.new_ResamplerBankRCf(*args))
+    __swig_destroy__ = _Resampler.delete_ResamplerBankRCf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ResamplerBankRCf self, ArrayView< float const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankRCf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ResamplerBankRCf self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankRCf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerBankRCf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankRCf_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerBankRCf self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerBankRCf_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerBankRCf self) -> int"""
+        return _Resampler.ResamplerBankRCf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ResamplerBankRCf self) -> int"""
+        return _Resampler.ResamplerBankRCf_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(ResamplerBankRCf self) -> int"""
+        return _Resampler.ResamplerBankRCf_filterCount(self)
+
+# Register ResamplerBankRCf in _Resampler:
+_Resampler.ResamplerBankRCf_swigregister(ResamplerBankRCf)
+
+class ResamplerBankCRf(object):
+    r"""Proxy of C++ ResamplerBank< complex< float >,complex< float >,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, *args):
+        r"""
+        __init__(ResamplerBankCRf self, int upRate, int downRate, float * coefs) -> ResamplerBankCRf
+        __init__(ResamplerBankCRf self, int upRate, int downRate, float * coefs, int * filterIndex) -> ResamplerBankCRf
+        __init__(ResamplerBankCRf self, int upRate, int downRate, float * coefs, int * filterIndex, bool transposed) -> ResamplerBankCRf
+        """
+        _Resampler.ResamplerBankCRf_swiginit(self, _Resampler.new_ResamplerBankCRf(*args))
+    __swig_destroy__ = _Resampler.delete_ResamplerBankCRf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ResamplerBankCRf self, ArrayView< complex< float > const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankCRf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ResamplerBankCRf self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankCRf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerBankCRf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankCRf_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerBankCRf self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerBankCRf_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerBankCRf self) -> int"""
+        return _Resampler.ResamplerBankCRf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ResamplerBankCRf self) -> int"""
+        return _Resampler.ResamplerBankCRf_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(ResamplerBankCRf self) -> int"""
+        return _Resampler.ResamplerBankCRf_filterCount(self)
+
+# Register ResamplerBankCRf in _Resampler:
+_Resampler.ResamplerBankCRf_swigregister(ResamplerBankCRf)
+
+class ResamplerBankCCf(object):
+    r"""Proxy of C++ ResamplerBank< complex< float >,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, *args):
+        r"""
+        __init__(ResamplerBankCCf self, int upRate, int downRate, complex< float > * coefs) -> ResamplerBankCCf
+        __init__(ResamplerBankCCf self, int upRate, int downRate, complex< float > * coefs, int * filterIndex) -> ResamplerBankCCf
+        __init__(ResamplerBankCCf self, int upRate, int downRate, complex< float > * coefs, int * filterIndex, bool transposed) -> ResamplerBankCCf
+        """
+        _Resampler.ResamplerBankCCf_swiginit(self, _Resampler.new_ResamplerBankCCf(*args))
+    __swig_destroy__ = _Resampler.delete_ResamplerBankCCf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ResamplerBankCCf self, ArrayView< complex< float > const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankCCf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ResamplerBankCCf self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankCCf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerBankCCf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankCCf_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerBankCCf self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerBankCCf_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerBankCCf self) -> int"""
+        return _Resampler.ResamplerBankCCf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ResamplerBankCCf self) -> int"""
+        return _Resampler.ResamplerBankCCf_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(ResamplerBankCCf self) -> int"""
+        return _Resampler.ResamplerBankCCf_filterCount(self)
+
+# Register ResamplerBankCCf in _Resampler:
+_Resampler.ResamplerBankCCf_swigregister(ResamplerBankCCf)
+
+class ResamplerHR(object):
+    r"""Proxy of C++ Resampler< short,float,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(ResamplerHR self, int upRate, int downRate, float * coefs) -> ResamplerHR"""
+        _Resampler.ResamplerHR_swiginit(self, _Resampler.new_ResamplerHR(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_ResamplerHR
+
+    def apply(self, _in, out):
+        r"""apply(ResamplerHR self, short * _in, float * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerHR_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ResamplerHR self, float * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerHR_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerHR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerHR_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerHR self) -> int"""
+        return _Resampler.ResamplerHR_coefsPerPhase(self)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerHR self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerHR_setPhase(self, t, xOffset)
+
+# Register ResamplerHR in _Resampler:
+_Resampler.ResamplerHR_swigregister(ResamplerHR)
+
+class ResamplerHC(object):
+    r"""Proxy of C++ Resampler< short,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(ResamplerHC self, int upRate, int downRate, complex< float > * coefs) -> ResamplerHC"""
+        _Resampler.ResamplerHC_swiginit(self, _Resampler.new_ResamplerHC(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_ResamplerHC
+
+    def apply(self, _in, out):
+        r"""apply(ResamplerHC self, short * _in, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerHC_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ResamplerHC self, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerHC_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerHC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerHC_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerHC self) -> int"""
+        return _Resampler.ResamplerHC_coefsPerPhase(self)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerHC self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerHC_setPhase(self, t, xOffset)
+
+# Register ResamplerHC in _Resampler:
+_Resampler.ResamplerHC_swigregister(ResamplerHC)
+
+class ResamplerHH(object):
+    r"""Proxy of C++ Resampler< short,short,float,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(ResamplerHH self, int upRate, int downRate, float * coefs) -> ResamplerHH"""
+        _Resampler.ResamplerHH_swiginit(self, _Resampler.new_ResamplerHH(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_ResamplerHH
+
+    def apply(self, _in, out):
+        r"""apply(ResamplerHH self, short * _in, short * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerHH_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ResamplerHH self, short * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerHH_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerHH self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerHH_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerHH self) -> int"""
+        return _Resampler.ResamplerHH_coefsPerPhase(self)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerHH self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerHH_setPhase(self, t, xOffset)
+
+# Register ResamplerHH in _Resampler:
+_Resampler.ResamplerHH_swigregister(ResamplerHH)
+
+class ResamplerIR(object):
+    r"""Proxy of C++ Resampler< int,double,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(ResamplerIR self, int upRate, int downRate, double * coefs) -> ResamplerIR"""
+        _Resampler.ResamplerIR_swiginit(self, _Resampler.new_ResamplerIR(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_ResamplerIR
+
+    def apply(self, _in, out):
+        r"""apply(ResamplerIR self, int * _in, double * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerIR_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ResamplerIR self, double * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerIR_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerIR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerIR_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerIR self) -> int"""
+        return _Resampler.ResamplerIR_coefsPerPhase(self)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerIR self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerIR_setPhase(self, t, xOffset)
+
+# Register ResamplerIR in _Resampler:
+_Resampler.ResamplerIR_swigregister(ResamplerIR)
+
+class ResamplerIC(object):
+    r"""Proxy of C++ Resampler< int,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(ResamplerIC self, int upRate, int downRate, complex< double > * coefs) -> ResamplerIC"""
+        _Resampler.ResamplerIC_swiginit(self, _Resampler.new_ResamplerIC(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_ResamplerIC
+
+    def apply(self, _in, out):
+        r"""apply(ResamplerIC self, int * _in, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerIC_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ResamplerIC self, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerIC_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerIC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerIC_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerIC self) -> int"""
+        return _Resampler.ResamplerIC_coefsPerPhase(self)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerIC self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerIC_setPhase(self, t, xOffset)
+
+# Register ResamplerIC in _Resampler:
+_Resampler.ResamplerIC_swigregister(ResamplerIC)
+
+class ResamplerII(object):
+    r"""Proxy of C++ Resampler< int,int,double,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(ResamplerII self, int upRate, int downRate, double * coefs) -> ResamplerII"""
+        _Resampler.ResamplerII_swiginit(self, _Resampler.new_ResamplerII(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_ResamplerII
+
+    def apply(self, _in, out):
+        r"""apply(ResamplerII self, int * _in, int * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerII_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ResamplerII self, int * out) -> ptrdiff_t"""
+        return _Resampler.ResamplerII_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerII self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerII_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerII self) -> int"""
+        return _Resampler.ResamplerII_coefsPerPhase(self)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerII self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerII_setPhase(self, t, xOffset)
+
+# Register ResamplerII in _Resampler:
+_Resampler.ResamplerII_swigregister(ResamplerII)
+
+class ResamplerBankHR(object):
+    r"""Proxy of C++ ResamplerBank< short,float,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, *args):
+        r"""
+        __init__(ResamplerBankHR self, int upRate, int downRate, float * coefs) -> ResamplerBankHR
+        __init__(ResamplerBankHR self, int upRate, int downRate, float * coefs, int * filterIndex) -> ResamplerBankHR
+        __init__(ResamplerBankHR self, int upRate, int downRate, float * coefs, int * filterIndex, bool transposed) -> ResamplerBankHR
+        """
+        _Resampler.ResamplerBankHR_swiginit(self, _Resampler.new_ResamplerBankHR(*args))
+    __swig_destroy__ = _Resampler.delete_ResamplerBankHR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ResamplerBankHR self, ArrayView< short const > _in, ArrayView< float > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankHR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ResamplerBankHR self, ArrayView< float > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankHR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerBankHR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankHR_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerBankHR self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerBankHR_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerBankHR self) -> int"""
+        return _Resampler.ResamplerBankHR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ResamplerBankHR self) -> int"""
+        return _Resampler.ResamplerBankHR_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(ResamplerBankHR self) -> int"""
+        return _Resampler.ResamplerBankHR_filterCount(self)
+
+# Register ResamplerBankHR in _Resampler:
+_Resampler.ResamplerBankHR_swigregister(ResamplerBankHR)
+
+class ResamplerBankHC(object):
+    r"""Proxy of C++ ResamplerBank< short,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, *args):
+        r"""
+        __init__(ResamplerBankHC self, int upRate, int downRate, complex< float > * coefs) -> ResamplerBankHC
+        __init__(ResamplerBankHC self, int upRate, int downRate, complex< float > * coefs, int * filterIndex) -> ResamplerBankHC
+        __init__(ResamplerBankHC self, int upRate, int downRate, complex< float > * coefs, int * filterIndex, bool transposed) -> ResamplerBankHC
+        """
+        _Resampler.ResamplerBankHC_swiginit(self, _Resampler.new_ResamplerBankHC(*args))
+    __swig_destroy__ = _Resampler.delete_ResamplerBankHC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ResamplerBankHC self, ArrayView< short const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankHC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ResamplerBankHC self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankHC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerBankHC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankHC_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerBankHC self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerBankHC_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerBankHC self) -> int"""
+        return _Resampler.ResamplerBankHC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ResamplerBankHC self) -> int"""
+        return _Resampler.ResamplerBankHC_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(ResamplerBankHC self) -> int"""
+        return _Resampler.ResamplerBankHC_filterCount(self)
+
+# Register ResamplerBankHC in _Resampler:
+_Resampler.ResamplerBankHC_swigregister(ResamplerBankHC)
+
+class ResamplerBankHH(object):
+    r"""Proxy of C++ ResamplerBank< short,short,float,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, *args):
+        r"""
+        __init__(ResamplerBankHH self, int upRate, int downRate, float * coefs) -> ResamplerBankHH
+        __init__(ResamplerBankHH self, int upRate, int downRate, float * coefs, int * filterIndex) -> ResamplerBankHH
+        __init__(ResamplerBankHH self, int upRate, int downRate, float * coefs, int * filterIndex, bool transposed) -> ResamplerBankHH
+        """
+        _Resampler.ResamplerBankHH_swiginit(self, _Resampler.new_ResamplerBankHH(*args))
+    __swig_destroy__ = _Resampler.delete_ResamplerBankHH
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ResamplerBankHH self, ArrayView< short const > _in, ArrayView< short > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankHH_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ResamplerBankHH self, ArrayView< short > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankHH_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerBankHH self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankHH_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerBankHH self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerBankHH_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerBankHH self) -> int"""
+        return _Resampler.ResamplerBankHH_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ResamplerBankHH self) -> int"""
+        return _Resampler.ResamplerBankHH_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(ResamplerBankHH self) -> int"""
+        return _Resampler.ResamplerBankHH_filterCount(self)
+
+# Register ResamplerBankHH in _Resampler:
+_Resampler.ResamplerBankHH_swigregister(ResamplerBankHH)
+
+class ResamplerBankIR(object):
+    r"""Proxy of C++ ResamplerBank< int,double,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, *args):
+        r"""
+        __init__(ResamplerBankIR self, int upRate, int downRate, double * coefs) -> ResamplerBankIR
+        __init__(ResamplerBankIR self, int upRate, int downRate, double * coefs, int * filterIndex) -> ResamplerBankIR
+        __init__(ResamplerBankIR self, int upRate, int downRate, double * coefs, int * filterIndex, bool transposed) -> ResamplerBankIR
+        """
+        _Resampler.ResamplerBankIR_swiginit(self, _Resampler.new_ResamplerBankIR(*args))
+    __swig_destroy__ = _Resampler.delete_ResamplerBankIR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ResamplerBankIR self, ArrayView< int const > _in, ArrayView< double > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankIR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ResamplerBankIR self, ArrayView< double > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankIR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerBankIR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankIR_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerBankIR self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerBankIR_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerBankIR self) -> int"""
+        return _Resampler.ResamplerBankIR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ResamplerBankIR self) -> int"""
+        return _Resampler.ResamplerBankIR_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(ResamplerBankIR self) -> int"""
+        return _Resampler.ResamplerBankIR_filterCount(self)
+
+# Register ResamplerBankIR in _Resampler:
+_Resampler.ResamplerBankIR_swigregister(ResamplerBankIR)
+
+class ResamplerBankIC(object):
+    r"""Proxy of C++ ResamplerBank< int,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, *args):
+        r"""
+        __init__(ResamplerBankIC self, int upRate, int downRate, complex< double > * coefs) -> ResamplerBankIC
+        __init__(ResamplerBankIC self, int upRate, int downRate, complex< double > * coefs, int * filterIndex) -> ResamplerBankIC
+        __init__(ResamplerBankIC self, int upRate, int downRate, complex< double > * coefs, int * filterIndex, bool transposed) -> ResamplerBankIC
+        """
+        _Resampler.ResamplerBankIC_swiginit(self, _Resampler.new_ResamplerBankIC(*args))
+    __swig_destroy__ = _Resampler.delete_ResamplerBankIC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ResamplerBankIC self, ArrayView< int const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankIC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ResamplerBankIC self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankIC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerBankIC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankIC_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerBankIC self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerBankIC_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerBankIC self) -> int"""
+        return _Resampler.ResamplerBankIC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ResamplerBankIC self) -> int"""
+        return _Resampler.ResamplerBankIC_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(ResamplerBankIC self) -> int"""
+        return _Resampler.ResamplerBankIC_filterCount(self)
+
+# Register ResamplerBankIC in _Resampler:
+_Resampler.ResamplerBankIC_swigregister(ResamplerBankIC)
+
+class ResamplerBankII(object):
+    r"""Proxy of C++ ResamplerBank< int,int,double,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, *args):
+        r"""
+        __init__(ResamplerBankII self, int upRate, int downRate, double * coefs) -> ResamplerBankII
+        __init__(ResamplerBankII self, int upRate, int downRate, double * coefs, int * filterIndex) -> ResamplerBankII
+        __init__(ResamplerBankII self, int upRate, int downRate, double * coefs, int * filterIndex, bool transposed) -> ResamplerBankII
+        """
+        _Resampler.ResamplerBankII_swiginit(self, _Resampler.new_ResamplerBankII(*args))
+    __swig_destroy__ = _Resampler.delete_ResamplerBankII
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ResamplerBankII self, ArrayView< int const > _in, ArrayView< int > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankII_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ResamplerBankII self, ArrayView< int > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankII_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ResamplerBankII self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ResamplerBankII_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(ResamplerBankII self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.ResamplerBankII_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ResamplerBankII self) -> int"""
+        return _Resampler.ResamplerBankII_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ResamplerBankII self) -> int"""
+        return _Resampler.ResamplerBankII_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(ResamplerBankII self) -> int"""
+        return _Resampler.ResamplerBankII_filterCount(self)
+
+# Register ResamplerBankII in _Resampler:
+_Resampler.ResamplerBankII_swigregister(ResamplerBankII)
+
+class FusedResamplerBankRR(object):
+    r"""Proxy of C++ FusedResamplerBank< double,double,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(FusedResamplerBankRR self, int upRate, int downRate, double * coefs) -> FusedResamplerBankRR"""
+        _Resampler.FusedResamplerBankRR_swiginit(self, _Resampler.new_FusedResamplerBankRR(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_FusedResamplerBankRR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(FusedResamplerBankRR self, ArrayView< double const > _in, ArrayView< double > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankRR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(FusedResamplerBankRR self, ArrayView< double > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankRR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(FusedResamplerBankRR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankRR_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(FusedResamplerBankRR self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.FusedResamplerBankRR_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(FusedResamplerBankRR self) -> int"""
+        return _Resampler.FusedResamplerBankRR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(FusedResamplerBankRR self) -> int"""
+        return _Resampler.FusedResamplerBankRR_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(FusedResamplerBankRR self) -> int"""
+        return _Resampler.FusedResamplerBankRR_filterCount(self)
+
+# Register FusedResamplerBankRR in _Resampler:
+_Resampler.FusedResamplerBankRR_swigregister(FusedResamplerBankRR)
+
+class FusedResamplerBankRC(object):
+    r"""Proxy of C++ FusedResamplerBank< double,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(FusedResamplerBankRC self, int upRate, int downRate, complex< double > * coefs) -> FusedResamplerBankRC"""
+        _Resampler.FusedResamplerBankRC_swiginit(self, _Resampler.new_FusedResamplerBankRC(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_FusedResamplerBankRC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(FusedResamplerBankRC self, ArrayView< double const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankRC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(FusedResamplerBankRC self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankRC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(FusedResamplerBankRC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankRC_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(FusedResamplerBankRC self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.FusedResamplerBankRC_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(FusedResamplerBankRC self) -> int"""
+        return _Resampler.FusedResamplerBankRC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(FusedResamplerBankRC self) -> int"""
+        return _Resampler.FusedResamplerBankRC_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(FusedResamplerBankRC self) -> int"""
+        return _Resampler.FusedResamplerBankRC_filterCount(self)
+
+# Register FusedResamplerBankRC in _Resampler:
+_Resampler.FusedResamplerBankRC_swigregister(FusedResamplerBankRC)
+
+class FusedResamplerBankCR(object):
+    r"""Proxy of C++ FusedResamplerBank< complex< double >,complex< double >,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(FusedResamplerBankCR self, int upRate, int downRate, double * coefs) -> FusedResamplerBankCR"""
+        _Resampler.FusedResamplerBankCR_swiginit(self, _Resampler.new_FusedResamplerBankCR(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_FusedResamplerBankCR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(FusedResamplerBankCR self, ArrayView< complex< double > const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankCR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(FusedResamplerBankCR self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankCR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(FusedResamplerBankCR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankCR_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(FusedResamplerBankCR self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.FusedResamplerBankCR_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(FusedResamplerBankCR self) -> int"""
+        return _Resampler.FusedResamplerBankCR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(FusedResamplerBankCR self) -> int"""
+        return _Resampler.FusedResamplerBankCR_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(FusedResamplerBankCR self) -> int"""
+        return _Resampler.FusedResamplerBankCR_filterCount(self)
+
+# Register FusedResamplerBankCR in _Resampler:
+_Resampler.FusedResamplerBankCR_swigregister(FusedResamplerBankCR)
+
+class FusedResamplerBankCC(object):
+    r"""Proxy of C++ FusedResamplerBank< complex< double >,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(FusedResamplerBankCC self, int upRate, int downRate, complex< double > * coefs) -> FusedResamplerBankCC"""
+        _Resampler.FusedResamplerBankCC_swiginit(self, _Resampler.new_FusedResamplerBankCC(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_FusedResamplerBankCC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(FusedResamplerBankCC self, ArrayView< complex< double > const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankCC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(FusedResamplerBankCC self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankCC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(FusedResamplerBankCC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankCC_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(FusedResamplerBankCC self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.FusedResamplerBankCC_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(FusedResamplerBankCC self) -> int"""
+        return _Resampler.FusedResamplerBankCC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(FusedResamplerBankCC self) -> int"""
+        return _Resampler.FusedResamplerBankCC_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(FusedResamplerBankCC self) -> int"""
+        return _Resampler.FusedResamplerBankCC_filterCount(self)
+
+# Register FusedResamplerBankCC in _Resampler:
+_Resampler.FusedResamplerBankCC_swigregister(FusedResamplerBankCC)
+
+class FusedResamplerBankRRf(object):
+    r"""Proxy of C++ FusedResamplerBank< float,float,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(FusedResamplerBankRRf self, int upRate, int downRate, float * coefs) -> FusedResamplerBankRRf"""
+        _Resampler.FusedResamplerBankRRf_swiginit(self, _Resampler.new_FusedResamplerBankRRf(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_FusedResamplerBankRRf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(FusedResamplerBankRRf self, ArrayView< float const > _in, ArrayView< float > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankRRf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(FusedResamplerBankRRf self, ArrayView< float > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankRRf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(FusedResamplerBankRRf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankRRf_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(FusedResamplerBankRRf self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.FusedResamplerBankRRf_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(FusedResamplerBankRRf self) -> int"""
+        return _Resampler.FusedResamplerBankRRf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(FusedResamplerBankRRf self) -> int"""
+        return _Resampler.FusedResamplerBankRRf_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(FusedResamplerBankRRf self) -> int"""
+        return _Resampler.FusedResamplerBankRRf_filterCount(self)
+
+# Register FusedResamplerBankRRf in _Resampler:
+_Resampler.FusedResamplerBankRRf_swigregister(FusedResamplerBankRRf)
+
+class FusedResamplerBankRCf(object):
+    r"""Proxy of C++ FusedResamplerBank< float,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(FusedResamplerBankRCf self, int upRate, int downRate, complex< float > * coefs) -> FusedResamplerBankRCf"""
+        _Resampler.FusedResamplerBankRCf_swiginit(self, _Resampler.new_FusedResamplerBankRCf(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_FusedResamplerBankRCf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(FusedResamplerBankRCf self, ArrayView< float const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankRCf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(FusedResamplerBankRCf self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankRCf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(FusedResamplerBankRCf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankRCf_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(FusedResamplerBankRCf self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.FusedResamplerBankRCf_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(FusedResamplerBankRCf self) -> int"""
+        return _Resampler.FusedResamplerBankRCf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(FusedResamplerBankRCf self) -> int"""
+        return _Resampler.FusedResamplerBankRCf_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(FusedResamplerBankRCf self) -> int"""
+        return _Resampler.FusedResamplerBankRCf_filterCount(self)
+
+# Register FusedResamplerBankRCf in _Resampler:
+_Resampler.FusedResamplerBankRCf_swigregister(FusedResamplerBankRCf)
+
+class FusedResamplerBankCRf(object):
+    r"""Proxy of C++ FusedResamplerBank< complex< float >,complex< float >,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(FusedResamplerBankCRf self, int upRate, int downRate, float * coefs) -> FusedResamplerBankCRf"""
+        _Resampler.FusedResamplerBankCRf_swiginit(self, _Resampler.new_FusedResamplerBankCRf(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_FusedResamplerBankCRf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(FusedResamplerBankCRf self, ArrayView< complex< float > const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankCRf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(FusedResamplerBankCRf self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankCRf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(FusedResamplerBankCRf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankCRf_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(FusedResamplerBankCRf self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.FusedResamplerBankCRf_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(FusedResamplerBankCRf self) -> int"""
+        return _Resampler.FusedResamplerBankCRf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(FusedResamplerBankCRf self) -> int"""
+        return _Resampler.FusedResamplerBankCRf_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(FusedResamplerBankCRf self) -> int"""
+        return _Resampler.FusedResamplerBankCRf_filterCount(self)
+
+# Register FusedResamplerBankCRf in _Resampler:
+_Resampler.FusedResamplerBankCRf_swigregister(FusedResamplerBankCRf)
+
+class FusedResamplerBankCCf(object):
+    r"""Proxy of C++ FusedResamplerBank< complex< float >,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(FusedResamplerBankCCf self, int upRate, int downRate, complex< float > * coefs) -> FusedResamplerBankCCf"""
+        _Resampler.FusedResamplerBankCCf_swiginit(self, _Resampler.new_FusedResamplerBankCCf(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_FusedResamplerBankCCf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(FusedResamplerBankCCf self, ArrayView< complex< float > const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankCCf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(FusedResamplerBankCCf self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankCCf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(FusedResamplerBankCCf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankCCf_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(FusedResamplerBankCCf self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.FusedResamplerBankCCf_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(FusedResamplerBankCCf self) -> int"""
+        return _Resampler.FusedResamplerBankCCf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(FusedResamplerBankCCf self) -> int"""
+        return _Resampler.FusedResamplerBankCCf_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(FusedResamplerBankCCf self) -> int"""
+        return _Resampler.FusedResamplerBankCCf_filterCount(self)
+
+# Register FusedResamplerBankCCf in _Resampler:
+_Resampler.FusedResamplerBankCCf_swigregister(FusedResamplerBankCCf)
+
+class FusedResamplerBankHR(object):
+    r"""Proxy of C++ FusedResamplerBank< short,float,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(FusedResamplerBankHR self, int upRate, int downRate, float * coefs) -> FusedResamplerBankHR"""
+        _Resampler.FusedResamplerBankHR_swiginit(self, _Resampler.new_FusedResamplerBankHR(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_FusedResamplerBankHR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(FusedResamplerBankHR self, ArrayView< short const > _in, ArrayView< float > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankHR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(FusedResamplerBankHR self, ArrayView< float > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankHR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(FusedResamplerBankHR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankHR_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(FusedResamplerBankHR self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.FusedResamplerBankHR_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(FusedResamplerBankHR self) -> int"""
+        return _Resampler.FusedResamplerBankHR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(FusedResamplerBankHR self) -> int"""
+        return _Resampler.FusedResamplerBankHR_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(FusedResamplerBankHR self) -> int"""
+        return _Resampler.FusedResamplerBankHR_filterCount(self)
+
+# Register FusedResamplerBankHR in _Resampler:
+_Resampler.FusedResamplerBankHR_swigregister(FusedResamplerBankHR)
+
+class FusedResamplerBankHC(object):
+    r"""Proxy of C++ FusedResamplerBank< short,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(FusedResamplerBankHC self, int upRate, int downRate, complex< float > * coefs) -> FusedResamplerBankHC"""
+        _Resampler.FusedResamplerBankHC_swiginit(self, _Resampler.new_FusedResamplerBankHC(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_FusedResamplerBankHC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(FusedResamplerBankHC self, ArrayView< short const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankHC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(FusedResamplerBankHC self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankHC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(FusedResamplerBankHC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankHC_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(FusedResamplerBankHC self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.FusedResamplerBankHC_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(FusedResamplerBankHC self) -> int"""
+        return _Resampler.FusedResamplerBankHC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(FusedResamplerBankHC self) -> int"""
+        return _Resampler.FusedResamplerBankHC_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(FusedResamplerBankHC self) -> int"""
+        return _Resampler.FusedResamplerBankHC_filterCount(self)
+
+# Register FusedResamplerBankHC in _Resampler:
+_Resampler.FusedResamplerBankHC_swigregister(FusedResamplerBankHC)
+
+class FusedResamplerBankHH(object):
+    r"""Proxy of C++ FusedResamplerBank< short,short,float,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(FusedResamplerBankHH self, int upRate, int downRate, float * coefs) -> FusedResamplerBankHH"""
+        _Resampler.FusedResamplerBankHH_swiginit(self, _Resampler.new_FusedResamplerBankHH(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_FusedResamplerBankHH
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(FusedResamplerBankHH self, ArrayView< short const > _in, ArrayView< short > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankHH_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(FusedResamplerBankHH self, ArrayView< short > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankHH_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(FusedResamplerBankHH self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankHH_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(FusedResamplerBankHH self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.FusedResamplerBankHH_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(FusedResamplerBankHH self) -> int"""
+        return _Resampler.FusedResamplerBankHH_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(FusedResamplerBankHH self) -> int"""
+        return _Resampler.FusedResamplerBankHH_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(FusedResamplerBankHH self) -> int"""
+        return _Resampler.FusedResamplerBankHH_filterCount(self)
+
+# Register FusedResamplerBankHH in _Resampler:
+_Resampler.FusedResamplerBankHH_swigregister(FusedResamplerBankHH)
+
+class FusedResamplerBankIR(object):
+    r"""Proxy of C++ FusedResamplerBank< int,double,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(FusedResamplerBankIR self, int upRate, int downRate, double * coefs) -> FusedResamplerBankIR"""
+        _Resampler.FusedResamplerBankIR_swiginit(self, _Resampler.new_FusedResamplerBankIR(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_FusedResamplerBankIR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(FusedResamplerBankIR self, ArrayView< int const > _in, ArrayView< double > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankIR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(FusedResamplerBankIR self, ArrayView< double > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankIR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(FusedResamplerBankIR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankIR_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(FusedResamplerBankIR self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.FusedResamplerBankIR_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(FusedResamplerBankIR self) -> int"""
+        return _Resampler.FusedResamplerBankIR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(FusedResamplerBankIR self) -> int"""
+        return _Resampler.FusedResamplerBankIR_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(FusedResamplerBankIR self) -> int"""
+        return _Resampler.FusedResamplerBankIR_filterCount(self)
+
+# Register FusedResamplerBankIR in _Resampler:
+_Resampler.FusedResamplerBankIR_swigregister(FusedResamplerBankIR)
+
+class FusedResamplerBankIC(object):
+    r"""Proxy of C++ FusedResamplerBank< int,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(FusedResamplerBankIC self, int upRate, int downRate, complex< double > * coefs) -> FusedResamplerBankIC"""
+        _Resampler.FusedResamplerBankIC_swiginit(self, _Resampler.new_FusedResamplerBankIC(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_FusedResamplerBankIC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(FusedResamplerBankIC self, ArrayView< int const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankIC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(FusedResamplerBankIC self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankIC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(FusedResamplerBankIC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankIC_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(FusedResamplerBankIC self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.FusedResamplerBankIC_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(FusedResamplerBankIC self) -> int"""
+        return _Resampler.FusedResamplerBankIC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(FusedResamplerBankIC self) -> int"""
+        return _Resampler.FusedResamplerBankIC_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(FusedResamplerBankIC self) -> int"""
+        return _Resampler.FusedResamplerBankIC_filterCount(self)
+
+# Register FusedResamplerBankIC in _Resampler:
+_Resampler.FusedResamplerBankIC_swigregister(FusedResamplerBankIC)
+
+class FusedResamplerBankII(object):
+    r"""Proxy of C++ FusedResamplerBank< int,int,double,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, coefs):
+        r"""__init__(FusedResamplerBankII self, int upRate, int downRate, double * coefs) -> FusedResamplerBankII"""
+        _Resampler.FusedResamplerBankII_swiginit(self, _Resampler.new_FusedResamplerBankII(upRate, downRate, coefs))
+    __swig_destroy__ = _Resampler.delete_FusedResamplerBankII
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(FusedResamplerBankII self, ArrayView< int const > _in, ArrayView< int > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankII_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(FusedResamplerBankII self, ArrayView< int > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankII_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(FusedResamplerBankII self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.FusedResamplerBankII_neededOutCount(self, inCount)
+
+    def setPhase(self, t, xOffset):
+        r"""setPhase(FusedResamplerBankII self, int t, ptrdiff_t xOffset)"""
+        return _Resampler.FusedResamplerBankII_setPhase(self, t, xOffset)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(FusedResamplerBankII self) -> int"""
+        return _Resampler.FusedResamplerBankII_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(FusedResamplerBankII self) -> int"""
+        return _Resampler.FusedResamplerBankII_bankSize(self)
+
+    def filterCount(self):
+        r"""filterCount(FusedResamplerBankII self) -> int"""
+        return _Resampler.FusedResamplerBankII_filterCount(self)
+
+# Register FusedResamplerBankII in _Resampler:
+_Resampler.FusedResamplerBankII_swigregister(FusedResamplerBankII)
+
+class ChannelizerRR(object):
+    r"""Proxy of C++ Channelizer< double,double,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, channelCount, coefs):
+        r"""__init__(ChannelizerRR self, int channelCount, double * coefs) -> ChannelizerRR"""
+        _Resampler.ChannelizerRR_swiginit(self, _Resampler.new_ChannelizerRR(channelCount, coefs))
+    __swig_destroy__ = _Resampler.delete_ChannelizerRR
+
+    def apply(self, _in, out):
+        r"""apply(ChannelizerRR self, ArrayView< double const > _in, ArrayView< double > out) -> ptrdiff_t"""
+        return _Resampler.ChannelizerRR_apply(self, _in, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ChannelizerRR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ChannelizerRR_neededOutCount(self, inCount)
+
+    def channelCount(self):
+        r"""channelCount(ChannelizerRR self) -> int"""
+        return _Resampler.ChannelizerRR_channelCount(self)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ChannelizerRR self) -> int"""
+        return _Resampler.ChannelizerRR_coefsPerPhase(self)
+
+# Register ChannelizerRR in _Resampler:
+_Resampler.ChannelizerRR_swigregister(ChannelizerRR)
+
+class ChannelizerRC(object):
+    r"""Proxy of C++ Channelizer< double,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, channelCount, coefs):
+        r"""__init__(ChannelizerRC self, int channelCount, complex< double > * coefs) -> ChannelizerRC"""
+        _Resampler.ChannelizerRC_swiginit(self, _Resampler.new_ChannelizerRC(channelCount, coefs))
+    __swig_destroy__ = _Resampler.delete_ChannelizerRC
+
+    def apply(self, _in, out):
+        r"""apply(ChannelizerRC self, ArrayView< double const > _in, ArrayView< complex< double > > out) -> ptrdiff_t"""
+        return _Resampler.ChannelizerRC_apply(self, _in, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ChannelizerRC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ChannelizerRC_neededOutCount(self, inCount)
+
+    def channelCount(self):
+        r"""channelCount(ChannelizerRC self) -> int"""
+        return _Resampler.ChannelizerRC_channelCount(self)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ChannelizerRC self) -> int"""
+        return _Resampler.ChannelizerRC_coefsPerPhase(self)
+
+# Register ChannelizerRC in _Resampler:
+_Resampler.ChannelizerRC_swigregister(ChannelizerRC)
+
+class ChannelizerCR(object):
+    r"""Proxy of C++ Channelizer< complex< double >,complex< double >,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, channelCount, coefs):
+        r"""__init__(ChannelizerCR self, int channelCount, double * coefs) -> ChannelizerCR"""
+        _Resampler.ChannelizerCR_swiginit(self, _Resampler.new_ChannelizerCR(channelCount, coefs))
+    __swig_destroy__ = _Resampler.delete_ChannelizerCR
+
+    def apply(self, _in, out):
+        r"""apply(ChannelizerCR self, ArrayView< complex< double > const > _in, ArrayView< complex< double > > out) -> ptrdiff_t"""
+        return _Resampler.ChannelizerCR_apply(self, _in, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ChannelizerCR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ChannelizerCR_neededOutCount(self, inCount)
+
+    def channelCount(self):
+        r"""channelCount(ChannelizerCR self) -> int"""
+        return _Resampler.ChannelizerCR_channelCount(self)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ChannelizerCR self) -> int"""
+        return _Resampler.ChannelizerCR_coefsPerPhase(self)
+
+# Register ChannelizerCR in _Resampler:
+_Resampler.ChannelizerCR_swigregister(ChannelizerCR)
+
+class ChannelizerCC(object):
+    r"""Proxy of C++ Channelizer< complex< double >,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, channelCount, coefs):
+        r"""__init__(ChannelizerCC self, int channelCount, complex< double > * coefs) -> ChannelizerCC"""
+        _Resampler.ChannelizerCC_swiginit(self, _Resampler.new_ChannelizerCC(channelCount, coefs))
+    __swig_destroy__ = _Resampler.delete_ChannelizerCC
+
+    def apply(self, _in, out):
+        r"""apply(ChannelizerCC self, ArrayView< complex< double > const > _in, ArrayView< complex< double > > out) -> ptrdiff_t"""
+        return _Resampler.ChannelizerCC_apply(self, _in, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ChannelizerCC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ChannelizerCC_neededOutCount(self, inCount)
+
+    def channelCount(self):
+        r"""channelCount(ChannelizerCC self) -> int"""
+        return _Resampler.ChannelizerCC_channelCount(self)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ChannelizerCC self) -> int"""
+        return _Resampler.ChannelizerCC_coefsPerPhase(self)
+
+# Register ChannelizerCC in _Resampler:
+_Resampler.ChannelizerCC_swigregister(ChannelizerCC)
+
+class ChannelizerRRf(object):
+    r"""Proxy of C++ Channelizer< float,float,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, channelCount, coefs):
+        r"""__init__(ChannelizerRRf self, int channelCount, float * coefs) -> ChannelizerRRf"""
+        _Resampler.ChannelizerRRf_swiginit(self, _Resampler.new_ChannelizerRRf(channelCount, coefs))
+    __swig_destroy__ = _Resampler.delete_ChannelizerRRf
+
+    def apply(self, _in, out):
+        r"""apply(ChannelizerRRf self, ArrayView< float const > _in, ArrayView< float > out) -> ptrdiff_t"""
+        return _Resampler.ChannelizerRRf_apply(self, _in, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ChannelizerRRf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ChannelizerRRf_neededOutCount(self, inCount)
+
+    def channelCount(self):
+        r"""channelCount(ChannelizerRRf self) -> int"""
+        return _Resampler.ChannelizerRRf_channelCount(self)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ChannelizerRRf self) -> int"""
+        return _Resampler.ChannelizerRRf_coefsPerPhase(self)
+
+# Register ChannelizerRRf in _Resampler:
+_Resampler.ChannelizerRRf_swigregister(ChannelizerRRf)
+
+class ChannelizerRCf(object):
+    r"""Proxy of C++ Channelizer< float,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, channelCount, coefs):
+        r"""__init__(ChannelizerRCf self, int channelCount, complex< float > * coefs) -> ChannelizerRCf"""
+        _Resampler.ChannelizerRCf_swiginit(self, _Resampler.new_ChannelizerRCf(channelCount, coefs))
+    __swig_destroy__ = _Resampler.delete_ChannelizerRCf
+
+    def apply(self, _in, out):
+        r"""apply(ChannelizerRCf self, ArrayView< float const > _in, ArrayView< complex< float > > out) -> ptrdiff_t"""
+        return _Resampler.ChannelizerRCf_apply(self, _in, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ChannelizerRCf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ChannelizerRCf_neededOutCount(self, inCount)
+
+    def channelCount(self):
+        r"""channelCount(ChannelizerRCf self) -> int"""
+        return _Resampler.ChannelizerRCf_channelCount(self)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ChannelizerRCf self) -> int"""
+        return _Resampler.ChannelizerRCf_coefsPerPhase(self)
+
+# Register ChannelizerRCf in _Resampler:
+_Resampler.ChannelizerRCf_swigregister(ChannelizerRCf)
+
+class ChannelizerCRf(object):
+    r"""Proxy of C++ Channelizer< complex< float >,complex< float >,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, channelCount, coefs):
+        r"""__init__(ChannelizerCRf self, int channelCount, float * coefs) -> ChannelizerCRf"""
+        _Resampler.ChannelizerCRf_swiginit(self, _Resampler.new_ChannelizerCRf(channelCount, coefs))
+    __swig_destroy__ = _Resampler.delete_ChannelizerCRf
+
+    def apply(self, _in, out):
+        r"""apply(ChannelizerCRf self, ArrayView< complex< float > const > _in, ArrayView< complex< float > > out) -> ptrdiff_t"""
+        return _Resampler.ChannelizerCRf_apply(self, _in, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ChannelizerCRf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ChannelizerCRf_neededOutCount(self, inCount)
+
+    def channelCount(self):
+        r"""channelCount(ChannelizerCRf self) -> int"""
+        return _Resampler.ChannelizerCRf_channelCount(self)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ChannelizerCRf self) -> int"""
+        return _Resampler.ChannelizerCRf_coefsPerPhase(self)
+
+# Register ChannelizerCRf in _Resampler:
+_Resampler.ChannelizerCRf_swigregister(ChannelizerCRf)
+
+class ChannelizerCCf(object):
+    r"""Proxy of C++ Channelizer< complex< float >,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, channelCount, coefs):
+        r"""__init__(ChannelizerCCf self, int channelCount, complex< float > * coefs) -> ChannelizerCCf"""
+        _Resampler.ChannelizerCCf_swiginit(self, _Resampler.new_ChannelizerCCf(channelCount, coefs))
+    __swig_destroy__ = _Resampler.delete_ChannelizerCCf
+
+    def apply(self, _in, out):
+        r"""apply(ChannelizerCCf self, ArrayView< complex< float > const > _in, ArrayView< complex< float > > out) -> ptrdiff_t"""
+        return _Resampler.ChannelizerCCf_apply(self, _in, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(ChannelizerCCf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.ChannelizerCCf_neededOutCount(self, inCount)
+
+    def channelCount(self):
+        r"""channelCount(ChannelizerCCf self) -> int"""
+        return _Resampler.ChannelizerCCf_channelCount(self)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ChannelizerCCf self) -> int"""
+        return _Resampler.ChannelizerCCf_coefsPerPhase(self)
+
+# Register ChannelizerCCf in _Resampler:
+_Resampler.ChannelizerCCf_swigregister(ChannelizerCCf)
+
+class ArbitraryResamplerRR(object):
+    r"""Proxy of C++ ArbitraryResampler< double,double,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs):
+        r"""__init__(ArbitraryResamplerRR self, int upRate, double ratio, double * coefs) -> ArbitraryResamplerRR"""
+        _Resampler.ArbitraryResamplerRR_swiginit(self, _Resampler.new_ArbitraryResamplerRR(upRate, ratio, coefs))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerRR
+
+    def apply(self, _in, out):
+        r"""apply(ArbitraryResamplerRR self, double * _in, double * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerRR_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ArbitraryResamplerRR self, double * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerRR_flush(self, out)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerRR self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerRR self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerRR_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerRR self) -> int"""
+        return _Resampler.ArbitraryResamplerRR_coefsPerPhase(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerRR self) -> double"""
+        return _Resampler.ArbitraryResamplerRR_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerRR self, double ratio)"""
+        return _Resampler.ArbitraryResamplerRR_setRatio(self, ratio)
+
+# Register ArbitraryResamplerRR in _Resampler:
+_Resampler.ArbitraryResamplerRR_swigregister(ArbitraryResamplerRR)
+
+class ArbitraryResamplerRC(object):
+    r"""Proxy of C++ ArbitraryResampler< double,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs):
+        r"""__init__(ArbitraryResamplerRC self, int upRate, double ratio, complex< double > * coefs) -> ArbitraryResamplerRC"""
+        _Resampler.ArbitraryResamplerRC_swiginit(self, _Resampler.new_ArbitraryResamplerRC(upRate, ratio, coefs))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerRC
+
+    def apply(self, _in, out):
+        r"""apply(ArbitraryResamplerRC self, double * _in, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerRC_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ArbitraryResamplerRC self, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerRC_flush(self, out)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerRC self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerRC self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerRC_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerRC self) -> int"""
+        return _Resampler.ArbitraryResamplerRC_coefsPerPhase(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerRC self) -> double"""
+        return _Resampler.ArbitraryResamplerRC_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerRC self, double ratio)"""
+        return _Resampler.ArbitraryResamplerRC_setRatio(self, ratio)
+
+# Register ArbitraryResamplerRC in _Resampler:
+_Resampler.ArbitraryResamplerRC_swigregister(ArbitraryResamplerRC)
+
+class ArbitraryResamplerCR(object):
+    r"""Proxy of C++ ArbitraryResampler< complex< double >,complex< double >,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs):
+        r"""__init__(ArbitraryResamplerCR self, int upRate, double ratio, double * coefs) -> ArbitraryResamplerCR"""
+        _Resampler.ArbitraryResamplerCR_swiginit(self, _Resampler.new_ArbitraryResamplerCR(upRate, ratio, coefs))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerCR
+
+    def apply(self, _in, out):
+        r"""apply(ArbitraryResamplerCR self, complex< double > * _in, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerCR_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ArbitraryResamplerCR self, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerCR_flush(self, out)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerCR self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerCR self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerCR_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerCR self) -> int"""
+        return _Resampler.ArbitraryResamplerCR_coefsPerPhase(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerCR self) -> double"""
+        return _Resampler.ArbitraryResamplerCR_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerCR self, double ratio)"""
+        return _Resampler.ArbitraryResamplerCR_setRatio(self, ratio)
+
+# Register ArbitraryResamplerCR in _Resampler:
+_Resampler.ArbitraryResamplerCR_swigregister(ArbitraryResamplerCR)
+
+class ArbitraryResamplerCC(object):
+    r"""Proxy of C++ ArbitraryResampler< complex< double >,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs):
+        r"""__init__(ArbitraryResamplerCC self, int upRate, double ratio, complex< double > * coefs) -> ArbitraryResamplerCC"""
+        _Resampler.ArbitraryResamplerCC_swiginit(self, _Resampler.new_ArbitraryResamplerCC(upRate, ratio, coefs))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerCC
+
+    def apply(self, _in, out):
+        r"""apply(ArbitraryResamplerCC self, complex< double > * _in, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerCC_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ArbitraryResamplerCC self, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerCC_flush(self, out)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerCC self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerCC self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerCC_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerCC self) -> int"""
+        return _Resampler.ArbitraryResamplerCC_coefsPerPhase(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerCC self) -> double"""
+        return _Resampler.ArbitraryResamplerCC_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerCC self, double ratio)"""
+        return _Resampler.ArbitraryResamplerCC_setRatio(self, ratio)
+
+# Register ArbitraryResamplerCC in _Resampler:
+_Resampler.ArbitraryResamplerCC_swigregister(ArbitraryResamplerCC)
+
+class ArbitraryResamplerRRf(object):
+    r"""Proxy of C++ ArbitraryResampler< float,float,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs):
+        r"""__init__(ArbitraryResamplerRRf self, int upRate, double ratio, float * coefs) -> ArbitraryResamplerRRf"""
+        _Resampler.ArbitraryResamplerRRf_swiginit(self, _Resampler.new_ArbitraryResamplerRRf(upRate, ratio, coefs))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerRRf
+
+    def apply(self, _in, out):
+        r"""apply(ArbitraryResamplerRRf self, float * _in, float * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerRRf_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ArbitraryResamplerRRf self, float * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerRRf_flush(self, out)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerRRf self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerRRf self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerRRf_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerRRf self) -> int"""
+        return _Resampler.ArbitraryResamplerRRf_coefsPerPhase(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerRRf self) -> double"""
+        return _Resampler.ArbitraryResamplerRRf_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerRRf self, double ratio)"""
+        return _Resampler.ArbitraryResamplerRRf_setRatio(self, ratio)
+
+# Register ArbitraryResamplerRRf in _Resampler:
+_Resampler.ArbitraryResamplerRRf_swigregister(ArbitraryResamplerRRf)
+
+class ArbitraryResamplerRCf(object):
+    r"""Proxy of C++ ArbitraryResampler< float,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs):
+        r"""__init__(ArbitraryResamplerRCf self, int upRate, double ratio, complex< float > * coefs) -> ArbitraryResamplerRCf"""
+        _Resampler.ArbitraryResamplerRCf_swiginit(self, _Resampler.new_ArbitraryResamplerRCf(upRate, ratio, coefs))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerRCf
+
+    def apply(self, _in, out):
+        r"""apply(ArbitraryResamplerRCf self, float * _in, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerRCf_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ArbitraryResamplerRCf self, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerRCf_flush(self, out)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerRCf self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerRCf self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerRCf_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerRCf self) -> int"""
+        return _Resampler.ArbitraryResamplerRCf_coefsPerPhase(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerRCf self) -> double"""
+        return _Resampler.ArbitraryResamplerRCf_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerRCf self, double ratio)"""
+        return _Resampler.ArbitraryResamplerRCf_setRatio(self, ratio)
+
+# Register ArbitraryResamplerRCf in _Resampler:
+_Resampler.ArbitraryResamplerRCf_swigregister(ArbitraryResamplerRCf)
+
+class ArbitraryResamplerCRf(object):
+    r"""Proxy of C++ ArbitraryResampler< complex< float >,complex< float >,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs):
+        r"""__init__(ArbitraryResamplerCRf self, int upRate, double ratio, float * coefs) -> ArbitraryResamplerCRf"""
+        _Resampler.ArbitraryResamplerCRf_swiginit(self, _Resampler.new_ArbitraryResamplerCRf(upRate, ratio, coefs))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerCRf
+
+    def apply(self, _in, out):
+        r"""apply(ArbitraryResamplerCRf self, complex< float > * _in, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerCRf_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ArbitraryResamplerCRf self, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerCRf_flush(self, out)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerCRf self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerCRf self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerCRf_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerCRf self) -> int"""
+        return _Resampler.ArbitraryResamplerCRf_coefsPerPhase(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerCRf self) -> double"""
+        return _Resampler.ArbitraryResamplerCRf_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerCRf self, double ratio)"""
+        return _Resampler.ArbitraryResamplerCRf_setRatio(self, ratio)
+
+# Register ArbitraryResamplerCRf in _Resampler:
+_Resampler.ArbitraryResamplerCRf_swigregister(ArbitraryResamplerCRf)
+
+class ArbitraryResamplerCCf(object):
+    r"""Proxy of C++ ArbitraryResampler< complex< float >,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs):
+        r"""__init__(ArbitraryResamplerCCf self, int upRate, double ratio, complex< float > * coefs) -> ArbitraryResamplerCCf"""
+        _Resampler.ArbitraryResamplerCCf_swiginit(self, _Resampler.new_ArbitraryResamplerCCf(upRate, ratio, coefs))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerCCf
+
+    def apply(self, _in, out):
+        r"""apply(ArbitraryResamplerCCf self, complex< float > * _in, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerCCf_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(ArbitraryResamplerCCf self, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerCCf_flush(self, out)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerCCf self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerCCf self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerCCf_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerCCf self) -> int"""
+        return _Resampler.ArbitraryResamplerCCf_coefsPerPhase(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerCCf self) -> double"""
+        return _Resampler.ArbitraryResamplerCCf_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerCCf self, double ratio)"""
+        return _Resampler.ArbitraryResamplerCCf_setRatio(self, ratio)
+
+# Register ArbitraryResamplerCCf in _Resampler:
+_Resampler.ArbitraryResamplerCCf_swigregister(ArbitraryResamplerCCf)
+
+class ArbitraryResamplerBankRR(object):
+    r"""Proxy of C++ ArbitraryResamplerBank< double,double,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs, bankSize):
+        r"""__init__(ArbitraryResamplerBankRR self, int upRate, double ratio, double * coefs, int bankSize) -> ArbitraryResamplerBankRR"""
+        _Resampler.ArbitraryResamplerBankRR_swiginit(self, _Resampler.new_ArbitraryResamplerBankRR(upRate, ratio, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerBankRR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ArbitraryResamplerBankRR self, ArrayView< double const > _in, ArrayView< double > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankRR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ArbitraryResamplerBankRR self, ArrayView< double > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankRR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerBankRR self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerBankRR self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerBankRR_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerBankRR self) -> int"""
+        return _Resampler.ArbitraryResamplerBankRR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ArbitraryResamplerBankRR self) -> int"""
+        return _Resampler.ArbitraryResamplerBankRR_bankSize(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerBankRR self) -> double"""
+        return _Resampler.ArbitraryResamplerBankRR_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerBankRR self, double ratio)"""
+        return _Resampler.ArbitraryResamplerBankRR_setRatio(self, ratio)
+
+# Register ArbitraryResamplerBankRR in _Resampler:
+_Resampler.ArbitraryResamplerBankRR_swigregister(ArbitraryResamplerBankRR)
+
+class ArbitraryResamplerBankRC(object):
+    r"""Proxy of C++ ArbitraryResamplerBank< double,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs, bankSize):
+        r"""__init__(ArbitraryResamplerBankRC self, int upRate, double ratio, complex< double > * coefs, int bankSize) -> ArbitraryResamplerBankRC"""
+        _Resampler.ArbitraryResamplerBankRC_swiginit(self, _Resampler.new_ArbitraryResamplerBankRC(upRate, ratio, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerBankRC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ArbitraryResamplerBankRC self, ArrayView< double const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankRC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ArbitraryResamplerBankRC self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankRC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerBankRC self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerBankRC self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerBankRC_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerBankRC self) -> int"""
+        return _Resampler.ArbitraryResamplerBankRC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ArbitraryResamplerBankRC self) -> int"""
+        return _Resampler.ArbitraryResamplerBankRC_bankSize(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerBankRC self) -> double"""
+        return _Resampler.ArbitraryResamplerBankRC_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerBankRC self, double ratio)"""
+        return _Resampler.ArbitraryResamplerBankRC_setRatio(self, ratio)
+
+# Register ArbitraryResamplerBankRC in _Resampler:
+_Resampler.ArbitraryResamplerBankRC_swigregister(ArbitraryResamplerBankRC)
+
+class ArbitraryResamplerBankCR(object):
+    r"""Proxy of C++ ArbitraryResamplerBank< complex< double >,complex< double >,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs, bankSize):
+        r"""__init__(ArbitraryResamplerBankCR self, int upRate, double ratio, double * coefs, int bankSize) -> ArbitraryResamplerBankCR"""
+        _Resampler.ArbitraryResamplerBankCR_swiginit(self, _Resampler.new_ArbitraryResamplerBankCR(upRate, ratio, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerBankCR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ArbitraryResamplerBankCR self, ArrayView< complex< double > const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankCR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ArbitraryResamplerBankCR self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankCR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerBankCR self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerBankCR self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerBankCR_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerBankCR self) -> int"""
+        return _Resampler.ArbitraryResamplerBankCR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ArbitraryResamplerBankCR self) -> int"""
+        return _Resampler.ArbitraryResamplerBankCR_bankSize(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerBankCR self) -> double"""
+        return _Resampler.ArbitraryResamplerBankCR_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerBankCR self, double ratio)"""
+        return _Resampler.ArbitraryResamplerBankCR_setRatio(self, ratio)
+
+# Register ArbitraryResamplerBankCR in _Resampler:
+_Resampler.ArbitraryResamplerBankCR_swigregister(ArbitraryResamplerBankCR)
+
+class ArbitraryResamplerBankCC(object):
+    r"""Proxy of C++ ArbitraryResamplerBank< complex< double >,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs, bankSize):
+        r"""__init__(ArbitraryResamplerBankCC self, int upRate, double ratio, complex< double > * coefs, int bankSize) -> ArbitraryResamplerBankCC"""
+        _Resampler.ArbitraryResamplerBankCC_swiginit(self, _Resampler.new_ArbitraryResamplerBankCC(upRate, ratio, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerBankCC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ArbitraryResamplerBankCC self, ArrayView< complex< double > const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankCC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ArbitraryResamplerBankCC self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankCC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerBankCC self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerBankCC self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerBankCC_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerBankCC self) -> int"""
+        return _Resampler.ArbitraryResamplerBankCC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ArbitraryResamplerBankCC self) -> int"""
+        return _Resampler.ArbitraryResamplerBankCC_bankSize(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerBankCC self) -> double"""
+        return _Resampler.ArbitraryResamplerBankCC_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerBankCC self, double ratio)"""
+        return _Resampler.ArbitraryResamplerBankCC_setRatio(self, ratio)
+
+# Register ArbitraryResamplerBankCC in _Resampler:
+_Resampler.ArbitraryResamplerBankCC_swigregister(ArbitraryResamplerBankCC)
+
+class ArbitraryResamplerBankRRf(object):
+    r"""Proxy of C++ ArbitraryResamplerBank< float,float,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs, bankSize):
+        r"""__init__(ArbitraryResamplerBankRRf self, int upRate, double ratio, float * coefs, int bankSize) -> ArbitraryResamplerBankRRf"""
+        _Resampler.ArbitraryResamplerBankRRf_swiginit(self, _Resampler.new_ArbitraryResamplerBankRRf(upRate, ratio, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerBankRRf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ArbitraryResamplerBankRRf self, ArrayView< float const > _in, ArrayView< float > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankRRf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ArbitraryResamplerBankRRf self, ArrayView< float > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankRRf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerBankRRf self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerBankRRf self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerBankRRf_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerBankRRf self) -> int"""
+        return _Resampler.ArbitraryResamplerBankRRf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ArbitraryResamplerBankRRf self) -> int"""
+        return _Resampler.ArbitraryResamplerBankRRf_bankSize(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerBankRRf self) -> double"""
+        return _Resampler.ArbitraryResamplerBankRRf_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerBankRRf self, double ratio)"""
+        return _Resampler.ArbitraryResamplerBankRRf_setRatio(self, ratio)
+
+# Register ArbitraryResamplerBankRRf in _Resampler:
+_Resampler.ArbitraryResamplerBankRRf_swigregister(ArbitraryResamplerBankRRf)
+
+class ArbitraryResamplerBankRCf(object):
+    r"""Proxy of C++ ArbitraryResamplerBank< float,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs, bankSize):
+        r"""__init__(ArbitraryResamplerBankRCf self, int upRate, double ratio, complex< float > * coefs, int bankSize) -> ArbitraryResamplerBankRCf"""
+        _Resampler.ArbitraryResamplerBankRCf_swiginit(self, _Resampler.new_ArbitraryResamplerBankRCf(upRate, ratio, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerBankRCf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ArbitraryResamplerBankRCf self, ArrayView< float const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankRCf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ArbitraryResamplerBankRCf self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankRCf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerBankRCf self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerBankRCf self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerBankRCf_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerBankRCf self) -> int"""
+        return _Resampler.ArbitraryResamplerBankRCf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ArbitraryResamplerBankRCf self) -> int"""
+        return _Resampler.ArbitraryResamplerBankRCf_bankSize(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerBankRCf self) -> double"""
+        return _Resampler.ArbitraryResamplerBankRCf_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerBankRCf self, double ratio)"""
+        return _Resampler.ArbitraryResamplerBankRCf_setRatio(self, ratio)
+
+# Register ArbitraryResamplerBankRCf in _Resampler:
+_Resampler.ArbitraryResamplerBankRCf_swigregister(ArbitraryResamplerBankRCf)
+
+class ArbitraryResamplerBankCRf(object):
+    r"""Proxy of C++ ArbitraryResamplerBank< complex< float >,complex< float >,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs, bankSize):
+        r"""__init__(ArbitraryResamplerBankCRf self, int upRate, double ratio, float * coefs, int bankSize) -> ArbitraryResamplerBankCRf"""
+        _Resampler.ArbitraryResamplerBankCRf_swiginit(self, _Resampler.new_ArbitraryResamplerBankCRf(upRate, ratio, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerBankCRf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ArbitraryResamplerBankCRf self, ArrayView< complex< float > const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankCRf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ArbitraryResamplerBankCRf self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankCRf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerBankCRf self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerBankCRf self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerBankCRf_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerBankCRf self) -> int"""
+        return _Resampler.ArbitraryResamplerBankCRf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ArbitraryResamplerBankCRf self) -> int"""
+        return _Resampler.ArbitraryResamplerBankCRf_bankSize(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerBankCRf self) -> double"""
+        return _Resampler.ArbitraryResamplerBankCRf_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerBankCRf self, double ratio)"""
+        return _Resampler.ArbitraryResamplerBankCRf_setRatio(self, ratio)
+
+# Register ArbitraryResamplerBankCRf in _Resampler:
+_Resampler.ArbitraryResamplerBankCRf_swigregister(ArbitraryResamplerBankCRf)
+
+class ArbitraryResamplerBankCCf(object):
+    r"""Proxy of C++ ArbitraryResamplerBank< complex< float >,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs, bankSize):
+        r"""__init__(ArbitraryResamplerBankCCf self, int upRate, double ratio, complex< float > * coefs, int bankSize) -> ArbitraryResamplerBankCCf"""
+        _Resampler.ArbitraryResamplerBankCCf_swiginit(self, _Resampler.new_ArbitraryResamplerBankCCf(upRate, ratio, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerBankCCf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ArbitraryResamplerBankCCf self, ArrayView< complex< float > const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankCCf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ArbitraryResamplerBankCCf self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankCCf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerBankCCf self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerBankCCf self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerBankCCf_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerBankCCf self) -> int"""
+        return _Resampler.ArbitraryResamplerBankCCf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ArbitraryResamplerBankCCf self) -> int"""
+        return _Resampler.ArbitraryResamplerBankCCf_bankSize(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerBankCCf self) -> double"""
+        return _Resampler.ArbitraryResamplerBankCCf_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerBankCCf self, double ratio)"""
+        return _Resampler.ArbitraryResamplerBankCCf_setRatio(self, ratio)
+
+# Register ArbitraryResamplerBankCCf in _Resampler:
+_Resampler.ArbitraryResamplerBankCCf_swigregister(ArbitraryResamplerBankCCf)
+
+class ArbitraryResamplerBankHR(object):
+    r"""Proxy of C++ ArbitraryResamplerBank< short,float,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs, bankSize):
+        r"""__init__(ArbitraryResamplerBankHR self, int upRate, double ratio, float * coefs, int bankSize) -> ArbitraryResamplerBankHR"""
+        _Resampler.ArbitraryResamplerBankHR_swiginit(self, _Resampler.new_ArbitraryResamplerBankHR(upRate, ratio, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerBankHR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ArbitraryResamplerBankHR self, ArrayView< short const > _in, ArrayView< float > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankHR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ArbitraryResamplerBankHR self, ArrayView< float > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankHR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerBankHR self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerBankHR self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerBankHR_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerBankHR self) -> int"""
+        return _Resampler.ArbitraryResamplerBankHR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ArbitraryResamplerBankHR self) -> int"""
+        return _Resampler.ArbitraryResamplerBankHR_bankSize(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerBankHR self) -> double"""
+        return _Resampler.ArbitraryResamplerBankHR_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerBankHR self, double ratio)"""
+        return _Resampler.ArbitraryResamplerBankHR_setRatio(self, ratio)
+
+# Register ArbitraryResamplerBankHR in _Resampler:
+_Resampler.ArbitraryResamplerBankHR_swigregister(ArbitraryResamplerBankHR)
+
+class ArbitraryResamplerBankHC(object):
+    r"""Proxy of C++ ArbitraryResamplerBank< short,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs, bankSize):
+        r"""__init__(ArbitraryResamplerBankHC self, int upRate, double ratio, complex< float > * coefs, int bankSize) -> ArbitraryResamplerBankHC"""
+        _Resampler.ArbitraryResamplerBankHC_swiginit(self, _Resampler.new_ArbitraryResamplerBankHC(upRate, ratio, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerBankHC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ArbitraryResamplerBankHC self, ArrayView< short const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankHC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ArbitraryResamplerBankHC self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankHC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerBankHC self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerBankHC self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerBankHC_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerBankHC self) -> int"""
+        return _Resampler.ArbitraryResamplerBankHC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ArbitraryResamplerBankHC self) -> int"""
+        return _Resampler.ArbitraryResamplerBankHC_bankSize(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerBankHC self) -> double"""
+        return _Resampler.ArbitraryResamplerBankHC_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerBankHC self, double ratio)"""
+        return _Resampler.ArbitraryResamplerBankHC_setRatio(self, ratio)
+
+# Register ArbitraryResamplerBankHC in _Resampler:
+_Resampler.ArbitraryResamplerBankHC_swigregister(ArbitraryResamplerBankHC)
+
+class ArbitraryResamplerBankIR(object):
+    r"""Proxy of C++ ArbitraryResamplerBank< int,double,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs, bankSize):
+        r"""__init__(ArbitraryResamplerBankIR self, int upRate, double ratio, double * coefs, int bankSize) -> ArbitraryResamplerBankIR"""
+        _Resampler.ArbitraryResamplerBankIR_swiginit(self, _Resampler.new_ArbitraryResamplerBankIR(upRate, ratio, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerBankIR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ArbitraryResamplerBankIR self, ArrayView< int const > _in, ArrayView< double > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankIR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ArbitraryResamplerBankIR self, ArrayView< double > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankIR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerBankIR self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerBankIR self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerBankIR_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerBankIR self) -> int"""
+        return _Resampler.ArbitraryResamplerBankIR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ArbitraryResamplerBankIR self) -> int"""
+        return _Resampler.ArbitraryResamplerBankIR_bankSize(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerBankIR self) -> double"""
+        return _Resampler.ArbitraryResamplerBankIR_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerBankIR self, double ratio)"""
+        return _Resampler.ArbitraryResamplerBankIR_setRatio(self, ratio)
+
+# Register ArbitraryResamplerBankIR in _Resampler:
+_Resampler.ArbitraryResamplerBankIR_swigregister(ArbitraryResamplerBankIR)
+
+class ArbitraryResamplerBankIC(object):
+    r"""Proxy of C++ ArbitraryResamplerBank< int,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, ratio, coefs, bankSize):
+        r"""__init__(ArbitraryResamplerBankIC self, int upRate, double ratio, complex< double > * coefs, int bankSize) -> ArbitraryResamplerBankIC"""
+        _Resampler.ArbitraryResamplerBankIC_swiginit(self, _Resampler.new_ArbitraryResamplerBankIC(upRate, ratio, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_ArbitraryResamplerBankIC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(ArbitraryResamplerBankIC self, ArrayView< int const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankIC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(ArbitraryResamplerBankIC self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.ArbitraryResamplerBankIC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, *args):
+        r"""
+        neededOutCount(ArbitraryResamplerBankIC self, ptrdiff_t inCount) -> ptrdiff_t
+        neededOutCount(ArbitraryResamplerBankIC self, ptrdiff_t inCount, bool flush) -> ptrdiff_t
+        """
+        return _Resampler.ArbitraryResamplerBankIC_neededOutCount(self, *args)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(ArbitraryResamplerBankIC self) -> int"""
+        return _Resampler.ArbitraryResamplerBankIC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(ArbitraryResamplerBankIC self) -> int"""
+        return _Resampler.ArbitraryResamplerBankIC_bankSize(self)
+
+    def ratio(self):
+        r"""ratio(ArbitraryResamplerBankIC self) -> double"""
+        return _Resampler.ArbitraryResamplerBankIC_ratio(self)
+
+    def setRatio(self, ratio):
+        r"""setRatio(ArbitraryResamplerBankIC self, double ratio)"""
+        return _Resampler.ArbitraryResamplerBankIC_setRatio(self, ratio)
+
+# Register ArbitraryResamplerBankIC in _Resampler:
+_Resampler.ArbitraryResamplerBankIC_swigregister(ArbitraryResamplerBankIC)
+
+class DownConverterRR(object):
+    r"""Proxy of C++ DownConverter< double,complex< double >,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs):
+        r"""__init__(DownConverterRR self, int upRate, int downRate, double frequency, double * coefs) -> DownConverterRR"""
+        _Resampler.DownConverterRR_swiginit(self, _Resampler.new_DownConverterRR(upRate, downRate, frequency, coefs))
+    __swig_destroy__ = _Resampler.delete_DownConverterRR
+
+    def apply(self, _in, out):
+        r"""apply(DownConverterRR self, double * _in, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterRR_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(DownConverterRR self, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterRR_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterRR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterRR_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterRR self) -> int"""
+        return _Resampler.DownConverterRR_coefsPerPhase(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterRR self) -> double"""
+        return _Resampler.DownConverterRR_frequency(self)
+
+# Register DownConverterRR in _Resampler:
+_Resampler.DownConverterRR_swigregister(DownConverterRR)
+
+class DownConverterRC(object):
+    r"""Proxy of C++ DownConverter< double,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs):
+        r"""__init__(DownConverterRC self, int upRate, int downRate, double frequency, complex< double > * coefs) -> DownConverterRC"""
+        _Resampler.DownConverterRC_swiginit(self, _Resampler.new_DownConverterRC(upRate, downRate, frequency, coefs))
+    __swig_destroy__ = _Resampler.delete_DownConverterRC
+
+    def apply(self, _in, out):
+        r"""apply(DownConverterRC self, double * _in, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterRC_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(DownConverterRC self, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterRC_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterRC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterRC_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterRC self) -> int"""
+        return _Resampler.DownConverterRC_coefsPerPhase(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterRC self) -> double"""
+        return _Resampler.DownConverterRC_frequency(self)
+
+# Register DownConverterRC in _Resampler:
+_Resampler.DownConverterRC_swigregister(DownConverterRC)
+
+class DownConverterCR(object):
+    r"""Proxy of C++ DownConverter< complex< double >,complex< double >,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs):
+        r"""__init__(DownConverterCR self, int upRate, int downRate, double frequency, double * coefs) -> DownConverterCR"""
+        _Resampler.DownConverterCR_swiginit(self, _Resampler.new_DownConverterCR(upRate, downRate, frequency, coefs))
+    __swig_destroy__ = _Resampler.delete_DownConverterCR
+
+    def apply(self, _in, out):
+        r"""apply(DownConverterCR self, complex< double > * _in, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterCR_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(DownConverterCR self, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterCR_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterCR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterCR_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterCR self) -> int"""
+        return _Resampler.DownConverterCR_coefsPerPhase(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterCR self) -> double"""
+        return _Resampler.DownConverterCR_frequency(self)
+
+# Register DownConverterCR in _Resampler:
+_Resampler.DownConverterCR_swigregister(DownConverterCR)
+
+class DownConverterCC(object):
+    r"""Proxy of C++ DownConverter< complex< double >,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs):
+        r"""__init__(DownConverterCC self, int upRate, int downRate, double frequency, complex< double > * coefs) -> DownConverterCC"""
+        _Resampler.DownConverterCC_swiginit(self, _Resampler.new_DownConverterCC(upRate, downRate, frequency, coefs))
+    __swig_destroy__ = _Resampler.delete_DownConverterCC
+
+    def apply(self, _in, out):
+        r"""apply(DownConverterCC self, complex< double > * _in, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterCC_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(DownConverterCC self, complex< double > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterCC_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterCC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterCC_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterCC self) -> int"""
+        return _Resampler.DownConverterCC_coefsPerPhase(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterCC self) -> double"""
+        return _Resampler.DownConverterCC_frequency(self)
+
+# Register DownConverterCC in _Resampler:
+_Resampler.DownConverterCC_swigregister(DownConverterCC)
+
+class DownConverterRRf(object):
+    r"""Proxy of C++ DownConverter< float,complex< float >,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs):
+        r"""__init__(DownConverterRRf self, int upRate, int downRate, double frequency, float * coefs) -> DownConverterRRf"""
+        _Resampler.DownConverterRRf_swiginit(self, _Resampler.new_DownConverterRRf(upRate, downRate, frequency, coefs))
+    __swig_destroy__ = _Resampler.delete_DownConverterRRf
+
+    def apply(self, _in, out):
+        r"""apply(DownConverterRRf self, float * _in, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterRRf_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(DownConverterRRf self, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterRRf_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterRRf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterRRf_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterRRf self) -> int"""
+        return _Resampler.DownConverterRRf_coefsPerPhase(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterRRf self) -> double"""
+        return _Resampler.DownConverterRRf_frequency(self)
+
+# Register DownConverterRRf in _Resampler:
+_Resampler.DownConverterRRf_swigregister(DownConverterRRf)
+
+class DownConverterRCf(object):
+    r"""Proxy of C++ DownConverter< float,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs):
+        r"""__init__(DownConverterRCf self, int upRate, int downRate, double frequency, complex< float > * coefs) -> DownConverterRCf"""
+        _Resampler.DownConverterRCf_swiginit(self, _Resampler.new_DownConverterRCf(upRate, downRate, frequency, coefs))
+    __swig_destroy__ = _Resampler.delete_DownConverterRCf
+
+    def apply(self, _in, out):
+        r"""apply(DownConverterRCf self, float * _in, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterRCf_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(DownConverterRCf self, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterRCf_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterRCf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterRCf_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterRCf self) -> int"""
+        return _Resampler.DownConverterRCf_coefsPerPhase(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterRCf self) -> double"""
+        return _Resampler.DownConverterRCf_frequency(self)
+
+# Register DownConverterRCf in _Resampler:
+_Resampler.DownConverterRCf_swigregister(DownConverterRCf)
+
+class DownConverterCRf(object):
+    r"""Proxy of C++ DownConverter< complex< float >,complex< float >,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs):
+        r"""__init__(DownConverterCRf self, int upRate, int downRate, double frequency, float * coefs) -> DownConverterCRf"""
+        _Resampler.DownConverterCRf_swiginit(self, _Resampler.new_DownConverterCRf(upRate, downRate, frequency, coefs))
+    __swig_destroy__ = _Resampler.delete_DownConverterCRf
+
+    def apply(self, _in, out):
+        r"""apply(DownConverterCRf self, complex< float > * _in, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterCRf_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(DownConverterCRf self, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterCRf_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterCRf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterCRf_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterCRf self) -> int"""
+        return _Resampler.DownConverterCRf_coefsPerPhase(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterCRf self) -> double"""
+        return _Resampler.DownConverterCRf_frequency(self)
+
+# Register DownConverterCRf in _Resampler:
+_Resampler.DownConverterCRf_swigregister(DownConverterCRf)
+
+class DownConverterCCf(object):
+    r"""Proxy of C++ DownConverter< complex< float >,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs):
+        r"""__init__(DownConverterCCf self, int upRate, int downRate, double frequency, complex< float > * coefs) -> DownConverterCCf"""
+        _Resampler.DownConverterCCf_swiginit(self, _Resampler.new_DownConverterCCf(upRate, downRate, frequency, coefs))
+    __swig_destroy__ = _Resampler.delete_DownConverterCCf
+
+    def apply(self, _in, out):
+        r"""apply(DownConverterCCf self, complex< float > * _in, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterCCf_apply(self, _in, out)
+
+    def flush(self, out):
+        r"""flush(DownConverterCCf self, complex< float > * out) -> ptrdiff_t"""
+        return _Resampler.DownConverterCCf_flush(self, out)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterCCf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterCCf_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterCCf self) -> int"""
+        return _Resampler.DownConverterCCf_coefsPerPhase(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterCCf self) -> double"""
+        return _Resampler.DownConverterCCf_frequency(self)
+
+# Register DownConverterCCf in _Resampler:
+_Resampler.DownConverterCCf_swigregister(DownConverterCCf)
+
+class DownConverterBankRR(object):
+    r"""Proxy of C++ DownConverterBank< double,complex< double >,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs, bankSize):
+        r"""__init__(DownConverterBankRR self, int upRate, int downRate, double frequency, double * coefs, int bankSize) -> DownConverterBankRR"""
+        _Resampler.DownConverterBankRR_swiginit(self, _Resampler.new_DownConverterBankRR(upRate, downRate, frequency, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_DownConverterBankRR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(DownConverterBankRR self, ArrayView< double const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankRR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(DownConverterBankRR self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankRR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterBankRR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankRR_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterBankRR self) -> int"""
+        return _Resampler.DownConverterBankRR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(DownConverterBankRR self) -> int"""
+        return _Resampler.DownConverterBankRR_bankSize(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterBankRR self) -> double"""
+        return _Resampler.DownConverterBankRR_frequency(self)
+
+# Register DownConverterBankRR in _Resampler:
+_Resampler.DownConverterBankRR_swigregister(DownConverterBankRR)
+
+class DownConverterBankRC(object):
+    r"""Proxy of C++ DownConverterBank< double,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs, bankSize):
+        r"""__init__(DownConverterBankRC self, int upRate, int downRate, double frequency, complex< double > * coefs, int bankSize) -> DownConverterBankRC"""
+        _Resampler.DownConverterBankRC_swiginit(self, _Resampler.new_DownConverterBankRC(upRate, downRate, frequency, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_DownConverterBankRC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(DownConverterBankRC self, ArrayView< double const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankRC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(DownConverterBankRC self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankRC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterBankRC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankRC_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterBankRC self) -> int"""
+        return _Resampler.DownConverterBankRC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(DownConverterBankRC self) -> int"""
+        return _Resampler.DownConverterBankRC_bankSize(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterBankRC self) -> double"""
+        return _Resampler.DownConverterBankRC_frequency(self)
+
+# Register DownConverterBankRC in _Resampler:
+_Resampler.DownConverterBankRC_swigregister(DownConverterBankRC)
+
+class DownConverterBankCR(object):
+    r"""Proxy of C++ DownConverterBank< complex< double >,complex< double >,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs, bankSize):
+        r"""__init__(DownConverterBankCR self, int upRate, int downRate, double frequency, double * coefs, int bankSize) -> DownConverterBankCR"""
+        _Resampler.DownConverterBankCR_swiginit(self, _Resampler.new_DownConverterBankCR(upRate, downRate, frequency, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_DownConverterBankCR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(DownConverterBankCR self, ArrayView< complex< double > const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankCR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(DownConverterBankCR self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankCR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterBankCR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankCR_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterBankCR self) -> int"""
+        return _Resampler.DownConverterBankCR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(DownConverterBankCR self) -> int"""
+        return _Resampler.DownConverterBankCR_bankSize(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterBankCR self) -> double"""
+        return _Resampler.DownConverterBankCR_frequency(self)
+
+# Register DownConverterBankCR in _Resampler:
+_Resampler.DownConverterBankCR_swigregister(DownConverterBankCR)
+
+class DownConverterBankCC(object):
+    r"""Proxy of C++ DownConverterBank< complex< double >,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs, bankSize):
+        r"""__init__(DownConverterBankCC self, int upRate, int downRate, double frequency, complex< double > * coefs, int bankSize) -> DownConverterBankCC"""
+        _Resampler.DownConverterBankCC_swiginit(self, _Resampler.new_DownConverterBankCC(upRate, downRate, frequency, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_DownConverterBankCC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(DownConverterBankCC self, ArrayView< complex< double > const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankCC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(DownConverterBankCC self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankCC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterBankCC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankCC_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterBankCC self) -> int"""
+        return _Resampler.DownConverterBankCC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(DownConverterBankCC self) -> int"""
+        return _Resampler.DownConverterBankCC_bankSize(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterBankCC self) -> double"""
+        return _Resampler.DownConverterBankCC_frequency(self)
+
+# Register DownConverterBankCC in _Resampler:
+_Resampler.DownConverterBankCC_swigregister(DownConverterBankCC)
+
+class DownConverterBankRRf(object):
+    r"""Proxy of C++ DownConverterBank< float,complex< float >,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs, bankSize):
+        r"""__init__(DownConverterBankRRf self, int upRate, int downRate, double frequency, float * coefs, int bankSize) -> DownConverterBankRRf"""
+        _Resampler.DownConverterBankRRf_swiginit(self, _Resampler.new_DownConverterBankRRf(upRate, downRate, frequency, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_DownConverterBankRRf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(DownConverterBankRRf self, ArrayView< float const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankRRf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(DownConverterBankRRf self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankRRf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterBankRRf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankRRf_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterBankRRf self) -> int"""
+        return _Resampler.DownConverterBankRRf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(DownConverterBankRRf self) -> int"""
+        return _Resampler.DownConverterBankRRf_bankSize(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterBankRRf self) -> double"""
+        return _Resampler.DownConverterBankRRf_frequency(self)
+
+# Register DownConverterBankRRf in _Resampler:
+_Resampler.DownConverterBankRRf_swigregister(DownConverterBankRRf)
+
+class DownConverterBankRCf(object):
+    r"""Proxy of C++ DownConverterBank< float,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs, bankSize):
+        r"""__init__(DownConverterBankRCf self, int upRate, int downRate, double frequency, complex< float > * coefs, int bankSize) -> DownConverterBankRCf"""
+        _Resampler.DownConverterBankRCf_swiginit(self, _Resampler.new_DownConverterBankRCf(upRate, downRate, frequency, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_DownConverterBankRCf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(DownConverterBankRCf self, ArrayView< float const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankRCf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(DownConverterBankRCf self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankRCf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterBankRCf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankRCf_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterBankRCf self) -> int"""
+        return _Resampler.DownConverterBankRCf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(DownConverterBankRCf self) -> int"""
+        return _Resampler.DownConverterBankRCf_bankSize(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterBankRCf self) -> double"""
+        return _Resampler.DownConverterBankRCf_frequency(self)
+
+# Register DownConverterBankRCf in _Resampler:
+_Resampler.DownConverterBankRCf_swigregister(DownConverterBankRCf)
+
+class DownConverterBankCRf(object):
+    r"""Proxy of C++ DownConverterBank< complex< float >,complex< float >,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs, bankSize):
+        r"""__init__(DownConverterBankCRf self, int upRate, int downRate, double frequency, float * coefs, int bankSize) -> DownConverterBankCRf"""
+        _Resampler.DownConverterBankCRf_swiginit(self, _Resampler.new_DownConverterBankCRf(upRate, downRate, frequency, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_DownConverterBankCRf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(DownConverterBankCRf self, ArrayView< complex< float > const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankCRf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(DownConverterBankCRf self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankCRf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterBankCRf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankCRf_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterBankCRf self) -> int"""
+        return _Resampler.DownConverterBankCRf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(DownConverterBankCRf self) -> int"""
+        return _Resampler.DownConverterBankCRf_bankSize(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterBankCRf self) -> double"""
+        return _Resampler.DownConverterBankCRf_frequency(self)
+
+# Register DownConverterBankCRf in _Resampler:
+_Resampler.DownConverterBankCRf_swigregister(DownConverterBankCRf)
+
+class DownConverterBankCCf(object):
+    r"""Proxy of C++ DownConverterBank< complex< float >,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs, bankSize):
+        r"""__init__(DownConverterBankCCf self, int upRate, int downRate, double frequency, complex< float > * coefs, int bankSize) -> DownConverterBankCCf"""
+        _Resampler.DownConverterBankCCf_swiginit(self, _Resampler.new_DownConverterBankCCf(upRate, downRate, frequency, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_DownConverterBankCCf
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(DownConverterBankCCf self, ArrayView< complex< float > const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankCCf_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(DownConverterBankCCf self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankCCf_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterBankCCf self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankCCf_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterBankCCf self) -> int"""
+        return _Resampler.DownConverterBankCCf_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(DownConverterBankCCf self) -> int"""
+        return _Resampler.DownConverterBankCCf_bankSize(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterBankCCf self) -> double"""
+        return _Resampler.DownConverterBankCCf_frequency(self)
+
+# Register DownConverterBankCCf in _Resampler:
+_Resampler.DownConverterBankCCf_swigregister(DownConverterBankCCf)
+
+class DownConverterBankHR(object):
+    r"""Proxy of C++ DownConverterBank< short,complex< float >,float > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs, bankSize):
+        r"""__init__(DownConverterBankHR self, int upRate, int downRate, double frequency, float * coefs, int bankSize) -> DownConverterBankHR"""
+        _Resampler.DownConverterBankHR_swiginit(self, _Resampler.new_DownConverterBankHR(upRate, downRate, frequency, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_DownConverterBankHR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(DownConverterBankHR self, ArrayView< short const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankHR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(DownConverterBankHR self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankHR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterBankHR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankHR_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterBankHR self) -> int"""
+        return _Resampler.DownConverterBankHR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(DownConverterBankHR self) -> int"""
+        return _Resampler.DownConverterBankHR_bankSize(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterBankHR self) -> double"""
+        return _Resampler.DownConverterBankHR_frequency(self)
+
+# Register DownConverterBankHR in _Resampler:
+_Resampler.DownConverterBankHR_swigregister(DownConverterBankHR)
+
+class DownConverterBankHC(object):
+    r"""Proxy of C++ DownConverterBank< short,complex< float >,complex< float > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs, bankSize):
+        r"""__init__(DownConverterBankHC self, int upRate, int downRate, double frequency, complex< float > * coefs, int bankSize) -> DownConverterBankHC"""
+        _Resampler.DownConverterBankHC_swiginit(self, _Resampler.new_DownConverterBankHC(upRate, downRate, frequency, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_DownConverterBankHC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(DownConverterBankHC self, ArrayView< short const > _in, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankHC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(DownConverterBankHC self, ArrayView< complex< float > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankHC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterBankHC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankHC_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterBankHC self) -> int"""
+        return _Resampler.DownConverterBankHC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(DownConverterBankHC self) -> int"""
+        return _Resampler.DownConverterBankHC_bankSize(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterBankHC self) -> double"""
+        return _Resampler.DownConverterBankHC_frequency(self)
+
+# Register DownConverterBankHC in _Resampler:
+_Resampler.DownConverterBankHC_swigregister(DownConverterBankHC)
+
+class DownConverterBankIR(object):
+    r"""Proxy of C++ DownConverterBank< int,complex< double >,double > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs, bankSize):
+        r"""__init__(DownConverterBankIR self, int upRate, int downRate, double frequency, double * coefs, int bankSize) -> DownConverterBankIR"""
+        _Resampler.DownConverterBankIR_swiginit(self, _Resampler.new_DownConverterBankIR(upRate, downRate, frequency, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_DownConverterBankIR
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(DownConverterBankIR self, ArrayView< int const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankIR_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(DownConverterBankIR self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankIR_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterBankIR self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankIR_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterBankIR self) -> int"""
+        return _Resampler.DownConverterBankIR_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(DownConverterBankIR self) -> int"""
+        return _Resampler.DownConverterBankIR_bankSize(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterBankIR self) -> double"""
+        return _Resampler.DownConverterBankIR_frequency(self)
+
+# Register DownConverterBankIR in _Resampler:
+_Resampler.DownConverterBankIR_swigregister(DownConverterBankIR)
+
+class DownConverterBankIC(object):
+    r"""Proxy of C++ DownConverterBank< int,complex< double >,complex< double > > class."""
+
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self, upRate, downRate, frequency, coefs, bankSize):
+        r"""__init__(DownConverterBankIC self, int upRate, int downRate, double frequency, complex< double > * coefs, int bankSize) -> DownConverterBankIC"""
+        _Resampler.DownConverterBankIC_swiginit(self, _Resampler.new_DownConverterBankIC(upRate, downRate, frequency, coefs, bankSize))
+    __swig_destroy__ = _Resampler.delete_DownConverterBankIC
+
+    def apply(self, _in, out, firstChannel):
+        r"""apply(DownConverterBankIC self, ArrayView< int const > _in, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankIC_apply(self, _in, out, firstChannel)
+
+    def flush(self, out, firstChannel):
+        r"""flush(DownConverterBankIC self, ArrayView< complex< double > > out, ptrdiff_t firstChannel) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankIC_flush(self, out, firstChannel)
+
+    def neededOutCount(self, inCount):
+        r"""neededOutCount(DownConverterBankIC self, ptrdiff_t inCount) -> ptrdiff_t"""
+        return _Resampler.DownConverterBankIC_neededOutCount(self, inCount)
+
+    def coefsPerPhase(self):
+        r"""coefsPerPhase(DownConverterBankIC self) -> int"""
+        return _Resampler.DownConverterBankIC_coefsPerPhase(self)
+
+    def bankSize(self):
+        r"""bankSize(DownConverterBankIC self) -> int"""
+        return _Resampler.DownConverterBankIC_bankSize(self)
+
+    def frequency(self):
+        r"""frequency(DownConverterBankIC self) -> double"""
+        return _Resampler.DownConverterBankIC_frequency(self)
+
+# Register DownConverterBankIC in _Resampler:
+_Resampler.DownConverterBankIC_swigregister(DownConverterBankIC)
 
-# This file is compatible with both classic and new-style classes.
 
 
@@ -29,8 +29,49 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS 
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import os
+import mmap
+import multiprocessing
 import numpy as np
+from functools import partial
+from multiprocessing.pool import ThreadPool
+from fftresampler import FFTResamplerBank, fft_size, polyphase_coefs
+from design import design_resample_filter, filter_cache, kaiser_lowpass
+from design import plan_multistage, design_stage_filter
+from design import design_arbitrary_filter
 from Resampler import ResamplerRR, ResamplerRC, ResamplerCR, ResamplerCC
+from Resampler import ResamplerRRf, ResamplerRCf, ResamplerCRf, ResamplerCCf
+from Resampler import ResamplerBankRR, ResamplerBankRC, ResamplerBankCR, \
+                      ResamplerBankCC
+from Resampler import ResamplerBankRRf, ResamplerBankRCf, ResamplerBankCRf, \
+                      ResamplerBankCCf
+from Resampler import ResamplerHR, ResamplerHC, ResamplerHH, ResamplerIR, \
+                      ResamplerIC, ResamplerII
+from Resampler import ResamplerBankHR, ResamplerBankHC, ResamplerBankHH, \
+                      ResamplerBankIR, ResamplerBankIC, ResamplerBankII
+from Resampler import ArbitraryResamplerBankRR, ArbitraryResamplerBankRC, \
+                      ArbitraryResamplerBankCR, ArbitraryResamplerBankCC
+from Resampler import ArbitraryResamplerBankRRf, ArbitraryResamplerBankRCf, \
+                      ArbitraryResamplerBankCRf, ArbitraryResamplerBankCCf
+from Resampler import ArbitraryResamplerBankHR, ArbitraryResamplerBankHC, \
+                      ArbitraryResamplerBankIR, ArbitraryResamplerBankIC
+from Resampler import FusedResamplerBankRR, FusedResamplerBankRC, \
+                      FusedResamplerBankCR, FusedResamplerBankCC
+from Resampler import FusedResamplerBankRRf, FusedResamplerBankRCf, \
+                      FusedResamplerBankCRf, FusedResamplerBankCCf
+from Resampler import FusedResamplerBankHR, FusedResamplerBankHC, \
+                      FusedResamplerBankHH, FusedResamplerBankIR, \
+                      FusedResamplerBankIC, FusedResamplerBankII
+from Resampler import DownConverterBankRR, DownConverterBankRC, \
+                      DownConverterBankCR, DownConverterBankCC
+from Resampler import DownConverterBankRRf, DownConverterBankRCf, \
+                      DownConverterBankCRf, DownConverterBankCCf
+from Resampler import DownConverterBankHR, DownConverterBankHC, \
+                      DownConverterBankIR, DownConverterBankIC
+from Resampler import ChannelizerRR, ChannelizerRC, ChannelizerCR, \
+                      ChannelizerCC
+from Resampler import ChannelizerRRf, ChannelizerRCf, ChannelizerCRf, \
+                      ChannelizerCCf
 
 def enumdims(ary, dims=(0,), complement=False):
     """Enumerate over the given array dimensions
@@ -130,26 +171,358 @@ def back2dim(x, xdim=-1):
 
 
 # Index into Resampler object type switchyard is 
-#  (signal type complex,  coefficient type complex) booleans
+#  (signal type complex,  coefficient type complex, single precision) booleans
 _SWITCH_YARD = {
-    (False, False): ResamplerRR,
-     (False, True): ResamplerRC,
-     (True, False): ResamplerCR,
-      (True, True): ResamplerCC
+    (False, False, False): ResamplerRR,
+     (False, True, False): ResamplerRC,
+     (True, False, False): ResamplerCR,
+      (True, True, False): ResamplerCC,
+     (False, False, True): ResamplerRRf,
+      (False, True, True): ResamplerRCf,
+      (True, False, True): ResamplerCRf,
+       (True, True, True): ResamplerCCf
 }
 
-def klass_lookup(signal=1., coefficients=1.):
+# Same switchyard, for the multichannel C++ ResamplerBank types
+_BANK_SWITCH_YARD = {
+    (False, False, False): ResamplerBankRR,
+     (False, True, False): ResamplerBankRC,
+     (True, False, False): ResamplerBankCR,
+      (True, True, False): ResamplerBankCC,
+     (False, False, True): ResamplerBankRRf,
+      (False, True, True): ResamplerBankRCf,
+      (True, False, True): ResamplerBankCRf,
+       (True, True, True): ResamplerBankCCf
+}
+
+# Same switchyard, for the C++ FusedResamplerBank types
+_FUSED_BANK_SWITCH_YARD = {
+    (False, False, False): FusedResamplerBankRR,
+     (False, True, False): FusedResamplerBankRC,
+     (True, False, False): FusedResamplerBankCR,
+      (True, True, False): FusedResamplerBankCC,
+     (False, False, True): FusedResamplerBankRRf,
+      (False, True, True): FusedResamplerBankRCf,
+      (True, False, True): FusedResamplerBankCRf,
+       (True, True, True): FusedResamplerBankCCf
+}
+
+# Same switchyard, for the C++ ArbitraryResamplerBank types
+_ARBITRARY_BANK_SWITCH_YARD = {
+    (False, False, False): ArbitraryResamplerBankRR,
+     (False, True, False): ArbitraryResamplerBankRC,
+     (True, False, False): ArbitraryResamplerBankCR,
+      (True, True, False): ArbitraryResamplerBankCC,
+     (False, False, True): ArbitraryResamplerBankRRf,
+      (False, True, True): ArbitraryResamplerBankRCf,
+      (True, False, True): ArbitraryResamplerBankCRf,
+       (True, True, True): ArbitraryResamplerBankCCf
+}
+
+# Same switchyard, for the C++ Channelizer types
+_CHANNELIZER_SWITCH_YARD = {
+    (False, False, False): ChannelizerRR,
+     (False, True, False): ChannelizerRC,
+     (True, False, False): ChannelizerCR,
+      (True, True, False): ChannelizerCC,
+     (False, False, True): ChannelizerRRf,
+      (False, True, True): ChannelizerRCf,
+      (True, False, True): ChannelizerCRf,
+       (True, True, True): ChannelizerCCf
+}
+
+# Same switchyard, for the C++ DownConverterBank types
+_DOWN_CONVERTER_BANK_SWITCH_YARD = {
+    (False, False, False): DownConverterBankRR,
+     (False, True, False): DownConverterBankRC,
+     (True, False, False): DownConverterBankCR,
+      (True, True, False): DownConverterBankCC,
+     (False, False, True): DownConverterBankRRf,
+      (False, True, True): DownConverterBankRCf,
+      (True, False, True): DownConverterBankCRf,
+       (True, True, True): DownConverterBankCCf
+}
+
+# Index into the switchyards for integer (PCM) signals is
+#  (signal type, coefficient type complex, integer output)
+# int16 signals are filtered in single precision, int32 in double precision.
+_INT_SWITCH_YARD = {
+    (np.dtype(np.int16), False, False): ResamplerHR,
+     (np.dtype(np.int16), True, False): ResamplerHC,
+     (np.dtype(np.int16), False, True): ResamplerHH,
+    (np.dtype(np.int32), False, False): ResamplerIR,
+     (np.dtype(np.int32), True, False): ResamplerIC,
+     (np.dtype(np.int32), False, True): ResamplerII
+}
+
+_INT_BANK_SWITCH_YARD = {
+    (np.dtype(np.int16), False, False): ResamplerBankHR,
+     (np.dtype(np.int16), True, False): ResamplerBankHC,
+     (np.dtype(np.int16), False, True): ResamplerBankHH,
+    (np.dtype(np.int32), False, False): ResamplerBankIR,
+     (np.dtype(np.int32), True, False): ResamplerBankIC,
+     (np.dtype(np.int32), False, True): ResamplerBankII
+}
+
+_INT_FUSED_BANK_SWITCH_YARD = {
+    (np.dtype(np.int16), False, False): FusedResamplerBankHR,
+     (np.dtype(np.int16), True, False): FusedResamplerBankHC,
+     (np.dtype(np.int16), False, True): FusedResamplerBankHH,
+    (np.dtype(np.int32), False, False): FusedResamplerBankIR,
+     (np.dtype(np.int32), True, False): FusedResamplerBankIC,
+     (np.dtype(np.int32), False, True): FusedResamplerBankII
+}
+
+_INT_ARBITRARY_BANK_SWITCH_YARD = {
+    (np.dtype(np.int16), False, False): ArbitraryResamplerBankHR,
+     (np.dtype(np.int16), True, False): ArbitraryResamplerBankHC,
+    (np.dtype(np.int32), False, False): ArbitraryResamplerBankIR,
+     (np.dtype(np.int32), True, False): ArbitraryResamplerBankIC
+}
+
+_INT_DOWN_CONVERTER_BANK_SWITCH_YARD = {
+    (np.dtype(np.int16), False, False): DownConverterBankHR,
+     (np.dtype(np.int16), True, False): DownConverterBankHC,
+    (np.dtype(np.int32), False, False): DownConverterBankIR,
+     (np.dtype(np.int32), True, False): DownConverterBankIC
+}
+
+def is_single(signal=1.):
+    """Return True if the signal is single precision (float32 or complex64),
+    or int16, in which case it is filtered in single precision.
+    """
+    return np.asarray(signal).dtype in (np.float32, np.complex64, np.int16)
+
+def is_integer(signal=1.):
+    """Return True if the signal is int16 or int32 (PCM) samples, which are
+    read without conversion to floating point.
+    """
+    return np.asarray(signal).dtype in (np.int16, np.int32)
+
+def _switch_key(signal, coefficients):
+    return (np.iscomplexobj(signal), np.iscomplexobj(coefficients), \
+            is_single(signal))
+
+def _int_switch_key(signal, coefficients, integer_output):
+    return (np.asarray(signal).dtype, np.iscomplexobj(coefficients), \
+            integer_output)
+
+def _check_integer_output(signal, coefficients, integer_output):
+    if integer_output and (not is_integer(signal) or \
+                           np.iscomplexobj(coefficients)):
+        raise ValueError("Integer output needs an int16 or int32 signal, "
+                         "and real coefficients")
+
+def _lookup(switch_yard, int_switch_yard, signal, coefficients, 
+            integer_output):
+    _check_integer_output(signal, coefficients, integer_output)
+    if is_integer(signal):
+        return int_switch_yard[_int_switch_key(signal, coefficients, 
+                                               integer_output)]
+    return switch_yard[_switch_key(signal, coefficients)]
+
+def klass_lookup(signal=1., coefficients=1., integer_output=False):
     """Return Resampler type based on input signal and coefficient objects.
+    The precision (single or double) follows that of the signal.  If 
+    integer_output is True, the output has the (int16 or int32) type of the
+    signal, rounded and saturated.
+    """
+    return _lookup(_SWITCH_YARD, _INT_SWITCH_YARD, signal, coefficients, 
+                   integer_output)
+
+def bank_klass_lookup(signal=1., coefficients=1., integer_output=False):
+    """Return C++ ResamplerBank type based on input signal and coefficient 
+    objects.  The precision (single or double) follows that of the signal.
+    """
+    return _lookup(_BANK_SWITCH_YARD, _INT_BANK_SWITCH_YARD, signal, 
+                   coefficients, integer_output)
+
+def fused_bank_klass_lookup(signal=1., coefficients=1., integer_output=False):
+    """Return C++ FusedResamplerBank type, for one signal and many filters,
+    based on input signal and coefficient objects.
+    """
+    return _lookup(_FUSED_BANK_SWITCH_YARD, _INT_FUSED_BANK_SWITCH_YARD, 
+                   signal, coefficients, integer_output)
+
+def dtype_lookup(signal=1., coefficients=1., integer_output=False):
+    """Return the (input, coefficient, output) dtypes used by the Resampler 
+    type for the given input signal and coefficient objects.
+    """
+    _check_integer_output(signal, coefficients, integer_output)
+    if is_single(signal):
+        real, cplx = np.float32, np.complex64
+    else:
+        real, cplx = np.float64, np.complex128
+    signal_complex, coefficients_complex = \
+        np.iscomplexobj(signal), np.iscomplexobj(coefficients)
+    input_type = cplx if signal_complex else real
+    coef_type = cplx if coefficients_complex else real
+    output_type = cplx if signal_complex or coefficients_complex else real
+    if is_integer(signal):
+        input_type = np.asarray(signal).dtype
+        if integer_output:
+            output_type = input_type
+    return np.dtype(input_type), np.dtype(coef_type), np.dtype(output_type)
+    
+def choose_method(coef_count, uprate=1, downrate=1):
+    """
+    Choose between the direct polyphase form ('direct') and the overlap-save 
+    FFT form ('fft') of upfirdn, for a filter of coef_count coefficients.
+
+    The direct form costs coefs_per_phase multiplies per output, while the 
+    FFT form costs in proportion to downrate*log2(nfft) per output; the 
+    factor 16 between them was measured on long signals.
+    """
+    coefs_per_phase = (coef_count + uprate - 1) // uprate
+    nfft = fft_size(coefs_per_phase)
+    if coefs_per_phase > 16 * downrate * np.log2(nfft):
+        return 'fft'
+    return 'direct'
+
+def unique_rows(a):
+    """
+    Return the distinct rows of 2-D array a, and the index into them of 
+    each row of a.
+
+    The rows are grouped by a hash of their bytes, and the groups checked 
+    to hold equal rows; in the unlikely case they do not, all the rows are
+    returned.
+    """
+    a = np.ascontiguousarray(a)
+    if a.shape[0] < 2:
+        return a, np.zeros(a.shape[0], np.intp)
+    # a random linear hash of the 64 (or 32) bit words of each row, which 
+    # is exact (modulo 2**64) so the same for equal rows; a block of rows at
+    # a time, to keep the temporaries in cache
+    if a.dtype.itemsize * a.shape[1] % 8 == 0:
+        words = a.view(np.uint64)
+    else:
+        words = a.view(np.uint32)
+    weights = np.random.RandomState(0).randint(1, 2**31, words.shape[-1])
+    weights = weights.astype(np.uint64)
+    keys = np.empty(a.shape[0], np.uint64)
+    for lo in range(0, a.shape[0], 256):
+        keys[lo:lo+256] = (words[lo:lo+256] * weights).sum(axis=-1)
+    first, inverse = np.unique(keys, return_index=True, 
+                               return_inverse=True)[1:]
+    if len(first) == a.shape[0]:
+        return a, np.arange(a.shape[0])
+    repeated = np.ones(a.shape[0], bool)
+    repeated[first] = False
+    repeated = np.flatnonzero(repeated)
+    for block in np.array_split(repeated, -(-len(repeated) // 256)):
+        if not np.array_equal(a[block], a[first[inverse[block]]]):
+            return a, np.arange(a.shape[0])
+    return a[first], inverse
+
+def _apply_shard(args):
+    """Apply one C++ ResamplerBank to its channels of input and output, and
+    if all_samples, flush it into the rest of the output."""
+    bank, x, y, first_channel, all_samples = args
+    count = bank.apply(x, y, first_channel)
+    if all_samples:
+        bank.flush(y[..., count:], first_channel)
+
+def _flush_shard(args):
+    """Flush one C++ ResamplerBank into its channels of output."""
+    bank, y, first_channel = args
+    bank.flush(y, first_channel)
+
+def _shared_empty(shape, dtype):
+    """Return a new array in anonymous shared memory, which processes 
+    forked afterwards write to in place."""
+    dtype = np.dtype(dtype)
+    count = int(np.prod(shape))
+    buf = mmap.mmap(-1, max(1, count * dtype.itemsize))
+    return np.frombuffer(buf, dtype, count).reshape(shape)
+
+# the work of _fork_map, inherited by its processes
+_FORK_WORK = None
+
+def _call_forked(i):
+    func, work = _FORK_WORK
+    func(work[i])
+
+def _fork_map(func, work):
+    """
+    Call func on each item of work, each in a forked process.  The items 
+    are inherited by the processes, not pickled, so may hold C++ objects 
+    and large arrays, which are not copied; func must write its results to
+    shared memory (see _shared_empty).
+    """
+    global _FORK_WORK
+    if not hasattr(os, 'fork'):
+        raise ValueError("The process backend needs os.fork")
+    _FORK_WORK = (func, work)
+    try:
+        pool = multiprocessing.Pool(len(work))
+        try:
+            pool.map(_call_forked, range(len(work)))
+        finally:
+            pool.terminate()
+    finally:
+        _FORK_WORK = None
+
+# the fewest channels per group worth a FusedResamplerBank, measured with 
+# filters of 16 to 256 taps
+_FUSED_MIN_CHANNELS = 8
+
+def _apply_range(bank, x, start, stop, out):
     """
-    klass = _SWITCH_YARD[(np.iscomplexobj(signal), \
-                          np.iscomplexobj(coefficients))]
-    return klass
+    Compute output samples start, ..., stop-1 (0 <= start <= stop <= the
+    number with all_samples) of upfirdn for a new ResamplerBank, with 
+    xdim=-1, of the signals x, into out[..., :stop-start].
     
+    Output k is computed with phase k*downrate % uprate of the filter from
+    the inputs up to k*downrate // uprate, so only the inputs from
+    (start*downrate // uprate) - coefs_per_phase + 1 on (the "halo" before
+    the first output) to ((stop - 1)*downrate // uprate) are filtered.
+    """
+    if start == stop:
+        return
+    in_count = x.shape[-1]
+    # the latest inputs of the first and last outputs, the phase of the 
+    # first, and the earliest input it needs (earlier ones are zero)
+    x_first = start * bank.downrate // bank.uprate
+    x_last = (stop - 1) * bank.downrate // bank.uprate
+    t = start * bank.downrate % bank.uprate
+    first = max(0, x_first - bank.coefs_per_phase + 1)
+    bank.set_phase(t, x_first - first)
+    # past the end of x, the outputs are those of flush
+    y = bank.apply(x[..., first:min(x_last + 1, in_count)], 
+                   all_samples=x_last >= in_count)
+    out[..., :stop - start] = y[..., :stop - start]
+
+def _apply_segment(args):
+    """Compute one time segment of the output of upfirdn, for a pool."""
+    bank, x, start, stop, out = args
+    _apply_range(bank, x, start, stop, out[..., start:stop])
+
+# the fewest input samples per time segment of a signal worth a worker
+_SEGMENT_MIN_SAMPLES = 65536
+
 class ResamplerBank(object):
     """
     A bank of Resampler objects.
+
+    The channels are held by C++ ResamplerBank objects (or FFTResamplerBank
+    objects, for long filters), so each call to apply filters a whole group 
+    of channels in one native call.  With n_workers > 1 the channels are 
+    split into that many groups, which are filtered concurrently by a pool 
+    of threads (the GIL is released while filtering), or by a pool of 
+    forked processes with backend='processes'.
+
+    When a single signal is broadcast against many filters, each group is 
+    a C++ FusedResamplerBank, which reads each input window once for all 
+    its filters, and keeps a single input state.
+
+    int16 and int32 signals are read as they are, without a floating point
+    copy, and int16 is filtered in single precision.  With integer_output,
+    the output has the integer type of the signal too.
     """
-    def __init__(self, x, h, uprate=1, downrate=1, xdim=-1, hdim=-1):
+    def __init__(self, x, h, uprate=1, downrate=1, xdim=-1, hdim=-1, 
+                 n_workers=1, method='auto', integer_output=False, scale=1.,
+                 backend='threads', phases=None):
         """
         Construct the ResamplerBank object.
         
@@ -171,11 +544,56 @@ class ResamplerBank(object):
             Dimension for "x" input signal array. (default=-1)
         hdim : int, optional
             Dimension for "h" coefficient array. (default=-1)
+        n_workers : int, optional
+            Number of threads over which to spread the channels. (default=1)
+        method : {'auto', 'direct', 'fft'}, optional
+            Use the direct polyphase form, or the overlap-save FFT form which 
+            is faster for long filters.  'auto' chooses from the filter length
+            and rates, see choose_method.  (default='auto')
+        integer_output : bool, optional
+            If True, the output has the type of an int16 or int32 signal x,
+            rounded to the nearest integer and saturated to the range of
+            the type.  (default=False)
+        scale : float, optional
+            Gain applied to the output, e.g. to use the full range of an
+            integer output.  It is folded into the coefficients, so costs
+            nothing.  (default=1.)
+        backend : {'threads', 'processes'}, optional
+            Filter the groups of channels in threads, or in processes 
+            forked for each call to apply, for where the threads would not
+            run concurrently.  The processes inherit the input, without
+            pickling or copying it, and write the output to shared memory,
+            which is returned as it is.  The state of the resamplers stays
+            in the processes, so with 'processes' the bank filters a single
+            stream, in a single call to apply (as upfirdn does), and "out"
+            cannot be given.  (default='threads')
+        phases : ndarray, optional
+            For a single filter h, its taps already split into phases as
+            the direct form stores them, polyphase_coefs(h, uprate)[:, ::-1]
+            (e.g. the "phases" of a cached design_resample_filter design),
+            so that they are copied rather than rearranged.  (default=None)
     
         """
         x = np.atleast_1d(x)
         h = np.atleast_1d(h)
-        klass = klass_lookup(x, h)
+        if scale != 1:
+            h = h * scale
+            if phases is not None:
+                phases = phases * scale
+        self.input_type, coef_type, self.output_type = \
+            dtype_lookup(x, h, integer_output)
+        if backend not in ('threads', 'processes'):
+            raise ValueError("backend must be 'threads' or 'processes'")
+        if method == 'auto':
+            method = choose_method(h.shape[hdim], uprate, downrate)
+        if method == 'direct':
+            klass = bank_klass_lookup(x, h, integer_output)
+        elif method == 'fft':
+            klass = partial(FFTResamplerBank, input_type=self.input_type, 
+                            output_type=self.output_type)
+        else:
+            raise ValueError("method must be one of 'auto', 'direct' or 'fft'")
+        self.method = method
         
         x = dim2back(x, xdim)
         h = dim2back(h, hdim)
@@ -186,20 +604,90 @@ class ResamplerBank(object):
         # xx is ignored
         xx, hh = np.broadcast_arrays(x[xi], h)
         self.hh = hh
-        bank = np.zeros(self.hh.shape[:-1], dtype=object)
-        for idx, hi in enumdims(self.hh, (-1,), complement=True):
-            bank[idx] = klass(uprate, downrate, hi)
+        self.shape = hh.shape[:-1]
 
-        self.bank = bank
-        self.r0 = self.bank.flat[0]
+        # the distinct filters are the distinct rows of h, and filter_index
+        # maps each channel to its filter, so a filter broadcast to (or
+        # repeated for) many channels is stored and transposed once
+        filters = np.asarray(h.reshape((-1, h.shape[-1])), coef_type)
+        filters, filter_index = unique_rows(filters)
+        filter_index = filter_index.astype(np.intc).reshape(h.shape[:-1])
+        filter_index = np.broadcast_to(filter_index, self.shape).ravel()
+        # the channels are split into contiguous groups, one C++ 
+        # ResamplerBank per group, holding the filters its channels use
+        self.channels = filter_index.shape[0]
+        n_workers = max(1, min(n_workers, self.channels))
+        bounds = np.linspace(0, self.channels, n_workers+1).astype(int)
+        self.shards = [slice(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])]
+        # one signal against many filters is filtered by all of them in one
+        # pass, with one input state per group rather than per channel
+        self.fused = method == 'direct' and \
+            np.prod(x.shape[:-1], dtype=int) == 1 and \
+            self.channels >= _FUSED_MIN_CHANNELS * n_workers
+        transposed = ()
+        if phases is not None and method == 'direct':
+            if filters.shape[0] != 1 or np.shape(phases) != \
+               (uprate, (h.shape[-1] + uprate - 1) // uprate):
+                raise ValueError("phases must be the polyphase layout of a "
+                                 "single filter h")
+            # the one filter is copied into the C++ PolyphaseFilter as is
+            filters = np.asarray(phases, coef_type).reshape((1, -1))
+            transposed = (True,)
+        self.banks = []
+        for shard in self.shards:
+            if self.fused:
+                self.banks.append(
+                    fused_bank_klass_lookup(x, h, integer_output)(
+                        uprate, downrate, filters[filter_index[shard]]))
+                continue
+            used, index = np.unique(filter_index[shard], return_inverse=True)
+            self.banks.append(klass(uprate, downrate, filters[used], 
+                                    index.astype(np.intc), *transposed))
+        self.filter_count = filters.shape[0]
+        self.backend = backend
+        self.spent = False
+        if n_workers > 1 and backend == 'threads':
+            self.pool = ThreadPool(n_workers)
+        else:
+            self.pool = None
         self.coefs_per_phase = (h.shape[-1] + uprate - 1) // uprate
+        self.uprate = uprate
+        self.downrate = downrate
         self.xdim = xdim
-        if np.iscomplexobj(x) or np.iscomplexobj(h):
-            self.output_type = complex
-        else:
-            self.output_type = float
+
+    def __del__(self):
+        if getattr(self, 'pool', None) is not None:
+            self.pool.terminate()
         
-    def apply(self, x, all_samples=False):
+    def needed_out_count(self, in_count, all_samples=False):
+        """
+        Return the number of output samples the next call to apply will 
+        compute from in_count input samples.
+        """
+        if all_samples:
+            in_count += self.coefs_per_phase-1
+        return self.banks[0].neededOutCount(in_count)
+
+    def set_phase(self, t, x_offset):
+        """
+        Set the "time" of the next output sample: it is computed with phase
+        t (0 <= t < uprate) of the filter, from the inputs up to index 
+        x_offset (>= 0) of the next call to apply.  See upfirdn_range.
+        """
+        for bank in self.banks:
+            bank.setPhase(t, x_offset)
+
+    def max_out_count(self, in_count, all_samples=False):
+        """
+        Return the largest number of output samples any call to apply can 
+        compute from in_count input samples, i.e. ceil(in_count*uprate/
+        downrate), whatever the state.  Use it to size "out" buffers.
+        """
+        if all_samples:
+            in_count += self.coefs_per_phase-1
+        return -(-in_count * self.uprate // self.downrate)
+
+    def apply(self, x, all_samples=False, out=None):
         """
         Upsample, FIR filter, and downsample a signal or array of signals using
         the bank of Resampler objects.
@@ -211,32 +699,681 @@ class ResamplerBank(object):
             will be operated on along the "xdim" dimension of x.
         all_samples : bool, optional
             If True, feeds in zeros after the input signal to "drain" the 
-            resampler and get all the non-zero samples.  (default=True)
+            resampler and get all the non-zero samples.  This ends the 
+            stream, as for flush.  (default=False)
+        out : ndarray, optional
+            Array in which to put the output.  It must have the shape of the
+            output, except that the "xdim" dimension may be longer (see 
+            max_out_count), and the output data type.  It may have any
+            strides, e.g. be a slice of a larger buffer.  (default=None)
             
         Returns
         -------
         y : float ndarray
+            The output signal array.  If "out" is given, this is the view of
+            "out" holding the output samples, at the start of the "xdim" 
+            dimension.
     
+        Notes
+        -----
+        The input and output arrays are filtered in place, whatever their 
+        layout or "xdim", and an input broadcast against the filters is not
+        copied.  So when "x" and "out" are given in the bank's data types, 
+        and all_samples is False, apply allocates no array memory.
+
         """
         x = np.atleast_1d(x)
         x = dim2back(x, self.xdim)
-        # htemp is ignored
+        if self.fused and np.prod(x.shape[:-1], dtype=int) != 1:
+            raise ValueError("x must be a single signal, as the bank was "
+                             "constructed for")
+        # htemp is ignored; the broadcast dimensions of xx have zero strides
         xx, htemp = np.broadcast_arrays(x, self.hh[..., 0:1])
-        in_count = xx.shape[-1]
+        if self.input_type.kind == 'i':
+            # integer samples must not be truncated
+            if not np.can_cast(xx.dtype, self.input_type, 'safe'):
+                raise ValueError("x must have data type %s" % \
+                                 self.input_type)
+            xx = np.asarray(xx, self.input_type)
+        elif np.can_cast(xx.dtype, self.input_type, 'same_kind'):
+            # e.g. double precision input to a single precision bank
+            xx = np.asarray(xx, self.input_type)
+        needed_out_count = self.needed_out_count(xx.shape[-1], all_samples)
+        y = self._output_array(needed_out_count, out)
+        self._run(_apply_shard, [(bank, xx, y, shard.start, all_samples) \
+                  for bank, shard in zip(self.banks, self.shards)])
+        return back2dim(y[..., :needed_out_count], self.xdim)
+
+    def flush(self):
+        """
+        End the stream: "drain" the resampler, as if zeros were fed in 
+        after the last input signal, and return the remaining non-zero 
+        samples.  They are computed from the state of the resampler, 
+        without filtering the zeros.
+
+        Further calls to apply continue as if the zeros were part of the
+        input signal.
+        
+        Returns
+        -------
+        y : float ndarray
+    
+        """
+        y = self._output_array(self.needed_out_count(0, True))
+        self._run(_flush_shard, [(bank, y, shard.start) \
+                  for bank, shard in zip(self.banks, self.shards)])
+        return back2dim(y, self.xdim)
+
+    def _output_array(self, count, out=None):
+        """Return an array for count output samples, with the samples along
+        the last dimension: a new one, or a view of out, checked."""
+        if self.backend == 'processes':
+            if out is not None:
+                raise ValueError("out cannot be given with the process "
+                                 "backend")
+            return _shared_empty(self.shape + (count,), self.output_type)
+        if out is None:
+            # every output sample is written, so need not be zeroed
+            return np.empty(self.shape + (count,), dtype=self.output_type)
+        y = dim2back(out, self.xdim)
+        if y.dtype != self.output_type:
+            raise ValueError("out must have data type %s" % \
+                             self.output_type)
+        if y.shape[:-1] != self.shape or y.shape[-1] < count:
+            raise ValueError("out has wrong shape, or not enough output "
+                             "samples")
+        return y
+
+    def _run(self, func, work):
+        """Call func on each item of work, with the pool if there is one, or
+        in forked processes."""
+        if self.backend == 'processes':
+            if self.spent:
+                raise ValueError("A ResamplerBank with the process backend "
+                                 "filters a single call to apply")
+            self.spent = True
+            _fork_map(func, work)
+        elif self.pool is None:
+            map(func, work)
+        else:
+            self.pool.map(func, work)
+
+    def stream(self, chunks, flush=True):
+        """
+        Upsample, FIR filter, and downsample a stream of signal chunks, 
+        retaining state from one chunk to the next.
+
+        Parameters
+        ----------
+        chunks : iterable of array-like
+            Consecutive chunks of the input signal array, each with the
+            signals along the "xdim" dimension, as for apply.
+        flush : bool, optional
+            If True, flush at the end of the stream and yield the remaining 
+            non-zero samples as a last output chunk.  (default=True)
+            
+        Yields
+        ------
+        y : float ndarray
+            Output chunk for each input chunk, as soon as it is computed.
+    
+        Examples
+        --------
+        >>> bank = ResamplerBank(np.zeros(1), [1, 1], 2)
+        >>> for y in bank.stream([[1, 2], [3]]):
+        ...     print y
+        [ 1.  1.  2.  2.]
+        [ 3.  3.]
+        []
+
+        """
+        for x in chunks:
+            yield self.apply(x)
+        if flush:
+            yield self.flush()
+
+
+class MultistageResampler(object):
+    """
+    Resampling by uprate/downrate in a cascade of smaller stages.
+
+    For large rate ratios, e.g. 1/160, a single stage needs a long filter, 
+    and costs in proportion to its length.  plan_multistage factors the 
+    ratio into at most max_stages stages with the fewest multiplies, and
+    each stage is a ResamplerBank, so the cascade retains state from one 
+    call to apply to the next like a single ResamplerBank.
+    """
+    def __init__(self, x, uprate, downrate=1, xdim=-1, beta=5.0, 
+                 half_width=10, max_stages=3, n_workers=1, method='auto'):
+        """
+        Construct the MultistageResampler object.
+
+        Parameters
+        ----------
+        x : array-like
+            Input signal array.  May be multi-dimensional (ND).  The signals
+            will be operated on along the "xdim" dimension of x.
+        uprate : int
+            Upsampling rate.
+        downrate : int, optional
+            Downsampling rate. (default=1)
+        xdim : int, optional
+            Dimension for "x" input signal array. (default=-1)
+        beta, half_width : optional
+            Design of the filter, see resample.  The stages keep the 
+            passband of the single stage filter.
+        max_stages : int, optional
+            Largest number of stages.  (default=3)
+        n_workers, method : optional
+            See ResamplerBank.
+
+        Attributes
+        ----------
+        plan : MultistagePlan
+            The stages, and the predicted multiply-accumulates per input 
+            sample of the cascade (plan.macs) and of a single stage 
+            (plan.single_stage_macs).
+        stages : list of ResamplerBank
+            The ResamplerBank of each stage.
+
+        """
+        x = np.atleast_1d(x)
+        self.plan = plan_multistage(uprate, downrate, beta, half_width, 
+                                    max_stages)
+        self.stages = []
+        for f in self.plan.stages:
+            bank = ResamplerBank(x, f.coefs, f.uprate, f.downrate, xdim, 
+                                 n_workers=n_workers, method=method, 
+                                 phases=f.phases)
+            self.stages.append(bank)
+            # the next stage is built for the output of this one
+            x = back2dim(np.zeros(bank.shape + (1,), bank.output_type), xdim)
+        self.output_type = dtype_lookup(x)[-1]
+        self.xdim = xdim
+
+    def needed_out_count(self, in_count, all_samples=False):
+        """
+        Return the number of output samples the next call to apply will 
+        compute from in_count input samples.
+        """
+        for bank in self.stages:
+            in_count = bank.needed_out_count(in_count, all_samples)
+        return in_count
+
+    def max_out_count(self, in_count, all_samples=False):
+        """
+        Return the largest number of output samples any call to apply can 
+        compute from in_count input samples, see ResamplerBank.
+        """
+        for bank in self.stages:
+            in_count = bank.max_out_count(in_count, all_samples)
+        return in_count
+
+    def apply(self, x, all_samples=False, out=None):
+        """
+        Resample a signal or array of signals, as ResamplerBank.apply.
+
+        Parameters
+        ----------
+        x : array-like
+            Input signal array.  May be multi-dimensional (ND).  The signals
+            will be operated on along the "xdim" dimension of x.
+        all_samples : bool, optional
+            If True, "drains" each stage after the input signal, to get all
+            the non-zero samples.  This ends the stream, as for flush.
+            (default=False)
+        out : ndarray, optional
+            Array in which to put the output of the last stage, see
+            ResamplerBank.apply.  (default=None)
+            
+        Returns
+        -------
+        y : float ndarray
+            The output signal array.
+
+        """
+        if not self.stages:
+            return np.asarray(x, self.output_type)
+        for bank in self.stages[:-1]:
+            x = bank.apply(x, all_samples)
+        return self.stages[-1].apply(x, all_samples, out)
+
+    def flush(self):
+        """
+        End the stream: drain each stage in turn, and return the remaining 
+        non-zero samples.
+        
+        Returns
+        -------
+        y : float ndarray
+    
+        """
+        if not self.stages:
+            return np.zeros(0, self.output_type)
+        y = self.stages[0].flush()
+        for bank in self.stages[1:]:
+            y = bank.apply(y, all_samples=True)
+        return y
+
+    def stream(self, chunks, flush=True):
+        """
+        Resample a stream of signal chunks, see ResamplerBank.stream.
+        """
+        for x in chunks:
+            yield self.apply(x)
+        if flush:
+            yield self.flush()
+
+
+class Channelizer(object):
+    """
+    A polyphase FFT channelizer, which splits signals into channel_count 
+    uniform sub-bands, each decimated by channel_count, in one streaming 
+    pass.
+
+    Channel k is centered on k/channel_count cycles per input sample (so 
+    the channels above the middle one are the negative frequencies), and 
+    is the same as upfirdn(x * exp(-2j*pi*k*arange(len(x))/channel_count),
+    h, 1, channel_count): the prototype filter h modulated to each channel.
+    But rather than channel_count filters, it costs one pass of h over the
+    input, split into channel_count polyphase branches as in Resampler.h, 
+    and one FFT across the branches per output sample.  The state is 
+    retained from one call to apply to the next, as for ResamplerBank.
+    """
+    def __init__(self, x, channel_count, h=None, xdim=-1, beta=5.0, 
+                 half_width=10):
+        """
+        Construct the Channelizer object.
+
+        Parameters
+        ----------
+        x : array-like
+            Input signal array.  May be multi-dimensional (ND).  The signals
+            will be operated on along the "xdim" dimension of x.
+        channel_count : int
+            Number of channels, which is also the decimation.
+        h : array-like, optional
+            Prototype lowpass filter coefficients.  By default, the filter 
+            designed by design_resample_filter(1, channel_count, beta, 
+            half_width), with a cutoff at half the channel spacing.
+        xdim : int, optional
+            Dimension for "x" input signal array. (default=-1)
+        beta, half_width : optional
+            Design of the default filter, see resample.
+
+        """
+        x = np.atleast_1d(x)
+        if h is None:
+            h = design_resample_filter(1, channel_count, beta, 
+                                       half_width).coefs
+        h = np.atleast_1d(h)
+        self.input_type, coef_type, self.branch_type = dtype_lookup(x, h)
+        self.output_type = np.dtype(np.complex64 if is_single(x) else 
+                                    np.complex128)
+        klass = _CHANNELIZER_SWITCH_YARD[_switch_key(x, h)]
+        # a negative xdim is the same dimension of the output channels
+        self.xdim = xdim - x.ndim if xdim >= 0 else xdim
+        x = dim2back(x, xdim)
+        self.shape = x.shape[:-1]
+        h = np.asarray(h, coef_type)
+        self.channelizers = [klass(channel_count, h) 
+                             for idx in np.ndindex(*self.shape)]
+        self.channel_count = channel_count
+        self.coefs_per_phase = self.channelizers[0].coefsPerPhase()
+
+    def needed_out_count(self, in_count):
+        """
+        Return the number of output samples per channel the next call to 
+        apply will compute from in_count input samples.
+        """
+        return self.channelizers[0].neededOutCount(in_count)
+
+    def apply(self, x):
+        """
+        Split a signal or array of signals into channels.
+
+        Parameters
+        ----------
+        x : array-like
+            Input signal array, with the shape of the one the Channelizer
+            was constructed for, except along the "xdim" dimension.
+
+        Returns
+        -------
+        y : complex ndarray
+            The channels, y[k] being channel k, with the layout of an
+            output of upfirdn.
+
+        """
+        x = dim2back(np.atleast_1d(x), self.xdim)
+        if x.shape[:-1] != self.shape:
+            raise ValueError("x must have %d signals of shape %s" % \
+                             (len(self.channelizers), self.shape))
+        if np.can_cast(x.dtype, self.input_type, 'same_kind'):
+            x = np.asarray(x, self.input_type)
+        branches = np.empty((self.channel_count,) + self.shape + 
+                            (self.needed_out_count(x.shape[-1]),), 
+                            self.branch_type)
+        for channelizer, idx in zip(self.channelizers, 
+                                    np.ndindex(*self.shape)):
+            channelizer.apply(x[idx], branches[(slice(None),) + idx])
+        y = np.fft.ifft(branches, axis=0)
+        y *= self.channel_count
+        return back2dim(np.asarray(y, self.output_type), self.xdim)
+
+    def stream(self, chunks):
+        """
+        Split a stream of signal chunks into channels, retaining state from
+        one chunk to the next.
+
+        Yields
+        ------
+        y : complex ndarray
+            Channels for each input chunk, as soon as they are computed.
+
+        """
+        for x in chunks:
+            yield self.apply(x)
+
+
+class ArbitraryResampler(object):
+    """
+    Resampling by an arbitrary real ratio of output to input sample rate,
+    e.g. 47999.3/48000 to track a free-running clock.
+
+    A lowpass prototype filter is designed at "phases" times the input rate
+    and split into polyphase components, as for ResamplerBank, and each 
+    output sample is interpolated linearly between the two phases either
+    side of its time; so there is no need for a giant integer uprate.  The
+    ratio can be changed between calls to apply (see set_ratio), and the
+    state carries over.  An int16 or int32 signal is read as it is, without
+    a floating point copy, as by ResamplerBank.
+    """
+    def __init__(self, x, ratio, xdim=-1, phases=128, beta=5.0, 
+                 half_width=10, cutoff=None):
+        """
+        Construct the ArbitraryResampler object.
+
+        Parameters
+        ----------
+        x : array-like
+            Input signal array.  May be multi-dimensional (ND).  The signals
+            will be operated on along the "xdim" dimension of x.
+        ratio : float
+            Ratio of the output sample rate to the input sample rate.
+        xdim : int, optional
+            Dimension for "x" input signal array. (default=-1)
+        phases : int, optional
+            Number of phases of the prototype filter; the error of the 
+            linear interpolation between them falls as 1/phases**2.
+            (default=128)
+        beta, half_width : optional
+            Design of the filter, see resample.
+        cutoff : float, optional
+            Cutoff frequency of the filter, relative to the Nyquist 
+            frequency of the input.  To track a drifting ratio, it should
+            suit the whole range of ratios.  (default=min(1, ratio))
+
+        Attributes
+        ----------
+        delay : float
+            Delay of the filter, in input samples.
+
+        """
+        x = np.atleast_1d(x)
+        if cutoff is None:
+            cutoff = min(1., ratio)
+        h = design_arbitrary_filter(phases, cutoff, beta, half_width)
+        self.input_type, coef_type, self.output_type = dtype_lookup(x, h)
+        x = dim2back(x, xdim)
+        self.shape = x.shape[:-1]
+        klass = _lookup(_ARBITRARY_BANK_SWITCH_YARD, 
+                        _INT_ARBITRARY_BANK_SWITCH_YARD, x, h, False)
+        self.bank = klass(phases, ratio, np.asarray(h, coef_type), 
+                          max(1, int(np.prod(self.shape))))
+        self.coefs_per_phase = self.bank.coefsPerPhase()
+        self.delay = (len(h) - 1) / 2. / phases
+        self.xdim = xdim
+
+    @property
+    def ratio(self):
+        return self.bank.ratio()
+
+    def set_ratio(self, ratio):
+        """
+        Set the ratio of the output to the input sample rate, from the next
+        output sample on.
+        """
+        self.bank.setRatio(ratio)
+
+    def needed_out_count(self, in_count, all_samples=False):
+        """
+        Return the number of output samples the next call to apply will 
+        compute from in_count input samples.
+        """
+        return self.bank.neededOutCount(in_count, all_samples)
+
+    def apply(self, x, all_samples=False, out=None):
+        """
+        Resample a signal or array of signals, as ResamplerBank.apply.
+
+        Parameters
+        ----------
+        x : array-like
+            Input signal array.  May be multi-dimensional (ND).  The signals
+            will be operated on along the "xdim" dimension of x.
+        all_samples : bool, optional
+            If True, also returns the outputs of flush, ending the stream.
+            (default=False)
+        out : ndarray, optional
+            Array in which to put the output, see ResamplerBank.apply.
+            (default=None)
+            
+        Returns
+        -------
+        y : float ndarray
+            The output signal array.
+
+        """
+        x = np.atleast_1d(x)
+        x = dim2back(x, self.xdim)
+        if x.shape[:-1] != self.shape:
+            raise ValueError("x must have %d signals of shape %s" % \
+                             (int(np.prod(self.shape)), self.shape))
+        if self.input_type.kind == 'i':
+            # integer samples must not be truncated
+            if not np.can_cast(x.dtype, self.input_type, 'safe'):
+                raise ValueError("x must have data type %s" % \
+                                 self.input_type)
+            x = np.asarray(x, self.input_type)
+        elif np.can_cast(x.dtype, self.input_type, 'same_kind'):
+            x = np.asarray(x, self.input_type)
+        apply_count = self.bank.neededOutCount(x.shape[-1])
+        needed_out_count = self.needed_out_count(x.shape[-1], all_samples)
+        if out is None:
+            y = np.empty(self.shape + (needed_out_count,), self.output_type)
+        else:
+            y = dim2back(out, self.xdim)
+            if y.dtype != self.output_type:
+                raise ValueError("out must have data type %s" % \
+                                 self.output_type)
+            if y.shape[:-1] != self.shape or y.shape[-1] < needed_out_count:
+                raise ValueError("out has wrong shape, or not enough output "
+                                 "samples")
+        count = self.bank.apply(x, y, 0)
+        if all_samples:
+            count += self.bank.flush(y[..., apply_count:], 0)
+        return back2dim(y[..., :count], self.xdim)
+
+    def flush(self):
+        """
+        End the stream: return the outputs that coefs_per_phase - 1 zeros
+        after the last input would give, i.e. the rest of the response.
+        
+        Returns
+        -------
+        y : float ndarray
+    
+        """
+        count = self.bank.neededOutCount(self.coefs_per_phase-1)
+        y = np.empty(self.shape + (count,), self.output_type)
+        count = self.bank.flush(y, 0)
+        return back2dim(y[..., :count], self.xdim)
+
+    def stream(self, chunks, flush=True):
+        """
+        Resample a stream of signal chunks, see ResamplerBank.stream.
+        """
+        for x in chunks:
+            yield self.apply(x)
+        if flush:
+            yield self.flush()
+
+
+class DownConverter(object):
+    """
+    A digital down-converter: a signal is mixed down by a frequency, i.e. 
+    multiplied by exp(-2j*pi*frequency*n), then upsampled, filtered and 
+    downsampled, as by ResamplerBank, giving a complex output.
+
+    The mixing is folded into the filter, which is modulated up by the 
+    frequency, and each output sample is rotated by the mixer's phase at
+    its time, so there is no full rate complex intermediate, and only the
+    input samples that some output needs are multiplied at all.  The 
+    mixer's phase carries over from one call of apply to the next.
+    """
+    def __init__(self, x, h, frequency, uprate=1, downrate=1, xdim=-1):
+        """
+        Construct the DownConverter object.
+
+        Parameters
+        ----------
+        x : array-like
+            Input signal array.  May be multi-dimensional (ND).  The signals
+            will be operated on along the "xdim" dimension of x.  Integer 
+            (int16 or int32) signals are read without a floating point copy.
+        h : array-like
+            FIR (finite-impulse response) filter coefficients, a single 
+            filter for all the signals, at uprate times the input rate.
+        frequency : float
+            Frequency mixed down to 0, in cycles per input sample.
+        uprate : int, optional
+            Upsampling rate. (default=1)
+        downrate : int, optional
+            Downsampling rate. (default=1)
+        xdim : int, optional
+            Dimension for "x" input signal array. (default=-1)
+
+        """
+        x = np.atleast_1d(x)
+        h = np.atleast_1d(h)
+        if h.ndim != 1:
+            raise ValueError("h must be a single filter")
+        self.input_type, coef_type, output_type = dtype_lookup(x, h)
+        self.output_type = np.result_type(output_type, np.complex64)
+        x = dim2back(x, xdim)
+        self.shape = x.shape[:-1]
+        klass = _lookup(_DOWN_CONVERTER_BANK_SWITCH_YARD, 
+                        _INT_DOWN_CONVERTER_BANK_SWITCH_YARD, x, h, False)
+        self.bank = klass(uprate, downrate, frequency, 
+                          np.asarray(h, coef_type), 
+                          max(1, int(np.prod(self.shape))))
+        self.coefs_per_phase = self.bank.coefsPerPhase()
+        self.xdim = xdim
+
+    @property
+    def frequency(self):
+        return self.bank.frequency()
+
+    def needed_out_count(self, in_count, all_samples=False):
+        """
+        Return the number of output samples the next call to apply will 
+        compute from in_count input samples.
+        """
         if all_samples:
             in_count += self.coefs_per_phase-1
-            z = np.zeros((self.coefs_per_phase-1,))
-        needed_out_count = self.r0.neededOutCount(in_count)
-        y = np.zeros(xx.shape[:-1] + (needed_out_count,), \
-                dtype=self.output_type)
-        for idx, xi in enumdims(xx, (-1,), complement=True):
-            out_count = self.bank[idx].apply(xi, y[idx])
-            if all_samples:
-                self.bank[idx].apply(z,  y[idx][out_count:])
-        return back2dim(y, self.xdim)
+        return self.bank.neededOutCount(in_count)
 
+    def apply(self, x, all_samples=False, out=None):
+        """
+        Down-convert a signal or array of signals, as ResamplerBank.apply.
 
-def upfirdn(x, h, uprate=1, downrate=1, xdim=-1, hdim=-1, all_samples=True):
+        Parameters
+        ----------
+        x : array-like
+            Input signal array.  May be multi-dimensional (ND).  The signals
+            will be operated on along the "xdim" dimension of x.
+        all_samples : bool, optional
+            If True, also returns the outputs of flush, ending the stream.
+            (default=False)
+        out : ndarray, optional
+            Array in which to put the output, see ResamplerBank.apply.
+            (default=None)
+            
+        Returns
+        -------
+        y : complex ndarray
+            The output signal array.
+
+        """
+        x = np.atleast_1d(x)
+        x = dim2back(x, self.xdim)
+        if x.shape[:-1] != self.shape:
+            raise ValueError("x must have %d signals of shape %s" % \
+                             (int(np.prod(self.shape)), self.shape))
+        if self.input_type.kind == 'i':
+            # integer samples must not be truncated
+            if not np.can_cast(x.dtype, self.input_type, 'safe'):
+                raise ValueError("x must have data type %s" % \
+                                 self.input_type)
+            x = np.asarray(x, self.input_type)
+        elif np.can_cast(x.dtype, self.input_type, 'same_kind'):
+            x = np.asarray(x, self.input_type)
+        apply_count = self.bank.neededOutCount(x.shape[-1])
+        needed_out_count = self.needed_out_count(x.shape[-1], all_samples)
+        if out is None:
+            y = np.empty(self.shape + (needed_out_count,), self.output_type)
+        else:
+            y = dim2back(out, self.xdim)
+            if y.dtype != self.output_type:
+                raise ValueError("out must have data type %s" % \
+                                 self.output_type)
+            if y.shape[:-1] != self.shape or y.shape[-1] < needed_out_count:
+                raise ValueError("out has wrong shape, or not enough output "
+                                 "samples")
+        count = self.bank.apply(x, y, 0)
+        if all_samples:
+            count += self.bank.flush(y[..., apply_count:], 0)
+        return back2dim(y[..., :count], self.xdim)
+
+    def flush(self):
+        """
+        End the stream: return the outputs that coefs_per_phase - 1 zeros
+        after the last input would give, i.e. the rest of the response.
+        
+        Returns
+        -------
+        y : complex ndarray
+    
+        """
+        count = self.bank.neededOutCount(self.coefs_per_phase-1)
+        y = np.empty(self.shape + (count,), self.output_type)
+        count = self.bank.flush(y, 0)
+        return back2dim(y[..., :count], self.xdim)
+
+    def stream(self, chunks, flush=True):
+        """
+        Down-convert a stream of signal chunks, see ResamplerBank.stream.
+        """
+        for x in chunks:
+            yield self.apply(x)
+        if flush:
+            yield self.flush()
+
+
+def upfirdn(x, h, uprate=1, downrate=1, xdim=-1, hdim=-1, all_samples=True,
+            n_workers=1, method='auto', out=None, integer_output=False, 
+            scale=1., backend='threads'):
     """
     Upsample, FIR filter, and downsample a signal or array of signals.
     
@@ -259,13 +1396,35 @@ def upfirdn(x, h, uprate=1, downrate=1, xdim=-1, hdim=-1, all_samples=True):
     all_samples : bool, optional
         If True, feeds in zeros after the input signal to "drain" the resampler
         and get all the non-zero samples.  (default=True)
+    n_workers : int, optional
+        Number of threads over which to spread the signals.  With fewer 
+        signals than workers (e.g. one long signal), the output is split 
+        into time segments instead, see Notes. (default=1)
+    method : {'auto', 'direct', 'fft'}, optional
+        Use the direct polyphase form, or the overlap-save FFT form which is
+        faster for long filters.  'auto' chooses from the filter length and
+        rates.  (default='auto')
+    out : ndarray, optional
+        Array in which to put the output, see ResamplerBank.apply.
+        (default=None)
+    integer_output : bool, optional
+        If True, the output of an int16 or int32 signal has the same type,
+        rounded and saturated.  (default=False)
+    scale : float, optional
+        Gain applied to the output.  (default=1.)
+    backend : {'threads', 'processes'}, optional
+        Spread the work over n_workers threads, or forked processes which
+        inherit x and write the output to shared memory, see ResamplerBank.
+        "out" cannot be given with 'processes'.  (default='threads')
         
     Returns
     -------
     y : float ndarray
         The output signal array.  The results of each upfirdn operation are
         along the "xdim" dimension; the array is discontinuous if xdim is not
-        the last dimension.
+        the last dimension.  If "out" is given, y is a view of it.  A 
+        float32, complex64 or int16 input signal is filtered in single 
+        precision, and gives a float32 or complex64 output.
 
     Notes
     -----
@@ -277,9 +1436,16 @@ def upfirdn(x, h, uprate=1, downrate=1, xdim=-1, hdim=-1, all_samples=True):
     columns with a single filter, or apply multiple filters to a single signal.
     The uprate and downrate however are scalar and apply to ALL operations.
     
-    In the case of ND, the most efficient choice of xdim is -1, that is, the
-    last dimension (assuming C-style input x); otherwise each signal is copied
-    prior to operating.
+    The signals are read and written in place whatever the choice of xdim,
+    but xdim=-1 (the last dimension, assuming C-style input x) is the most
+    efficient, as the samples of each signal are then contiguous.
+
+    When there are fewer signals than n_workers, and the signals are long
+    enough (at least 65536 input samples per segment), the
+    output is split into consecutive segments, each computed by a worker
+    as by upfirdn_range: from its own resampler, started at the phase of 
+    its first output, with the coefs_per_phase - 1 inputs before it as a
+    "halo".  So the result is the same as computed in one pass.
     
     Examples
     --------
@@ -324,8 +1490,300 @@ def upfirdn(x, h, uprate=1, downrate=1, xdim=-1, hdim=-1, all_samples=True):
            [ 6.,  7.]])
 
     """
-    resampler_bank = ResamplerBank(x, h, uprate, downrate, xdim, hdim)
-    return resampler_bank.apply(x, all_samples)
+    x = np.atleast_1d(x)
+    if n_workers > 1:
+        n_segments = min(n_workers, x.shape[xdim] // _SEGMENT_MIN_SAMPLES)
+        signals = np.broadcast(dim2back(x, xdim)[..., 0], 
+                               dim2back(np.atleast_1d(h), hdim)[..., 0]).size
+        if n_segments > 1 and signals < n_workers:
+            return _upfirdn_segments(x, h, uprate, downrate, xdim, hdim, 
+                                     all_samples, n_segments, method, out, 
+                                     integer_output, scale, backend)
+    resampler_bank = ResamplerBank(x, h, uprate, downrate, xdim, hdim, 
+                                   n_workers, method, integer_output, scale,
+                                   backend)
+    return resampler_bank.apply(x, all_samples, out)
+
+def _upfirdn_segments(x, h, uprate, downrate, xdim, hdim, all_samples, 
+                      n_segments, method, out, integer_output, scale, 
+                      backend):
+    """upfirdn, with the output split into n_segments consecutive time 
+    segments, computed concurrently by a pool of threads or processes."""
+    if backend not in ('threads', 'processes'):
+        raise ValueError("backend must be 'threads' or 'processes'")
+    x = dim2back(x, xdim)
+    banks = [ResamplerBank(x[..., 0:1], h, uprate, downrate, -1, hdim, 1, 
+                           method, integer_output, scale) 
+             for i in range(n_segments)]
+    total = banks[0].needed_out_count(x.shape[-1], all_samples)
+    bounds = np.linspace(0, total, n_segments+1).astype(int)
+    if backend == 'processes':
+        if out is not None:
+            raise ValueError("out cannot be given with the process backend")
+        y = _shared_empty(banks[0].shape + (total,), banks[0].output_type)
+    else:
+        if out is not None:
+            out = dim2back(out, xdim)
+        y = banks[0]._output_array(total, out)
+    work = [(bank, x, start, stop, y) 
+            for bank, start, stop in zip(banks, bounds[:-1], bounds[1:])]
+    if backend == 'processes':
+        _fork_map(_apply_segment, work)
+    else:
+        pool = ThreadPool(n_segments)
+        try:
+            pool.map(_apply_segment, work)
+        finally:
+            pool.terminate()
+    return back2dim(y[..., :total], xdim)
+
+
+def upfirdn_range(x, h, uprate=1, downrate=1, start=0, stop=None, xdim=-1,
+                  hdim=-1, n_workers=1, method='auto', integer_output=False,
+                  scale=1.):
+    """
+    Compute output samples start, ..., stop-1 of upfirdn(x, h, uprate, 
+    downrate), e.g. to seek in a long signal, at a cost in proportion to 
+    stop - start rather than to the length of x.
+
+    Output k is computed with phase k*downrate % uprate of the filter from
+    the inputs up to k*downrate // uprate, so only the inputs from
+    (start*downrate // uprate) - coefs_per_phase + 1 to 
+    ((stop - 1)*downrate // uprate) are filtered.
+
+    Parameters
+    ----------
+    x, h, uprate, downrate, xdim, hdim : 
+        See upfirdn.
+    start : int, optional
+        First output sample.  (default=0)
+    stop : int, optional
+        One past the last output sample.  start and stop are as for a 
+        slice of the output of upfirdn (with all_samples=True), so may be 
+        negative, and are clipped to its length.  (default=None, the end)
+    n_workers, method, integer_output, scale : optional
+        See upfirdn.
+
+    Returns
+    -------
+    y : ndarray
+        upfirdn(x, h, uprate, downrate, xdim=xdim, hdim=hdim)[..., start:stop]
+        along the "xdim" dimension.
+
+    Examples
+    --------
+    >>> upfirdn_range(range(10), [.5,1,.5], 2, 3, 2, 5)
+    array([ 2.5,  4. ,  5.5])
+
+    """
+    x = dim2back(np.atleast_1d(x), xdim)
+    resampler_bank = ResamplerBank(x[..., 0:1], h, uprate, downrate, -1,
+                                   hdim, n_workers, method, integer_output, 
+                                   scale)
+    total = resampler_bank.needed_out_count(x.shape[-1], all_samples=True)
+    start, stop = slice(start, stop).indices(total)[:2]
+    stop = max(start, stop)
+    y = resampler_bank._output_array(stop - start)
+    _apply_range(resampler_bank, x, start, stop, y)
+    return back2dim(y, xdim)
+
+
+def _open_signal(src, dtype, shape):
+    """Memory-map the input file src (a .npy file, or a raw binary file of
+    the given dtype and shape), or return src if it is an array."""
+    if not isinstance(src, basestring):
+        return np.asanyarray(src)
+    if src.endswith('.npy'):
+        return np.load(src, mmap_mode='r')
+    if dtype is None:
+        raise ValueError("dtype is needed to read a raw binary file")
+    if os.path.getsize(src) == 0:
+        # an empty file cannot be memory-mapped
+        x = np.empty(0, dtype)
+    else:
+        x = np.memmap(src, dtype, mode='r')
+    if shape is not None:
+        x = x.reshape(shape)
+    return x
+
+def _create_signal(dst, dtype, shape):
+    """Memory-map a new output file dst (a .npy file, or a raw binary file)
+    of the given dtype and shape, or check that the array dst has them."""
+    if not isinstance(dst, basestring):
+        if dst.dtype != dtype or dst.shape != shape:
+            raise ValueError("dst must have data type %s and shape %s" % \
+                             (dtype, shape))
+        return dst
+    if dst.endswith('.npy'):
+        return np.lib.format.open_memmap(dst, 'w+', dtype, shape)
+    if 0 in shape:
+        # an empty file cannot be memory-mapped
+        open(dst, 'wb').close()
+        return np.empty(shape, dtype)
+    return np.memmap(dst, dtype, mode='w+', shape=shape)
+
+def upfirdn_file(src, dst, h, uprate=1, downrate=1, xdim=-1, hdim=-1, 
+                 all_samples=True, chunk_size=1<<16, dtype=None, shape=None, 
+                 n_workers=1, method='auto', integer_output=False, scale=1.):
+    """
+    Upsample, FIR filter, and downsample a signal file, or array of signals,
+    larger than memory.
+    
+    The input is memory-mapped and fed to a ResamplerBank chunk_size 
+    samples at a time, and each chunk of output is written straight into
+    the memory-mapped output, so the memory used does not grow with the 
+    length of the signals.
+
+    Parameters
+    ----------
+    src : str or array-like
+        Input signal array: the name of a .npy file, or of a raw binary file
+        (see dtype and shape), or an array such as a numpy.memmap.  The 
+        signals are along the "xdim" dimension, as for upfirdn.
+    dst : str or ndarray
+        Output signal array: the name of a .npy file or raw binary file to 
+        create, or an array of the output shape and data type.
+    h : array-like
+        FIR (finite-impulse response) filter coefficients array.  May be ND.
+        The filters are along the "hdim" dimension of h.
+    uprate : int, optional
+        Upsampling rate. (default=1)
+    downrate : int, optional
+        Downsampling rate. (default=1)
+    xdim : int, optional
+        Dimension for "x" input signal array. (default=-1)
+    hdim : int, optional
+        Dimension for "h" coefficient array. (default=-1)
+    all_samples : bool, optional
+        If True, feeds in zeros after the input signal to "drain" the resampler
+        and get all the non-zero samples.  (default=True)
+    chunk_size : int, optional
+        Number of input samples per signal read at a time.  (default=65536)
+    dtype : dtype, optional
+        Data type of a raw binary input file.  (default=None)
+    shape : tuple of ints, optional
+        Shape of a raw binary input file, one dimension of which may be -1;
+        by default the file holds a single signal.  (default=None)
+    n_workers, method, integer_output, scale : optional
+        See upfirdn.
+        
+    Returns
+    -------
+    y : ndarray
+        The output signal array, memory-mapped when "dst" is a file name.
+
+    Examples
+    --------
+    Resample interleaved 2 channel int16 PCM to an int16 .npy file:
+
+    >>> upfirdn_file('in.pcm', 'out.npy', h, 3, 2, xdim=0, dtype=np.int16, 
+    ...              shape=(-1, 2), integer_output=True)
+
+    """
+    x = _open_signal(src, dtype, shape)
+    x = np.atleast_1d(x)
+    in_count = x.shape[xdim]
+    idx = [slice(None)] * x.ndim
+    idx[xdim] = slice(0, 1)
+    # the bank is made from one sample of each signal, which an empty 
+    # file lacks, so stand in zeros of the same shape
+    first = x[tuple(idx)]
+    if in_count == 0:
+        first_shape = list(x.shape)
+        first_shape[xdim] = 1
+        first = np.zeros(first_shape, x.dtype)
+    resampler_bank = ResamplerBank(first, h, uprate, downrate, xdim,
+                                   hdim, n_workers, method, integer_output, 
+                                   scale)
+    # an empty file gives an empty output, with no response to drain
+    out_count = resampler_bank.needed_out_count(in_count, 
+                                                all_samples and in_count > 0)
+    # the output shape, with the samples along xdim, as back2dim gives it
+    out_shape = list(resampler_bank.shape)
+    out_dim = xdim + len(out_shape) + 1 if xdim < 0 else xdim
+    out_shape.insert(out_dim, out_count)
+    y = _create_signal(dst, resampler_bank.output_type, tuple(out_shape))
+    
+    out_idx = [slice(None)] * y.ndim
+    out_ptr = 0
+    for start in range(0, in_count, chunk_size):
+        idx[xdim] = slice(start, start + chunk_size)
+        last = start + chunk_size >= in_count
+        out_end = out_ptr + resampler_bank.needed_out_count(
+            min(chunk_size, in_count - start), all_samples and last)
+        out_idx[xdim] = slice(out_ptr, out_end)
+        resampler_bank.apply(x[tuple(idx)], all_samples and last, 
+                             out=y[tuple(out_idx)])
+        out_ptr = out_end
+    if isinstance(y, np.memmap):
+        y.flush()
+    return y
+
+
+def resample(x, uprate, downrate=1, xdim=-1, beta=5.0, half_width=10, 
+             n_workers=1, method='auto', integer_output=False):
+    """
+    Resample a signal or array of signals by the rational factor
+    uprate/downrate, using a Kaiser-windowed sinc anti-aliasing filter.
+    
+    Parameters
+    ----------
+    x : array-like
+        Input signal array.  May be multi-dimensional (ND).  The signals
+        will be operated on along the "xdim" dimension of x.
+    uprate : int
+        Upsampling rate.
+    downrate : int, optional
+        Downsampling rate. (default=1)
+    xdim : int, optional
+        Dimension for "x" input signal array. (default=-1)
+    beta : float, optional
+        Kaiser window shape parameter.  (default=5.0)
+    half_width : int, optional
+        Number of zero crossings of the windowed sinc on each side of its 
+        center.  (default=10)
+    n_workers : int, optional
+        Number of threads over which to spread the signals. (default=1)
+    method : {'auto', 'direct', 'fft'}, optional
+        See upfirdn.  (default='auto')
+    integer_output : bool, optional
+        See upfirdn.  (default=False)
+        
+    Returns
+    -------
+    y : float ndarray
+        The resampled signal array, with ceil(n*uprate/downrate) samples
+        along the "xdim" dimension for n input samples.  The delay of the
+        filter is removed, so that y[0] is aligned with x[0].
+
+    Notes
+    -----
+    uprate and downrate are reduced by their greatest common divisor.  The
+    filters are designed by design_resample_filter, which keeps recently 
+    used designs in filter_cache; see filter_cache.info() for its hit and 
+    miss counts.  A design is cached with its polyphase layout, which the 
+    direct form copies as it is.
+    
+    Examples
+    --------
+    >>> resample(np.ones(10), 3, 2).shape
+    (15,)
+
+    """
+    f = design_resample_filter(uprate, downrate, beta, half_width)
+    x = np.atleast_1d(x)
+    if f.uprate == f.downrate:
+        return x.astype(dtype_lookup(x, f.coefs, integer_output)[-1])
+    in_count = x.shape[xdim]
+    out_count = -(-in_count * f.uprate // f.downrate)
+    resampler_bank = ResamplerBank(x, f.coefs, f.uprate, f.downrate, xdim, 
+                                   n_workers=n_workers, method=method,
+                                   integer_output=integer_output, 
+                                   phases=f.phases)
+    y = resampler_bank.apply(x, all_samples=True)
+    idx = [slice(None)] * y.ndim
+    idx[xdim] = slice(f.delay, f.delay + out_count)
+    return y[tuple(idx)]
 
 
 from numpy.testing import Tester
@@ -0,0 +1,290 @@
+# Copyright (c) 2009, Motorola, Inc
+# 
+# All Rights Reserved.
+# 
+# Redistribution and use in source and binary forms, with or without 
+# modification, are permitted provided that the following conditions are
+# met:
+# 
+# * Redistributions of source code must retain the above copyright notice,
+# this list of conditions and the following disclaimer.
+# 
+# * Redistributions in binary form must reproduce the above copyright 
+# notice, this list of conditions and the following disclaimer in the 
+# documentation and/or other materials provided with the distribution.
+# 
+# * Neither the name of Motorola nor the names of its contributors may be 
+# used to endorse or promote products derived from this software without 
+# specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS 
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR 
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR 
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF 
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING 
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS 
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+Benchmarks of upfirdn, run by upfirdn.bench() (nose runs the bench_* 
+functions), or as a script:
+
+  python -m upfirdn.bench_upfirdn [results.json] [--compare baseline.json]
+                                  [--tolerance 1.2]
+
+Each benchmark times the best of a few runs of one case, along one axis:
+filter length, rates, data types, channel count, chunk size when 
+streaming, and the "xdim" layout; and against the naive reference 
+(zero-stuffing and np.convolve) and np.convolve itself.  The results are
+printed, and kept as records (dicts of the benchmark, its parameters, the
+seconds taken and the input samples per second), written one JSON object
+per line to the results file, or to the file named by the environment 
+variable UPFIRDN_BENCH_OUTPUT when run by upfirdn.bench().  compare finds
+the records of a run that are slower than those of a baseline run, e.g. 
+the previous release, so performance regressions can be caught.
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+import upfirdn
+from test_upfirdn import resample
+
+random_state = np.random.RandomState(17)
+
+# input samples per signal of each case
+SIGNAL_LENGTH = 2**18
+
+# records of the benchmarks run so far
+results = []
+
+def best_time(func, repeat=3):
+    """Return the shortest time, in seconds, of repeat calls to func."""
+    best = np.inf
+    for i in range(repeat):
+        start = time.time()
+        func()
+        best = min(best, time.time() - start)
+    return best
+
+def record(bench, params, seconds, in_samples, reference=None):
+    """
+    Keep, print and (if UPFIRDN_BENCH_OUTPUT is set) write the record of 
+    one case of a benchmark.
+
+    Parameters
+    ----------
+    bench : str
+        Name of the benchmark.
+    params : dict
+        Parameters of the case, which identify it within the benchmark.
+    seconds : float
+        Time taken.
+    in_samples : int
+        Number of input samples filtered, over all the channels.
+    reference : float, optional
+        Time taken by a reference implementation of the case, if any.
+
+    """
+    r = {'bench': bench, 'params': params, 'seconds': seconds,
+         'samples_per_second': in_samples / seconds}
+    if reference is not None:
+        r['reference_seconds'] = reference
+    results.append(r)
+    print '%-14s %-58s %9.5f s %8.2f MS/s%s' % \
+        (bench, ' '.join('%s=%s' % kv for kv in sorted(params.items())), 
+         seconds, in_samples / seconds / 1e6, 
+         '' if reference is None else '  %7.1fx' % (reference / seconds))
+    path = os.environ.get('UPFIRDN_BENCH_OUTPUT')
+    if path:
+        with open(path, 'a') as f:
+            f.write(json.dumps(r, sort_keys=True) + '\n')
+    return r
+
+def signal(shape, dtype=np.float64):
+    """Return a random signal array of the given shape and data type."""
+    x = random_state.randn(*shape)
+    if np.dtype(dtype).kind == 'c':
+        x = x + 1j * random_state.randn(*shape)
+    elif np.dtype(dtype).kind == 'i':
+        x = 1000 * x
+    return x.astype(dtype)
+
+def bench_filter_length():
+    """Resampling by 3/2 with filters from 16 to 4096 taps, by the direct 
+    and the FFT methods."""
+    x = signal((SIGNAL_LENGTH,))
+    for n in (16, 64, 256, 1024, 4096):
+        h = random_state.randn(n)
+        for method in ('direct', 'fft'):
+            t = best_time(lambda: upfirdn.upfirdn(x, h, 3, 2, method=method))
+            record('filter_length', {'taps': n, 'method': method}, t, 
+                   x.size)
+
+def bench_rates():
+    """Resampling by rates from 1/8 to 8, with the filters designed by
+    resample."""
+    x = signal((SIGNAL_LENGTH,))
+    for p, q in [(1, 2), (2, 1), (3, 2), (2, 3), (1, 8), (8, 1), 
+                 (147, 160), (160, 147)]:
+        h = upfirdn.design_resample_filter(p, q).coefs
+        t = best_time(lambda: upfirdn.upfirdn(x, h, p, q))
+        record('rates', {'up': p, 'down': q, 'taps': len(h)}, t, x.size)
+
+def bench_types():
+    """Resampling by 3/2 with 64 taps, for each combination of signal and
+    coefficient types."""
+    h = random_state.randn(64)
+    for dtype in (np.float64, np.complex128, np.float32, np.complex64, 
+                  np.int16, np.int32):
+        x = signal((SIGNAL_LENGTH,), dtype)
+        for coefs in (h, h + 1j*h[::-1]):
+            t = best_time(lambda: upfirdn.upfirdn(x, coefs, 3, 2))
+            record('types', {'signal': np.dtype(dtype).name, 
+                             'coefs': coefs.dtype.name}, t, x.size)
+        if x.dtype.kind == 'i':
+            t = best_time(lambda: upfirdn.upfirdn(x, h, 3, 2, 
+                                                  integer_output=True))
+            record('types', {'signal': x.dtype.name, 'coefs': h.dtype.name,
+                             'integer_output': True}, t, x.size)
+
+def bench_channels():
+    """Resampling by 3/2 with 64 taps, of the same number of samples in 
+    from 1 to 512 channels, with 1 and 4 workers, and one signal against 
+    as many filters."""
+    h = random_state.randn(64)
+    for channels in (1, 8, 64, 512):
+        x = signal((channels, SIGNAL_LENGTH // channels))
+        for n_workers in (1, 4):
+            t = best_time(lambda: upfirdn.upfirdn(x, h, 3, 2, 
+                                                  n_workers=n_workers))
+            record('channels', {'channels': channels, 
+                                'n_workers': n_workers}, t, x.size)
+        hh = random_state.randn(channels, 64)
+        t = best_time(lambda: upfirdn.upfirdn(x[0], hh, 3, 2))
+        record('channels', {'channels': channels, 'filters': channels}, t,
+               x.size)
+
+def bench_chunks():
+    """Streaming resampling by 3/2 with 64 taps, in chunks of 64 to 65536
+    samples."""
+    x = signal((SIGNAL_LENGTH,))
+    h = random_state.randn(64)
+    for chunk in (64, 1024, 16384, 65536):
+        chunks = np.split(x, len(x) // chunk)
+        def run():
+            bank = upfirdn.ResamplerBank(x, h, 3, 2)
+            out = np.empty(bank.max_out_count(chunk))
+            for c in chunks:
+                bank.apply(c, out=out)
+        t = best_time(run)
+        record('chunks', {'chunk': chunk}, t, x.size)
+
+def bench_xdim():
+    """Resampling by 3/2 with 64 taps of 16 channels, with the samples along
+    the last dimension (contiguous) and along the first."""
+    h = random_state.randn(64)
+    x = signal((16, SIGNAL_LENGTH // 16))
+    for xdim, xx in [(-1, x), (0, np.ascontiguousarray(x.T))]:
+        t = best_time(lambda: upfirdn.upfirdn(xx, h, 3, 2, xdim=xdim))
+        record('xdim', {'xdim': xdim}, t, x.size)
+
+def bench_reference():
+    """upfirdn against the naive reference (zero-stuffing, np.convolve and
+    decimation), and against np.convolve for plain FIR filtering."""
+    x = signal((SIGNAL_LENGTH // 4,))
+    for p, q, n in [(3, 2, 64), (1, 4, 128), (4, 1, 128)]:
+        h = random_state.randn(n)
+        reference = best_time(lambda: resample(x, h, p, q), 1)
+        t = best_time(lambda: upfirdn.upfirdn(x, h, p, q))
+        record('reference', {'up': p, 'down': q, 'taps': n, 
+                             'against': 'resample'}, t, x.size, reference)
+    for n in (16, 256, 4096):
+        h = random_state.randn(n)
+        reference = best_time(lambda: np.convolve(x, h))
+        t = best_time(lambda: upfirdn.upfirdn(x, h))
+        record('reference', {'taps': n, 'against': 'convolve'}, t, x.size, 
+               reference)
+
+def _key(r):
+    return (r['bench'], tuple(sorted(r['params'].items())))
+
+def load(path):
+    """Return the records in a results file, one JSON object per line, 
+    skipping the lines that are not records (e.g. system information)."""
+    with open(path) as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    return [r for r in records if 'bench' in r]
+
+def compare(baseline, current, tolerance=1.2):
+    """
+    Compare two runs of the benchmarks.
+
+    Parameters
+    ----------
+    baseline, current : list of dict
+        Records of the two runs, see load.
+    tolerance : float, optional
+        Ratio of the current to the baseline time above which a case counts
+        as slower.  (default=1.2)
+
+    Returns
+    -------
+    slower : list of (bench, params, baseline seconds, current seconds)
+        The cases of both runs that are slower in the current one.
+
+    """
+    old = dict((_key(r), r) for r in baseline)
+    slower = []
+    for r in current:
+        b = old.get(_key(r))
+        if b is not None and r['seconds'] > tolerance * b['seconds']:
+            slower.append((r['bench'], r['params'], b['seconds'], 
+                           r['seconds']))
+    return slower
+
+BENCHMARKS = [bench_filter_length, bench_rates, bench_types, bench_channels,
+              bench_chunks, bench_xdim, bench_reference]
+
+def main(argv):
+    """Run all the benchmarks, write the results, and report the cases 
+    slower than a baseline; returns 1 if there are any."""
+    args = list(argv)
+    options = {'--compare': None, '--tolerance': 1.2}
+    for option in options:
+        if option in args:
+            i = args.index(option)
+            options[option] = args[i + 1]
+            del args[i:i + 2]
+    baseline = options['--compare']
+    path = args[0] if args else None
+    del results[:]
+    for bench in BENCHMARKS:
+        bench()
+    if path:
+        with open(path, 'w') as f:
+            info = {'python': platform.python_version(), 
+                    'numpy': np.__version__, 'machine': platform.machine(),
+                    'platform': platform.platform(), 'time': time.time()}
+            f.write(json.dumps(info, sort_keys=True) + '\n')
+            for r in results:
+                f.write(json.dumps(r, sort_keys=True) + '\n')
+    if baseline:
+        slower = compare(load(baseline), results, 
+                         float(options['--tolerance']))
+        for bench, params, old, new in slower:
+            print 'SLOWER: %s %s %.5f s -> %.5f s' % (bench, params, old, new)
+        return int(bool(slower))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,399 @@
+# Copyright (c) 2009, Motorola, Inc
+# 
+# All Rights Reserved.
+# 
+# Redistribution and use in source and binary forms, with or without 
+# modification, are permitted provided that the following conditions are
+# met:
+# 
+# * Redistributions of source code must retain the above copyright notice,
+# this list of conditions and the following disclaimer.
+# 
+# * Redistributions in binary form must reproduce the above copyright 
+# notice, this list of conditions and the following disclaimer in the 
+# documentation and/or other materials provided with the distribution.
+# 
+# * Neither the name of Motorola nor the names of its contributors may be 
+# used to endorse or promote products derived from this software without 
+# specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS 
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR 
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR 
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF 
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING 
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS 
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Anti-aliasing filter design for resampling, with a bounded LRU cache of
+designed filters.
+
+Services that resample at the same few rates redesign the same filter over
+and over; design_resample_filter keeps the most recently used designs, 
+keyed by the (reduced) rates and design parameters, along with their 
+polyphase layout as the direct form stores it, so a ResamplerBank built 
+from a cached design copies its table rather than rearranging the taps.
+
+For large rate ratios, plan_multistage splits the resampling into a 
+cascade of smaller stages, each with its own (cached) filter.
+"""
+
+import threading
+from collections import namedtuple, OrderedDict
+from fractions import gcd
+
+import numpy as np
+from fftresampler import polyphase_coefs
+
+def kaiser_lowpass(num_taps, cutoff, beta=5.0):
+    """
+    Design a linear-phase lowpass FIR filter by the Kaiser window method.
+
+    Parameters
+    ----------
+    num_taps : int
+        Length of the filter.
+    cutoff : float
+        Cutoff frequency, relative to the Nyquist frequency (0 < cutoff <= 1).
+    beta : float, optional
+        Kaiser window shape parameter.  (default=5.0)
+
+    Returns
+    -------
+    h : ndarray
+        Filter coefficients, scaled for unit gain at DC.
+
+    """
+    n = np.arange(num_taps) - (num_taps - 1) / 2.
+    h = cutoff * np.sinc(cutoff * n) * np.kaiser(num_taps, beta)
+    return h / np.sum(h)
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+class FilterCache(object):
+    """
+    A thread-safe, bounded, least-recently-used cache of designed filters.
+    """
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self.clear()
+
+    def get(self, key, design):
+        """Return the cached value for key, calling design() to make it 
+        (and evicting the least recently used value if full) on a miss."""
+        with self._lock:
+            if key in self._cache:
+                self._hits += 1
+                value = self._cache.pop(key)
+                self._cache[key] = value
+                return value
+            self._misses += 1
+        value = design()
+        with self._lock:
+            self._cache[key] = value
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return value
+
+    def info(self):
+        """Return a CacheInfo of hits, misses, maxsize and currsize."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, 
+                             len(self._cache))
+
+    def clear(self):
+        """Empty the cache and reset its statistics."""
+        with self._lock:
+            self._cache = OrderedDict()
+            self._hits = 0
+            self._misses = 0
+
+filter_cache = FilterCache()
+
+ResampleFilter = namedtuple('ResampleFilter', 
+                            'coefs phases uprate downrate delay')
+
+def _resample_filter(uprate, downrate, half_len, cutoff, beta):
+    h = kaiser_lowpass(2*half_len + 1, cutoff, beta) * uprate
+    # pad the front of the filter so that its delay (half_len) is a whole
+    # number of output samples
+    pre_pad = downrate - half_len % downrate
+    h = np.concatenate((np.zeros(pre_pad), h))
+    h.flags.writeable = False
+    # each phase flipped, as PolyphaseFilter stores it
+    phases = np.ascontiguousarray(polyphase_coefs(h, uprate)[:, ::-1])
+    phases.flags.writeable = False
+    return ResampleFilter(h, phases, uprate, downrate, 
+                          (half_len + pre_pad) // downrate)
+
+def _design(uprate, downrate, beta, half_width):
+    max_rate = max(uprate, downrate)
+    return _resample_filter(uprate, downrate, half_width * max_rate, 
+                            1. / max_rate, beta)
+
+def design_resample_filter(uprate, downrate, beta=5.0, half_width=10):
+    """
+    Design (or fetch from filter_cache) the anti-aliasing filter for 
+    resampling by uprate/downrate.
+
+    Parameters
+    ----------
+    uprate : int
+        Upsampling rate.
+    downrate : int
+        Downsampling rate.
+    beta : float, optional
+        Kaiser window shape parameter.  (default=5.0)
+    half_width : int, optional
+        Number of zero crossings of the windowed sinc on each side of its 
+        center.  (default=10)
+
+    Returns
+    -------
+    f : ResampleFilter
+        Named tuple of the (read-only) filter coefficients, their flipped
+        polyphase layout (polyphase_coefs(coefs, uprate)[:, ::-1], the 
+        "phases" argument of ResamplerBank), the rates reduced by their 
+        greatest common divisor, and the delay of the filter in output 
+        samples.
+
+    """
+    g = gcd(uprate, downrate)
+    uprate, downrate = uprate // g, downrate // g
+    key = (uprate, downrate, float(beta), int(half_width))
+    return filter_cache.get(key, 
+                            lambda: _design(uprate, downrate, beta, half_width))
+
+def design_arbitrary_filter(phases, cutoff=1., beta=5.0, half_width=10):
+    """
+    Design (or fetch from filter_cache) the prototype filter of an 
+    ArbitraryResampler.
+
+    Parameters
+    ----------
+    phases : int
+        Number of phases, i.e. the prototype is designed at phases times
+        the input rate.
+    cutoff : float, optional
+        Cutoff frequency, relative to the Nyquist frequency of the input
+        (0 < cutoff <= 1); min(1, ratio) for a ratio of output to input 
+        rate.  (default=1.)
+    beta : float, optional
+        Kaiser window shape parameter.  (default=5.0)
+    half_width : int, optional
+        Number of zero crossings of the windowed sinc on each side of its 
+        center.  (default=10)
+
+    Returns
+    -------
+    coefs : ndarray
+        The (read-only) filter coefficients, of odd length, with a gain of
+        phases so that each phase has unit gain at DC.
+
+    """
+    key = ('arbitrary', int(phases), float(cutoff), float(beta), 
+           int(half_width))
+    def design():
+        half_len = int(np.ceil(half_width * phases / float(cutoff)))
+        h = kaiser_lowpass(2*half_len + 1, float(cutoff) / phases, beta)
+        h *= phases
+        h.flags.writeable = False
+        return h
+    return filter_cache.get(key, design)
+
+def kaiser_attenuation(beta):
+    """Stopband attenuation in dB of a Kaiser window design with shape 
+    parameter beta, i.e. the inverse of Kaiser's formula for beta."""
+    if beta >= 0.1102 * (50 - 8.7):
+        return beta / 0.1102 + 8.7
+    if beta <= 0:
+        return 21.
+    # solve 0.5842*(A - 21)**0.4 + 0.07886*(A - 21) = beta by bisection
+    lo, hi = 21., 50.
+    for i in range(50):
+        mid = (lo + hi) / 2
+        if 0.5842*(mid - 21)**0.4 + 0.07886*(mid - 21) < beta:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+def kaiser_transition(num_taps, beta=5.0):
+    """Transition width, in cycles per sample, of a Kaiser window design
+    of num_taps taps with shape parameter beta (by Kaiser's formula)."""
+    return (kaiser_attenuation(beta) - 7.95) / (14.36 * (num_taps - 1))
+
+def _stage_half_len(uprate, passband, stopband, beta):
+    """Half the length of a stage filter with the given band edges, in 
+    cycles per stage input sample."""
+    transition = (stopband - passband) / uprate
+    # (less a rounding error, so that the single stage design is 
+    # reproduced exactly)
+    return int(np.ceil((kaiser_attenuation(beta) - 7.95) / 
+                       (14.36 * transition) / 2 - 1e-9))
+
+def design_stage_filter(uprate, downrate, passband, stopband, beta=5.0):
+    """
+    Design (or fetch from filter_cache) the filter of one stage of a 
+    multistage resampler.
+
+    Parameters
+    ----------
+    uprate : int
+        Upsampling rate of the stage.
+    downrate : int
+        Downsampling rate of the stage.
+    passband : float
+        Edge of the band to keep, in cycles per stage input sample.
+    stopband : float
+        Edge of the band to reject, in cycles per stage input sample.
+    beta : float, optional
+        Kaiser window shape parameter.  (default=5.0)
+
+    Returns
+    -------
+    f : ResampleFilter
+        As for design_resample_filter.
+
+    """
+    key = ('stage', uprate, downrate, float(passband), float(stopband), 
+           float(beta))
+    half_len = _stage_half_len(uprate, passband, stopband, beta)
+    cutoff = float(passband + stopband) / uprate
+    return filter_cache.get(key, 
+        lambda: _resample_filter(uprate, downrate, half_len, cutoff, beta))
+
+def _stage_macs(uprate, downrate, num_taps):
+    """Multiply-accumulates per input sample of the direct polyphase form 
+    of a stage."""
+    return float(uprate) / downrate * -(-num_taps // uprate)
+
+def _divisors(n):
+    return [d for d in range(1, n + 1) if n % d == 0]
+
+class MultistagePlan(namedtuple('MultistagePlan', 
+                                'stages macs single_stage_macs delay')):
+    """
+    A cascade of resampling stages, see plan_multistage.
+
+    Attributes
+    ----------
+    stages : tuple of ResampleFilter
+        The filter, uprate and downrate of each stage, in order.
+    macs : float
+        Predicted multiply-accumulates per input sample of the cascade.
+    single_stage_macs : float
+        The same for the single stage design_resample_filter design.
+    delay : float
+        Delay of the cascade, in output samples.
+    savings : float
+        single_stage_macs / macs.
+    """
+    __slots__ = ()
+
+    @property
+    def savings(self):
+        return self.single_stage_macs / self.macs
+
+def plan_multistage(uprate, downrate, beta=5.0, half_width=10, max_stages=3):
+    """
+    Plan the resampling by uprate/downrate as a cascade of at most 
+    max_stages smaller resampling stages, with the fewest multiplies.
+
+    The rates are factored into the rates of the stages, and each stage 
+    gets a filter which keeps the passband of the single stage design (see
+    design_resample_filter), and rejects only what would alias or image 
+    into it.  The early stages of a large decimation (or the late stages of
+    a large interpolation), which run at the high rate, then need only short
+    filters.
+
+    Parameters
+    ----------
+    uprate : int
+        Upsampling rate.
+    downrate : int
+        Downsampling rate.
+    beta : float, optional
+        Kaiser window shape parameter.  (default=5.0)
+    half_width : int, optional
+        Number of zero crossings on each side of the center of the single
+        stage filter, which sets the width of the passband.  (default=10)
+    max_stages : int, optional
+        Largest number of stages.  (default=3)
+
+    Returns
+    -------
+    plan : MultistagePlan
+
+    Examples
+    --------
+    >>> plan = plan_multistage(1, 160)
+    >>> [(f.uprate, f.downrate) for f in plan.stages]
+    [(1, 20), (1, 4), (1, 2)]
+    >>> round(plan.savings, 1)
+    4.7
+
+    """
+    g = gcd(uprate, downrate)
+    uprate, downrate = uprate // g, downrate // g
+    if uprate == downrate:
+        return MultistagePlan((), 0., 0., 0.)
+    # the single stage filter, and its passband in cycles per input sample
+    half_len = half_width * max(uprate, downrate)
+    num_taps = 2*half_len + 1 + downrate - half_len % downrate
+    single_stage_macs = _stage_macs(uprate, downrate, num_taps)
+    passband = (min(1., float(uprate) / downrate) - 
+                uprate * kaiser_transition(2*half_len + 1, beta)) / 2
+
+    def stage(up, down, rate):
+        """band edges of a stage with input rate "rate" (relative to the 
+        input), in cycles per stage input sample, or None if it would 
+        lose the passband"""
+        stopband = min(rate, rate * up / down) - passband
+        if stopband <= passband:
+            return None
+        return passband / rate, stopband / rate
+
+    best = {}
+    def search(up, down, stages_left):
+        """cheapest cascade (MACs per input sample of the whole cascade,
+        and (up, down, passband, stopband) of the stages) for the rates
+        left after the stages so far"""
+        if up == down:
+            return 0., []
+        key = (up, down, stages_left)
+        if key not in best:
+            rate = float(uprate * down) / (downrate * up)
+            options = []
+            for a in _divisors(up):
+                for b in _divisors(down):
+                    if a == b or (stages_left == 1 and (a, b) != (up, down)):
+                        continue
+                    edges = stage(a, b, rate)
+                    if edges is None:
+                        continue
+                    rest = search(up // a, down // b, stages_left - 1)
+                    if rest is None:
+                        continue
+                    taps = 2*_stage_half_len(a, edges[0], edges[1], beta) + 1
+                    macs = rate * _stage_macs(a, b, taps) + rest[0]
+                    options.append((macs, [(a, b) + edges] + rest[1]))
+            best[key] = min(options) if options else None
+        return best[key]
+
+    stages = [design_stage_filter(a, b, fp, fs, beta) 
+              for a, b, fp, fs in search(uprate, downrate, max_stages)[1]]
+    macs = 0.
+    delay = 0.
+    rate = 1.
+    for f in stages:
+        macs += rate * _stage_macs(f.uprate, f.downrate, len(f.coefs))
+        rate *= float(f.uprate) / f.downrate
+        delay = delay * f.uprate / f.downrate + f.delay
+    return MultistagePlan(tuple(stages), macs, single_stage_macs, delay)
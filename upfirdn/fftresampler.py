@@ -0,0 +1,264 @@
+# Copyright (c) 2009, Motorola, Inc
+# 
+# All Rights Reserved.
+# 
+# Redistribution and use in source and binary forms, with or without 
+# modification, are permitted provided that the following conditions are
+# met:
+# 
+# * Redistributions of source code must retain the above copyright notice,
+# this list of conditions and the following disclaimer.
+# 
+# * Redistributions in binary form must reproduce the above copyright 
+# notice, this list of conditions and the following disclaimer in the 
+# documentation and/or other materials provided with the distribution.
+# 
+# * Neither the name of Motorola nor the names of its contributors may be 
+# used to endorse or promote products derived from this software without 
+# specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS 
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR 
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR 
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF 
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING 
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS 
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Overlap-save FFT implementation of the polyphase resampler.
+
+The direct form in Resampler.h costs coefsPerPhase multiplies per output
+sample.  For filters with thousands of taps it is faster to convolve each
+polyphase component of the filter with the input by FFT, and pick out the
+outputs from the phase each one needs.  FFTResamplerBank keeps the same
+state (the last coefsPerPhase-1 inputs, and the "time" _t and _xOffset)
+and exposes the same interface as the C++ ResamplerBank, so that chunked
+calls to apply give the same output as a single call.
+"""
+
+import numpy as np
+
+def next_pow2(n):
+    """Return the smallest power of 2 that is >= n."""
+    return 1 << int(np.ceil(np.log2(max(n, 1))))
+
+def fft_size(coefs_per_phase):
+    """FFT length used by FFTResamplerBank for a given number of 
+    coefficients per phase; each FFT yields about 3/4 of its length of
+    new outputs."""
+    return max(256, next_pow2(4 * coefs_per_phase))
+
+def polyphase_coefs(coefs, uprate):
+    """
+    Split FIR filter coefficients into their polyphase components.
+
+    Parameters
+    ----------
+    coefs : array-like
+        Filter coefficients, along the last dimension.
+    uprate : int
+        Upsampling rate, i.e. number of phases.
+
+    Returns
+    -------
+    phases : ndarray
+        Array of shape coefs.shape[:-1] + (uprate, coefs_per_phase), with
+        phases[..., i, j] = coefs[..., j*uprate + i], zero-padded.  This is
+        the layout of Resampler's _transposedCoefs, without the flip.
+
+    """
+    coefs = np.atleast_1d(coefs)
+    coefs_per_phase = (coefs.shape[-1] + uprate - 1) // uprate
+    padded = np.zeros(coefs.shape[:-1] + (coefs_per_phase*uprate,), 
+                      coefs.dtype)
+    padded[..., :coefs.shape[-1]] = coefs
+    padded.shape = coefs.shape[:-1] + (coefs_per_phase, uprate)
+    return np.swapaxes(padded, -1, -2).copy()
+
+def saturate(values, dtype):
+    """Round values to the nearest integer, clipped to the range of integer
+    type dtype, as the C++ Resampler does for an integer output."""
+    info = np.iinfo(dtype)
+    return np.clip(np.floor(values + 0.5), info.min, info.max)
+
+def _rows(a):
+    """Return a (channels x samples) view of array a, with the channels 
+    along all but its last dimension, or None if that needs a copy."""
+    rows = a.view()
+    try:
+        rows.shape = (int(np.prod(a.shape[:-1])), a.shape[-1])
+    except AttributeError:
+        return None
+    return rows
+
+class FFTResamplerBank(object):
+    """
+    A bank of overlap-save FFT resamplers, one per channel, with the 
+    interface of the C++ ResamplerBank.
+    """
+    def __init__(self, upRate, downRate, coefs, filterIndex=None, 
+                 input_type=np.float64, output_type=np.float64):
+        """
+        Parameters
+        ----------
+        upRate : int
+            Upsampling rate.
+        downRate : int
+            Downsampling rate.
+        coefs : array-like
+            (filterCount x coefCount) array of coefficients, one row per 
+            distinct filter.
+        filterIndex : array-like, optional
+            Row of coefs used by each channel.  By default there is one
+            channel per row.
+        input_type, output_type : dtype, optional
+            Types of the input and output signals.  (default=float64)
+
+        """
+        coefs = np.atleast_2d(coefs)
+        if filterIndex is None:
+            filterIndex = np.arange(coefs.shape[0])
+        filterIndex = np.asarray(filterIndex)
+        if coefs.shape[0] < 1 or filterIndex.shape[0] < 1:
+            raise ValueError("Bank must have at least one channel")
+        if filterIndex.min() < 0 or filterIndex.max() >= coefs.shape[0]:
+            raise ValueError("Filter index out of range")
+        self._upRate = upRate
+        self._downRate = downRate
+        self._bankSize = filterIndex.shape[0]
+        self.input_type = np.dtype(input_type)
+        self.output_type = np.dtype(output_type)
+        # each filter is only transformed once; with a single filter, its
+        # spectra broadcast against all the channels
+        if coefs.shape[0] == 1:
+            self._filterIndex = None
+        else:
+            self._filterIndex = filterIndex
+        self._phases = polyphase_coefs(coefs, upRate)
+        self._coefsPerPhase = self._phases.shape[-1]
+        self._nfft = fft_size(self._coefsPerPhase)
+        self._real = not (np.iscomplexobj(self._phases) or \
+                          self.input_type.kind == 'c')
+        if self._real:
+            self._fft, self._ifft = np.fft.rfft, np.fft.irfft
+        else:
+            self._fft, self._ifft = np.fft.fft, np.fft.ifft
+        # spectra of the phases, shape (filterCount, upRate, nfft)
+        self._spectra = self._fft(self._phases, self._nfft)
+        self._state = np.zeros((self._bankSize, self._coefsPerPhase - 1),
+                               self.input_type)
+        self._t = 0
+        self._xOffset = 0
+
+    def coefsPerPhase(self):
+        return self._coefsPerPhase
+
+    def bankSize(self):
+        return self._bankSize
+
+    def filterCount(self):
+        return self._spectra.shape[0]
+
+    def setPhase(self, t, xOffset):
+        """set the phase and input index of the next output, as the C++
+        ResamplerBank.setPhase"""
+        if t < 0 or t >= self._upRate or xOffset < 0:
+            raise ValueError("Phase out of range")
+        self._t = t
+        self._xOffset = xOffset
+
+    def neededOutCount(self, inCount):
+        """compute how many outputs will be generated for inCount inputs"""
+        np_ = (inCount - self._xOffset) * self._upRate - self._t
+        return max(0, -(-np_ // self._downRate))
+
+    def apply(self, x, y, firstChannel):
+        """
+        Filter channels firstChannel, ..., firstChannel + bankSize() - 1 of 
+        array x into the leading samples of the same channels of array y.
+        The channels are along all but the last dimension, in C order.
+        Returns the number of output samples computed for each channel.
+        """
+        channels = slice(firstChannel, firstChannel + self._bankSize)
+        x = np.asarray(x, self.input_type)
+        x = x.reshape((int(np.prod(x.shape[:-1])), x.shape[-1]))
+        return self._filter(x[channels], y, firstChannel)
+
+    def flush(self, y, firstChannel):
+        """
+        End the stream of channels firstChannel, ..., firstChannel + 
+        bankSize() - 1: filter coefsPerPhase() - 1 zeros into the leading
+        samples of the same channels of array y, as the C++ 
+        ResamplerBank.flush.  Returns the number of output samples computed
+        for each channel.
+        """
+        z = np.zeros((self._bankSize, self._coefsPerPhase - 1), 
+                     self.input_type)
+        return self._filter(z, y, firstChannel)
+
+    def _filter(self, x, y, firstChannel):
+        """filter the (bankSize() x samples) array x into y"""
+        channels = slice(firstChannel, firstChannel + self._bankSize)
+        rows = _rows(y)
+        if rows is None:
+            # filter into a temporary, and copy it to y at the end
+            y_channels = list(np.ndindex(*y.shape[:-1]))[channels]
+            rows = np.empty((self._bankSize, y.shape[-1]), y.dtype)
+        else:
+            y_channels = None
+            rows = rows[channels]
+        if (firstChannel < 0 or x.shape[0] != self._bankSize or 
+            rows.shape[0] != self._bankSize):
+            raise ValueError("Number of channels does not match bank size")
+        in_count = x.shape[-1]
+        out_count = self.neededOutCount(in_count)
+        if rows.shape[-1] < out_count:
+            raise ValueError("Not enough output samples")
+
+        # upsampled time of each output, relative to the start of x
+        u = self._t + self._upRate * self._xOffset + \
+            self._downRate * np.arange(out_count)
+        # each output is the dot product of phase u % upRate with the
+        # inputs ending at u // upRate, i.e. at this index of the state
+        # followed by x:
+        end = u // self._upRate + self._coefsPerPhase - 1
+        phase = u % self._upRate
+
+        xe = np.concatenate((self._state, x), axis=-1)
+        history = self._coefsPerPhase - 1
+        block = self._nfft - history
+        for start in range(history, xe.shape[-1], block):
+            # outputs whose inputs end within [start, start + block)
+            lo, hi = np.searchsorted(end, [start, start + block])
+            if lo == hi:
+                continue
+            X = self._fft(xe[:, start - history:start + block], self._nfft)
+            # group the outputs by phase, one inverse FFT per phase
+            order = lo + np.argsort(phase[lo:hi], kind='mergesort')
+            splits = np.flatnonzero(np.diff(phase[order])) + 1
+            for m in np.split(order, splits):
+                if self._filterIndex is None:
+                    H = self._spectra[:, phase[m[0]], :]
+                else:
+                    H = self._spectra[self._filterIndex, phase[m[0]], :]
+                Y = self._ifft(X * H, self._nfft)
+                # the circular convolution is valid from index "history" on
+                values = Y[:, end[m] - start + history]
+                if self.output_type.kind == 'i':
+                    values = saturate(values, self.output_type)
+                rows[:, m] = values
+
+        self._state = xe[:, xe.shape[-1] - history:].copy()
+        u_next = self._t + self._upRate * self._xOffset + \
+                 self._downRate * out_count
+        self._xOffset = u_next // self._upRate - in_count
+        self._t = u_next % self._upRate
+        if y_channels is not None:
+            for idx, row in zip(y_channels, rows):
+                y[idx][:out_count] = row[:out_count]
+        return out_count
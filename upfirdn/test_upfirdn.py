@@ -33,7 +33,10 @@ import numpy as np
 import upfirdn
 
 from nose.tools import assert_raises
+import os
+import shutil
 import sys
+import tempfile
 import time
 
 random_state = np.random.RandomState(17)
@@ -210,6 +213,721 @@ class UpfirdnNdCase(object):
             #print idx, np.mean(abs(yi - y_expected)**2)
             assert np.allclose(yi, y_expected, 1e-10)
 
+class ResamplerBankCase(object):
+    """
+    Test that a ResamplerBank fed in chunks matches the one-shot slow 
+    resample of every channel.
+    """
+    def __init__(self, p, q):
+        self.p = p
+        self.q = q
+        
+    def __str__(self):
+        return 'ResamplerBankCase (%d, %d)'%(self.p, self.q)
+
+    def __call__(self):
+        print self
+        channels = random_state.randint(1, 50)
+        h = random_array((channels, random_state.randint(1, 30)))
+        x = random_array((channels, random_state.randint(100, 500)))
+        bank = upfirdn.ResamplerBank(x, h, self.p, self.q)
+        y = []
+        in_ptr = 0
+        while in_ptr < x.shape[-1]:
+            step = random_state.randint(1, 100)
+            y.append(bank.apply(x[:, in_ptr:in_ptr+step]))
+            in_ptr += step
+        y = np.concatenate(y, axis=-1)
+        for xi, hi, yi in zip(x, h, y):
+            yr = resample(xi, hi, self.p, self.q)[:len(yi)]
+            assert np.allclose(yi, yr, 1e-10)
+
+        # streaming chunks, then the tail, is the same as a one-shot call
+        bank = upfirdn.ResamplerBank(x, h, self.p, self.q)
+        chunks = np.array_split(x, random_state.randint(1, 10), axis=-1)
+        y_stream = np.concatenate(list(bank.stream(chunks)), axis=-1)
+        assert np.allclose(y_stream, upfirdn.upfirdn(x, h, self.p, self.q), 
+                           1e-10)
+
+        # output into a preallocated buffer
+        bank = upfirdn.ResamplerBank(x, h, self.p, self.q)
+        count = bank.needed_out_count(x.shape[-1])
+        assert count <= bank.max_out_count(x.shape[-1])
+        out = np.zeros((channels, bank.max_out_count(x.shape[-1]) + 1), 
+                       bank.output_type)
+        y_out = bank.apply(x, out=out)
+        assert y_out.shape == (channels, count)
+        assert np.may_share_memory(y_out, out)
+        assert np.all(out[:, count:] == 0)
+        assert np.allclose(y_out, y[:, :count], 1e-10)
+        short = np.zeros((channels, bank.needed_out_count(x.shape[-1]) - 1), 
+                         bank.output_type)
+        assert_raises(ValueError, bank.apply, x, out=short)
+        assert_raises(ValueError, bank.apply, x, 
+                      out=out.astype(np.complex64))
+
+        # spreading the channels over threads gives identical results
+        y_threaded = upfirdn.upfirdn(x, h, self.p, self.q, n_workers=4)
+        assert np.all(y_threaded == upfirdn.upfirdn(x, h, self.p, self.q))
+
+class SinglePrecisionCase(object):
+    """
+    Test that float32 and complex64 signals are filtered in single precision,
+    giving the double precision result to within single precision accuracy.
+    """
+    def __init__(self, p, q):
+        self.p = p
+        self.q = q
+        
+    def __str__(self):
+        return 'SinglePrecisionCase (%d, %d)'%(self.p, self.q)
+
+    def __call__(self):
+        print self
+        h = random_array((random_state.randint(1, 50),))
+        x = random_array((3, random_state.randint(100, 500)))
+        x32 = x.astype(np.complex64 if np.iscomplexobj(x) else np.float32)
+        y32 = upfirdn.upfirdn(x32, h, self.p, self.q)
+        y = upfirdn.upfirdn(x32.astype(x.dtype), h, self.p, self.q)
+        if np.iscomplexobj(x) or np.iscomplexobj(h):
+            assert y32.dtype == np.complex64
+        else:
+            assert y32.dtype == np.float32
+        nmse = np.sum(abs(y32 - y)**2) / np.sum(abs(y)**2)
+        assert nmse < 1e-10
+
+class FFTCase(object):
+    """
+    Test that the overlap-save FFT form of ResamplerBank, fed in chunks,
+    matches the direct form.
+    """
+    def __init__(self, p, q, coef_count):
+        self.p = p
+        self.q = q
+        self.coef_count = coef_count
+        
+    def __str__(self):
+        return 'FFTCase (%d, %d, %d)'%(self.p, self.q, self.coef_count)
+
+    def __call__(self):
+        print self
+        h = random_array((random_state.randint(1, 3), self.coef_count))
+        x = random_array((random_state.randint(1, 3), 1, 
+                          random_state.randint(1000, 5000)))
+        y = upfirdn.upfirdn(x, h, self.p, self.q, method='direct')
+        bank = upfirdn.ResamplerBank(x, h, self.p, self.q, method='fft')
+        y_fft = []
+        in_ptr = 0
+        while in_ptr < x.shape[-1]:
+            step = random_state.randint(1, 2000)
+            y_fft.append(bank.apply(x[..., in_ptr:in_ptr+step], 
+                                    all_samples=in_ptr+step >= x.shape[-1]))
+            in_ptr += step
+        y_fft = np.concatenate(y_fft, axis=-1)
+        assert y_fft.shape == y.shape
+        nmse = np.sum(abs(y_fft - y)**2) / np.sum(abs(y)**2)
+        assert nmse < 1e-20
+
+def test_strided():
+    """
+    Test that transposed, sliced and broadcast inputs and outputs give the
+    same result as contiguous ones, for both methods.
+    """
+    h = random_state.randn(3, 4, 20)
+    x = random_state.randn(300, 6, 4)[::2, ::2]
+    xt = x.transpose(1, 2, 0)
+    y = upfirdn.upfirdn(np.ascontiguousarray(xt), h, 3, 2)
+    for method in ('direct', 'fft'):
+        # signals along the last dimension of a sliced array
+        yt = upfirdn.upfirdn(xt, h, 3, 2, method=method)
+        assert np.allclose(yt, y, 1e-10)
+        # signals along the first and middle dimensions
+        y0 = upfirdn.upfirdn(x, h, 3, 2, xdim=0, method=method)
+        assert np.allclose(np.rollaxis(y0, 0, 3), y, 1e-10)
+        y1 = upfirdn.upfirdn(x.transpose(1, 0, 2), h, 3, 2, xdim=1, 
+                             method=method)
+        assert np.allclose(np.rollaxis(y1, 1, 3), y, 1e-10)
+        # output into every other sample of a larger buffer
+        bank = upfirdn.ResamplerBank(xt, h, 3, 2, method=method)
+        count = bank.needed_out_count(xt.shape[-1])
+        buf = np.zeros((3, 4, 2*count), bank.output_type)
+        ys = bank.apply(xt, out=buf[..., ::2])
+        assert np.may_share_memory(ys, buf)
+        assert np.all(buf[..., 1::2] == 0)
+        assert np.allclose(ys, y[..., :count], 1e-10)
+        # output into a buffer whose channels cannot be flattened
+        bank = upfirdn.ResamplerBank(xt, h, 3, 2, method=method)
+        buf = np.zeros((4, 3, count), bank.output_type)
+        ys = bank.apply(xt, out=buf.transpose(1, 0, 2))
+        assert np.allclose(buf.transpose(1, 0, 2), y[..., :count], 1e-10)
+    # one signal broadcast against all the filters
+    yb = upfirdn.upfirdn(x[:, 0, 0], h, 3, 2, xdim=0, all_samples=False)
+    yb = np.rollaxis(yb, 0, 3)
+    for hi, ybi in zip(h.reshape(-1, 20), yb.reshape(-1, yb.shape[-1])):
+        assert np.allclose(ybi, resample(x[:, 0, 0], hi, 3, 2)[:len(ybi)], 
+                           1e-10)
+
+def test_integer():
+    """
+    Test that int16 and int32 signals are filtered in single and double 
+    precision, and that integer output is rounded and saturated.
+    """
+    h = random_state.randn(30)
+    hc = h + 1j * random_state.randn(30)
+    for int_type, float_type, tol in ((np.int16, np.float32, 1e-4),
+                                      (np.int32, np.float64, 1e-10)):
+        x = random_state.randint(-1000, 1000, (3, 200)).astype(int_type)
+        xf = x.astype(np.float64)
+        for method in ('direct', 'fft'):
+            y = upfirdn.upfirdn(x, h, 3, 2, method=method)
+            assert y.dtype == float_type
+            yr = upfirdn.upfirdn(xf, h, 3, 2)
+            assert np.allclose(y, yr, tol, tol * abs(yr).max())
+            yc = upfirdn.upfirdn(x, hc, 3, 2, method=method)
+            assert yc.dtype == np.result_type(float_type, np.complex64)
+            yi = upfirdn.upfirdn(x, h, 3, 2, method=method, 
+                                 integer_output=True, scale=0.5)
+            assert yi.dtype == int_type
+            assert np.all(abs(yi - np.floor(0.5 * yr + 0.5)) <= 1)
+            info = np.iinfo(int_type)
+            yi = upfirdn.upfirdn(x, h, 3, 2, method=method, 
+                                 integer_output=True, scale=info.max)
+            big = abs(yr) > 2
+            assert np.all(yi[big] == np.where(yr[big] > 0, info.max, 
+                                              info.min))
+    assert_raises(ValueError, upfirdn.upfirdn, xf, h, integer_output=True)
+    assert_raises(ValueError, upfirdn.upfirdn, x, hc, integer_output=True)
+    bank = upfirdn.ResamplerBank(x.astype(np.int16), h)
+    assert_raises(ValueError, bank.apply, x.astype(np.int32))
+
+def test_upfirdn_file():
+    """
+    Test that filtering a file in chunks gives the same result as filtering
+    the whole signal in memory.
+    """
+    tmp = tempfile.mkdtemp()
+    try:
+        h = random_state.randn(3, 25)
+        x = random_state.randn(1000, 3)
+        y = upfirdn.upfirdn(x, h, 3, 2, xdim=0)
+        np.save(os.path.join(tmp, 'x.npy'), x)
+        for chunk_size in (1, 7, 1000, 5000):
+            yf = upfirdn.upfirdn_file(os.path.join(tmp, 'x.npy'), 
+                                      os.path.join(tmp, 'y.npy'), h, 3, 2, 
+                                      xdim=0, chunk_size=chunk_size)
+            assert isinstance(yf, np.memmap)
+            del yf
+            assert np.allclose(np.load(os.path.join(tmp, 'y.npy')), y, 1e-10)
+
+        # raw interleaved int16 PCM, into an array
+        x16 = (x * 1000).astype(np.int16)
+        x16.tofile(os.path.join(tmp, 'x.pcm'))
+        y16 = upfirdn.upfirdn(x16, h, 3, 2, xdim=0, all_samples=False,
+                              integer_output=True)
+        yf = np.zeros_like(y16)
+        upfirdn.upfirdn_file(os.path.join(tmp, 'x.pcm'), yf, h, 3, 2, 
+                             xdim=0, all_samples=False, chunk_size=99, 
+                             dtype=np.int16, shape=(-1, 3), 
+                             integer_output=True)
+        assert np.all(abs(yf - y16) <= 1)
+        upfirdn.upfirdn_file(os.path.join(tmp, 'x.pcm'), 
+                             os.path.join(tmp, 'y.pcm'), h[0], 3, 2, 
+                             dtype=np.int16)
+        yf = np.fromfile(os.path.join(tmp, 'y.pcm'), np.float32)
+        assert np.allclose(yf, upfirdn.upfirdn(x16.ravel(), h[0], 3, 2), 
+                           1e-4, 1e-2)
+        assert_raises(ValueError, upfirdn.upfirdn_file, 
+                      os.path.join(tmp, 'x.pcm'), yf[:-1], h[0], 3, 2, 
+                      dtype=np.int16)
+
+        # signals along a middle dimension
+        x3 = random_state.randn(2, 50, 3)
+        yf = upfirdn.upfirdn_file(x3, os.path.join(tmp, 'y.npy'), h, 3, 2, 
+                                  xdim=1, hdim=1, chunk_size=16)
+        assert np.allclose(yf, upfirdn.upfirdn(x3, h, 3, 2, xdim=1, hdim=1),
+                           1e-10)
+        del yf
+
+        # an empty file gives an empty output
+        np.save(os.path.join(tmp, 'x.npy'), x[:0])
+        yf = upfirdn.upfirdn_file(os.path.join(tmp, 'x.npy'), 
+                                  os.path.join(tmp, 'y.npy'), h, 3, 2, 
+                                  xdim=0)
+        assert yf.shape == (0, 3)
+        del yf
+        open(os.path.join(tmp, 'x.pcm'), 'wb').close()
+        yf = upfirdn.upfirdn_file(os.path.join(tmp, 'x.pcm'), 
+                                  os.path.join(tmp, 'y.pcm'), h[0], 3, 2, 
+                                  dtype=np.int16)
+        assert yf.shape == (0,)
+    finally:
+        shutil.rmtree(tmp)
+
+def test_shared_filters():
+    """
+    Test that channels broadcast against the same filter share one copy of
+    it, and give the same result as separate filters.
+    """
+    h = random_state.randn(3, 1, 25)
+    x = random_state.randn(3, 4, 200)
+    y = upfirdn.upfirdn(x, np.repeat(h, 4, axis=1), 3, 2)
+    for method in ('direct', 'fft'):
+        bank = upfirdn.ResamplerBank(x, h, 3, 2, method=method, n_workers=2)
+        assert [b.filterCount() for b in bank.banks] == [2, 2]
+        assert [b.bankSize() for b in bank.banks] == [6, 6]
+        assert np.allclose(bank.apply(x, all_samples=True), y, 1e-10)
+    bank = upfirdn.ResamplerBank(x, h[0, 0], 3, 2, method='direct')
+    assert bank.banks[0].filterCount() == 1
+    # repeated filters are found, and stored once too
+    bank = upfirdn.ResamplerBank(x, np.tile(h, (1, 4, 1)), 3, 2)
+    assert bank.filter_count == 3
+    assert np.allclose(bank.apply(x, all_samples=True), y, 1e-10)
+    rows = random_state.randn(5, 7) + 1j
+    unique, index = upfirdn.unique_rows(rows[[3, 1, 3, 0, 1]])
+    assert unique.shape == (3, 7)
+    assert np.all(unique[index] == rows[[3, 1, 3, 0, 1]])
+    index = np.array([0, 2], np.intc)
+    assert_raises(ValueError, upfirdn.ResamplerBankRR, 3, 2, h[:2, 0], index)
+
+def test_symmetric():
+    """
+    Test that symmetric and antisymmetric (linear phase) filters give the
+    same result as the reference, in chunks and along any dimension.
+    """
+    for n, p, q in [(63, 1, 3), (64, 1, 1), (61, 2, 3), (91, 3, 2)]:
+        h = random_state.randn(n) + 1j * random_state.randn(n)
+        for hs in (h + h[::-1], h - h[::-1]):
+            x = random_state.randn(2, 500) + 1j * random_state.randn(2, 500)
+            for xi in (x, x.real):
+                yr = np.array([resample(xr, hs, p, q) for xr in xi])
+                y = upfirdn.upfirdn(xi, hs, p, q, method='direct')
+                assert np.allclose(y, yr[:, :y.shape[-1]], 1e-10)
+                y = upfirdn.upfirdn(xi.T, hs, p, q, xdim=0, method='direct')
+                assert np.allclose(y.T, yr[:, :y.shape[0]], 1e-10)
+                bank = upfirdn.ResamplerBank(xi, hs, p, q, method='direct')
+                y = np.concatenate([bank.apply(c) for c in 
+                                    np.array_split(xi, 9, axis=-1)], axis=-1)
+                assert np.allclose(y, yr[:, :y.shape[-1]], 1e-10)
+
+def test_flush():
+    """
+    Test that flush gives the outputs of coefs_per_phase - 1 zeros, and 
+    that apply carries on after them, natively and in the ResamplerBank.
+    """
+    for p, q, n in [(1, 1, 10), (3, 2, 31), (2, 7, 40), (5, 3, 1)]:
+        h = random_state.randn(n)
+        x = random_state.randn(50)
+        z = np.zeros((n + p - 1) // p - 1)
+        for klass, t in [(upfirdn.ResamplerRR, np.float64),
+                         (upfirdn.ResamplerII, np.int32)]:
+            xt = (x * 1000).astype(t)
+            r1, r2 = klass(p, q, h), klass(p, q, h)
+            y1 = np.zeros(r1.neededOutCount(len(x)), t)
+            y2 = np.zeros(r2.neededOutCount(len(x)), t)
+            r1.apply(xt, y1)
+            r2.apply(xt, y2)
+            f1 = np.zeros(r1.neededOutCount(len(z)), t)
+            f2 = np.zeros(r2.neededOutCount(len(z)), t)
+            assert r1.flush(f1) == len(f1)
+            r2.apply(z.astype(t), f2)
+            assert np.array_equal(f1, f2)
+            y1 = np.zeros(r1.neededOutCount(len(x)), t)
+            y2 = np.zeros(r2.neededOutCount(len(x)), t)
+            r1.apply(xt, y1)
+            r2.apply(xt, y2)
+            assert np.array_equal(y1, y2)
+        for method in ('direct', 'fft'):
+            b1 = upfirdn.ResamplerBank(x, h, p, q, method=method)
+            b2 = upfirdn.ResamplerBank(x, h, p, q, method=method)
+            b1.apply(x)
+            b2.apply(x)
+            assert np.allclose(b1.flush(), b2.apply(z), 1e-10)
+            assert np.allclose(b1.apply(x, all_samples=True), 
+                               np.concatenate((b2.apply(x), b2.apply(z))),
+                               1e-10)
+
+def test_upfirdn_range():
+    for p, q, n in [(1, 1, 10), (3, 2, 31), (2, 7, 40), (5, 3, 1), (1, 4, 9)]:
+        h = random_state.randn(n)
+        x = random_state.randn(60, 2)
+        for method in ('direct', 'fft'):
+            y = upfirdn.upfirdn(x, h, p, q, xdim=0, method=method)
+            for start, stop in [(0, None), (0, 1), (5, 17), (20, 21), 
+                                (-7, None), (-3, -1), (len(y) - 1, None),
+                                (9, 9), (12, 5), (0, len(y) + 5)]:
+                yr = upfirdn.upfirdn_range(x, h, p, q, start, stop, xdim=0,
+                                           method=method)
+                assert np.allclose(yr, y[start:stop], 1e-10)
+    # a window far into a long int16 signal, with saturated output
+    x = (10000 * random_state.randn(100000)).astype(np.int16)
+    h = random_state.randn(30)
+    y = upfirdn.upfirdn(x, h, 3, 2, integer_output=True)
+    yr = upfirdn.upfirdn_range(x, h, 3, 2, 123456, 123500, 
+                               integer_output=True)
+    assert yr.dtype == np.int16 and np.array_equal(yr, y[123456:123500])
+    bank = upfirdn.ResamplerBank(x, h, 3, 2)
+    assert_raises(ValueError, bank.set_phase, 3, 0)
+    assert_raises(ValueError, bank.set_phase, 0, -1)
+
+def test_segments():
+    """
+    Test that one long signal split into time segments over several 
+    workers gives the same output as filtered in one pass.
+    """
+    x = random_state.randn(300000)
+    for p, q, n in [(1, 1, 10), (3, 2, 31), (2, 7, 40), (5, 3, 1), 
+                    (1, 4, 3000)]:
+        h = random_state.randn(n)
+        for all_samples in (True, False):
+            for method in ('direct', 'fft'):
+                y = upfirdn.upfirdn(x, h, p, q, all_samples=all_samples,
+                                    method=method)
+                ys = upfirdn.upfirdn(x, h, p, q, all_samples=all_samples,
+                                     method=method, n_workers=4)
+                if method == 'direct':
+                    assert np.array_equal(ys, y)
+                else:
+                    assert np.allclose(ys, y, 1e-10)
+    # along another dimension, into out, with an integer output
+    xi = (1000 * x[:, np.newaxis]).astype(np.int16)
+    y = upfirdn.upfirdn(xi, h[:30], 3, 2, xdim=0, integer_output=True)
+    out = np.zeros((len(y) + 5, 1), np.int16)
+    ys = upfirdn.upfirdn(xi, h[:30], 3, 2, xdim=0, integer_output=True,
+                         out=out, n_workers=3)
+    assert np.array_equal(ys, y) and np.array_equal(out[:len(y)], y)
+    assert_raises(ValueError, upfirdn.upfirdn, xi, h[:30], 3, 2, xdim=0, 
+                  integer_output=True, out=out[:-10], n_workers=3)
+
+def test_processes():
+    """
+    Test that the process backend, with its output in shared memory, gives
+    the same result as the threads.
+    """
+    h = random_state.randn(3, 1, 25)
+    x = random_state.randn(3, 4, 200)
+    for method in ('direct', 'fft'):
+        y = upfirdn.upfirdn(x, h, 3, 2, method=method)
+        for n_workers in (1, 5):
+            for all_samples in (True, False):
+                ys = upfirdn.upfirdn(x, h, 3, 2, method=method, 
+                                     n_workers=n_workers, backend='processes',
+                                     all_samples=all_samples)
+                assert np.allclose(ys, y[..., :ys.shape[-1]], 1e-10)
+            assert ys.shape[-1] == upfirdn.ResamplerBank(
+                x, h, 3, 2).needed_out_count(x.shape[-1])
+        ys = upfirdn.upfirdn(x.T, h.T, 3, 2, xdim=0, hdim=0, method=method,
+                             n_workers=2, backend='processes')
+        assert np.allclose(ys, y.T, 1e-10)
+    # a window, and time segments of one long signal
+    y = upfirdn.upfirdn(x, h, 3, 2)
+    bank = upfirdn.ResamplerBank(x, h, 3, 2, n_workers=2, 
+                                 backend='processes')
+    bank.set_phase(1, 20)
+    ys = bank.apply(x[..., 27:100])
+    assert np.allclose(ys, y[..., 71:71 + ys.shape[-1]], 1e-10)
+    assert_raises(ValueError, bank.apply, x)
+    assert_raises(ValueError, bank.flush)
+    x = random_state.randn(200000)
+    y = upfirdn.upfirdn(x, h[0, 0], 3, 2)
+    ys = upfirdn.upfirdn(x, h[0, 0], 3, 2, n_workers=3, backend='processes')
+    assert np.array_equal(ys, y)
+    assert_raises(ValueError, upfirdn.upfirdn, x, h[0, 0], 3, 2, n_workers=3,
+                  backend='processes', out=np.zeros(len(y)))
+    assert_raises(ValueError, upfirdn.upfirdn, x, h[0, 0], 3, 2, 
+                  backend='fork')
+
+def test_large_counts():
+    """Test that sample counts over 2**31 do not overflow."""
+    if np.dtype(np.intp).itemsize < 8:
+        return
+    n = 3 * 2**31 + 1
+    r = upfirdn.ResamplerRR(3, 2, np.ones(10))
+    assert r.neededOutCount(n) == -(-n * 3 // 2)
+    for method in ('direct', 'fft'):
+        bank = upfirdn.ResamplerBank(np.zeros(1), np.ones(10), 3, 2, 
+                                     method=method)
+        assert bank.needed_out_count(n) == bank.max_out_count(n)
+    # filter the last samples of a (zero-copy, broadcast) signal of n 
+    # samples, starting over 2**31 samples in, as a short signal
+    h = random_state.randn(10)
+    x = np.lib.stride_tricks.as_strided(np.ones(1), (n,), (0,))
+    bank = upfirdn.ResamplerBank(x[:1], h, 3, 2, method='direct')
+    bank.set_phase(1, n - 17)
+    short = upfirdn.ResamplerBank(x[:1], h, 3, 2, method='direct')
+    short.set_phase(1, 3)
+    y = bank.apply(x)
+    assert y.shape == (25,)
+    assert np.array_equal(y, short.apply(np.ones(20)))
+    assert np.array_equal(bank.flush(), short.flush())
+
+def test_choose_method():
+    assert upfirdn.choose_method(32, 1, 1) == 'direct'
+    assert upfirdn.choose_method(4096, 1, 1) == 'fft'
+    assert upfirdn.choose_method(4096, 1, 64) == 'direct'
+    assert_raises(ValueError, upfirdn.upfirdn, [1.], [1.], method='fast')
+
+def test_resample():
+    upfirdn.filter_cache.clear()
+    t = np.arange(1000)
+    for p, q in [(3, 2), (2, 3), (147, 160), (6, 4)]:
+        x = np.sin(2*np.pi*.01*t)
+        y = upfirdn.resample(x, p, q)
+        assert len(y) == int(np.ceil(len(x) * float(p) / q))
+        # the delay is removed, and a low frequency tone passes unchanged
+        ty = np.arange(len(y)) * float(q) / p
+        inner = (ty > 100) & (ty < 900)
+        assert np.max(abs(y[inner] - np.sin(2*np.pi*.01*ty[inner]))) < 1e-2
+    # 6/4 reduces to the same filter as 3/2
+    info = upfirdn.filter_cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 3, 3)
+    y = upfirdn.resample(np.ones((4, 100)), 3, 2, xdim=0)
+    assert y.shape == (6, 100)
+
+def test_cached_phases():
+    """
+    Test that a cached design keeps the polyphase table the direct form 
+    stores, so that a cache hit neither rebuilds it nor transposes the taps
+    again, and that a bank made from it filters as one made from the taps.
+    """
+    upfirdn.filter_cache.clear()
+    polyphase_coefs = upfirdn.design.polyphase_coefs
+    calls = []
+    made = []
+    ResamplerBank = upfirdn.ResamplerBank
+    def count(*args):
+        calls.append(args)
+        return polyphase_coefs(*args)
+    def record(*args, **kwargs):
+        made.append(kwargs.get('phases'))
+        return ResamplerBank(*args, **kwargs)
+    upfirdn.design.polyphase_coefs = count
+    upfirdn.ResamplerBank = record
+    try:
+        x = np.random.RandomState(6).randn(500)
+        y = upfirdn.resample(x, 3, 2, method='direct')
+        assert np.array_equal(upfirdn.resample(x, 3, 2, method='direct'), y)
+    finally:
+        upfirdn.design.polyphase_coefs = polyphase_coefs
+        upfirdn.ResamplerBank = ResamplerBank
+    f = upfirdn.design_resample_filter(3, 2)
+    assert len(calls) == 1
+    assert made[0] is f.phases and made[1] is f.phases
+    assert np.array_equal(f.phases, 
+                          upfirdn.polyphase_coefs(f.coefs, 3)[:, ::-1])
+    for xi in (x, x.astype(np.float32), (1000 * x).astype(np.int16)):
+        yr = upfirdn.upfirdn(xi, f.coefs, 3, 2, method='direct')
+        bank = upfirdn.ResamplerBank(xi, f.coefs, 3, 2, method='direct', 
+                                     phases=f.phases, scale=2.)
+        assert np.allclose(bank.apply(xi, all_samples=True), 2*yr, 1e-6)
+    assert_raises(ValueError, upfirdn.ResamplerBank, x, f.coefs, 2, 3, 
+                  method='direct', phases=f.phases)
+
+def test_multistage():
+    plan = upfirdn.plan_multistage(1, 160)
+    assert len(plan.stages) > 1 and plan.savings > 2
+    assert np.prod([f.downrate for f in plan.stages]) == 160
+    # one stage is the single stage design
+    plan = upfirdn.plan_multistage(1, 160, max_stages=1)
+    assert plan.savings == 1
+    assert np.array_equal(plan.stages[0].coefs, 
+                          upfirdn.design_resample_filter(1, 160).coefs)
+    for p, q, n, f in [(1, 160, 16000, .001), (160, 1, 200, .05), 
+                       (147, 160, 4000, .01)]:
+        x = np.sin(2*np.pi*f*np.arange(n))
+        r = upfirdn.MultistageResampler(x, p, q)
+        y = r.apply(x, all_samples=True)
+        # a low frequency tone passes unchanged, after the delay
+        ty = (np.arange(len(y)) - r.plan.delay) * float(q) / p
+        inner = (ty > .1*n) & (ty < .9*n)
+        assert np.max(abs(y[inner] - np.sin(2*np.pi*f*ty[inner]))) < 1e-2
+        # and in chunks, as a stream
+        r = upfirdn.MultistageResampler(np.zeros((2, 1)), p, q)
+        chunks = np.array_split(np.array([x, x]), 7, axis=-1)
+        yc = np.concatenate(list(r.stream(chunks)), axis=-1)
+        assert np.allclose(yc, y)
+
+def test_channelizer():
+    for M, n in [(8, 100), (5, 23), (1, 7), (16, 3)]:
+        h = random_state.randn(n)
+        x = random_state.randn(3, 301) + 1j * random_state.randn(3, 301)
+        for xt, ht in [(x, h), (x.real, h), (x, h + 1j*h[::-1]),
+                       (x.astype(np.complex64), h)]:
+            c = upfirdn.Channelizer(xt.T, M, ht, xdim=0)
+            y = np.concatenate([c.apply(chunk) for chunk in 
+                                np.array_split(xt.T, 6)], axis=1)
+            assert y.shape[:2] == (M, -(-301 // M))
+            assert y.dtype == np.complex64 or y.dtype == np.complex128
+            # each channel is the signal modulated down, then resampled
+            m = np.arange(x.shape[-1])
+            for k in range(M):
+                r = upfirdn.upfirdn(xt * np.exp(-2j*np.pi*k*m/M), ht, 1, M, 
+                                    all_samples=False)
+                assert np.allclose(y[k], r.T, 1e-4 if upfirdn.is_single(xt) else 
+                                   1e-10)
+    c = upfirdn.Channelizer(np.zeros(10), 4)
+    assert_raises(ValueError, c.apply, np.zeros((2, 10)))
+
+def test_arbitrary():
+    f = .05
+    x = np.sin(2*np.pi*f*np.arange(10000))
+    for ratio in [47999.3/48000, .37, 2.71]:
+        r = upfirdn.ArbitraryResampler(x, ratio)
+        y = r.apply(x, all_samples=True)
+        # a low frequency tone passes unchanged, after the delay
+        ty = np.arange(len(y)) / ratio - r.delay
+        inner = (ty > 100) & (ty < len(x) - 100)
+        assert np.max(abs(y[inner] - np.sin(2*np.pi*f*ty[inner]))) < 5e-3
+        # and in chunks, as a stream
+        r = upfirdn.ArbitraryResampler(x, ratio)
+        yc = np.concatenate(list(r.stream(np.array_split(x, 13))))
+        assert np.allclose(yc, y)
+    # flush gives the outputs of zeros fed in after the signal, and the 
+    # count of outputs with all_samples follows apply then flush exactly
+    r = upfirdn.ArbitraryResampler(x, .37)
+    y = r.apply(x)
+    z = np.zeros(r.coefs_per_phase - 1)
+    yz = upfirdn.ArbitraryResampler(x, .37).apply(np.concatenate((x, z)))
+    assert np.allclose(np.concatenate((y, r.flush())), yz, 1e-12, 1e-12)
+    for n in range(1, 40):
+        r = upfirdn.ArbitraryResampler(x, 1.1)
+        count = r.needed_out_count(n, all_samples=True)
+        assert len(r.apply(x[:n], all_samples=True)) == count
+    # the ratio can drift between calls, without a glitch
+    r = upfirdn.ArbitraryResampler(x, 1.)
+    times = []
+    t = 0.
+    for chunk, ratio in zip(np.array_split(x, 5), [1., 1.01, .99, .98, 1.]):
+        r.set_ratio(ratio)
+        y = r.apply(chunk)
+        times.append(t + np.arange(len(y)) / ratio)
+        t = times[-1][-1] + 1 / ratio
+        if len(times) == 1:
+            ys = y
+        else:
+            ys = np.concatenate((ys, y))
+    ty = np.concatenate(times) - r.delay
+    inner = (ty > 100) & (ty < len(x) - 100)
+    assert np.max(abs(ys[inner] - np.sin(2*np.pi*f*ty[inner]))) < 5e-3
+    # multichannel, complex and single precision signals
+    xc = np.exp(2j*np.pi*f*np.arange(2000)).astype(np.complex64)
+    xc = np.array([xc, 2*xc]).T
+    r = upfirdn.ArbitraryResampler(xc, 1.5, xdim=0)
+    y = r.apply(xc, all_samples=True)
+    assert y.dtype == np.complex64 and y.shape[1] == 2
+    assert np.allclose(y[:, 1], 2*y[:, 0], 1e-5)
+    assert_raises(ValueError, r.set_ratio, 0.)
+    assert_raises(ValueError, r.apply, x)
+    # integer (PCM) signals are read as they are
+    for dtype, output_type in [(np.int16, np.float32), 
+                               (np.int32, np.float64)]:
+        xi = (x[:2000] * 1000).astype(dtype)
+        r = upfirdn.ArbitraryResampler(xi, 1.5)
+        y = r.apply(xi, all_samples=True)
+        assert y.dtype == output_type
+        yf = upfirdn.ArbitraryResampler(x, 1.5).apply(xi.astype(np.float64),
+                                                      all_samples=True)
+        assert np.allclose(y, yf, 1e-4, 1e-2)
+        assert_raises(ValueError, r.apply, x)
+
+def test_filter_cache():
+    cache = upfirdn.design.FilterCache(maxsize=2)
+    for key in [1, 2, 1, 3, 2]:
+        cache.get(key, lambda: key)
+    # 2 was evicted by 3, as 1 was used more recently
+    assert cache.info() == (1, 4, 2, 2)
+
+def test_fused():
+    """
+    Test that a FusedResamplerBank, which filters one signal broadcast 
+    against many filters, gives the same result as each filter alone.
+    """
+    for p, q, n in [(1, 1, 10), (3, 2, 31), (2, 7, 40), (5, 3, 1)]:
+        h = random_state.randn(45, n)
+        x = random_state.randn(300)
+        for xi, hi, integer_output in [(x, h, False), (x, h + 1j*h, False),
+                                       (x + 1j*x, h, False),
+                                       ((x * 1000).astype(np.int16), h, True),
+                                       ((x * 1000).astype(np.int32), h, True)]:
+            yr = np.array([upfirdn.upfirdn(xi, hr, p, q, 
+                                           integer_output=integer_output)
+                           for hr in hi])
+            bank = upfirdn.ResamplerBank(xi, hi, p, q, method='direct', 
+                                         n_workers=2, 
+                                         integer_output=integer_output)
+            assert bank.fused
+            y = np.concatenate([bank.apply(c) for c in 
+                                np.array_split(xi, 7)] + [bank.flush()], 
+                               axis=-1)
+            # int16 is summed in single precision, in another order
+            atol = 1 if integer_output else 1e-8
+            assert y.dtype == yr.dtype
+            assert np.allclose(y, yr, 1e-10, atol)
+            y = upfirdn.upfirdn_range(xi, hi, p, q, 17, 40, 
+                                      integer_output=integer_output)
+            assert np.allclose(y, yr[:, 17:40], 1e-10, atol)
+            # flush after fewer inputs than the state holds
+            bank = upfirdn.ResamplerBank(xi, hi, p, q, method='direct', 
+                                         integer_output=integer_output)
+            y = np.concatenate((bank.apply(xi[:3]), bank.flush()), axis=-1)
+            yr = np.array([upfirdn.upfirdn(xi[:3], hr, p, q, 
+                                           integer_output=integer_output)
+                           for hr in hi])
+            assert np.allclose(y, yr, 1e-10, atol)
+        assert_raises(ValueError, bank.apply, np.zeros((2, 10), np.int32))
+    # too few channels for each worker are filtered separately
+    bank = upfirdn.ResamplerBank(x, h[:4], 3, 2, n_workers=2)
+    assert not bank.fused
+
+def test_down_converter():
+    """
+    Test that DownConverter gives the same result as mixing the signal 
+    down and then resampling it, with the mixer's phase carried over 
+    between chunks.
+    """
+    for p, q, n, f in [(1, 4, 40, .1), (1, 1, 10, -.3), (3, 2, 31, .45),
+                       (2, 7, 40, 1./3), (5, 3, 1, .2)]:
+        h = random_state.randn(n)
+        x = random_state.randn(3, 500)
+        mixer = np.exp(-2j * np.pi * f * np.arange(x.shape[-1]))
+        for xi, hi in [(x, h), (x, h + 1j*h), (x + 1j*x[::-1], h)]:
+            yr = upfirdn.upfirdn(xi * mixer, hi, p, q)
+            dc = upfirdn.DownConverter(xi.T, hi, f, p, q, xdim=0)
+            assert dc.frequency == f
+            y = np.concatenate([dc.apply(c) for c in 
+                                np.array_split(xi.T, 9)] + [dc.flush()])
+            assert y.dtype == np.complex128
+            assert np.allclose(y.T, yr, 1e-10)
+            dc = upfirdn.DownConverter(xi, hi, f, p, q)
+            assert np.allclose(dc.apply(xi, all_samples=True), yr, 1e-10)
+        # int16 and float32 signals are converted in single precision
+        for xi in ((1000 * x).astype(np.int16), x.astype(np.float32)):
+            yr = upfirdn.upfirdn(xi * mixer, h, p, q)
+            dc = upfirdn.DownConverter(xi, h, f, p, q)
+            y = dc.apply(xi, all_samples=True)
+            assert y.dtype == np.complex64
+            assert np.allclose(y, yr, 1e-4, 1e-3 * np.abs(yr).max())
+    assert_raises(ValueError, upfirdn.DownConverter, x, [h, h], .1)
+    assert_raises(ValueError, dc.apply, x[0])
+    # wider integers would wrap, so are rejected
+    dc = upfirdn.DownConverter(np.zeros(4, np.int16), h, .1)
+    assert_raises(ValueError, dc.apply, np.array([70000, 1, 2, 3], np.int64))
+
+def test_bench_compare():
+    """Test that compare finds the benchmark cases that got slower."""
+    from upfirdn import bench_upfirdn
+    baseline = [{'bench': 'rates', 'params': {'up': 3, 'down': 2}, 
+                 'seconds': 1.}, 
+                {'bench': 'rates', 'params': {'up': 2, 'down': 3}, 
+                 'seconds': 1.}]
+    current = [{'bench': 'rates', 'params': {'down': 2, 'up': 3}, 
+                'seconds': 1.5},
+               {'bench': 'rates', 'params': {'up': 2, 'down': 3}, 
+                'seconds': 1.1},
+               {'bench': 'xdim', 'params': {'xdim': 0}, 'seconds': 9.}]
+    slower = bench_upfirdn.compare(baseline, current)
+    assert slower == [('rates', {'up': 3, 'down': 2}, 1., 1.5)]
+    assert bench_upfirdn.compare(baseline, current, 2.) == []
+
 def random_coefs(max_n):
     """Returns random length vector of normal random variables,
     with a 50/50 chance of complex."""
@@ -246,6 +964,28 @@ def test():
         q = random_state.randint(10)+1
         yield UpfirdnNdCase(p, q),
 
+    # long filters, where the inner product is vectorized
+    for i in range(5):
+        p = random_state.randint(4)+1
+        q = random_state.randint(4)+1
+        coefs = random_state.randn(random_state.randint(256, 1025))
+        yield ResamplerCase(p, q, coefs),
+
+    for i in range(10):
+        p = random_state.randint(10)+1
+        q = random_state.randint(10)+1
+        yield ResamplerBankCase(p, q),
+
+    for i in range(10):
+        p = random_state.randint(10)+1
+        q = random_state.randint(10)+1
+        yield SinglePrecisionCase(p, q),
+
+    for i in range(10):
+        p = random_state.randint(10)+1
+        q = random_state.randint(10)+1
+        yield FFTCase(p, q, random_state.randint(1, 2000)),
+
 
 if __name__ == '__main__':
     # Execute the test suite